@@ -2,9 +2,16 @@ from contextlib import asynccontextmanager
 import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from BUDONG.api.routers.v1 import api
 from BUDONG.config import settings
-from BUDONG.api.core.database import check_and_create_tables
+from BUDONG.api.core.database import async_engine, check_and_create_tables, engine
+from BUDONG.api.core.spatial import detect_spatial_columns, ensure_spatial_columns
+from BUDONG.api.core.indexes import detect_query_columns, ensure_query_indexes
+from BUDONG.api.core.infra_index import build_infra_indexes
+from BUDONG.api.core.noise_index import sync_noise_index
+from BUDONG.api.core.region_stats import refresh_region_stats
+from BUDONG.api.core.review_stats import ensure_review_stats
 from BUDONG.api.exception.global_exception_handler import register_exception_handlers
 import logging
 from dotenv import load_dotenv
@@ -38,6 +45,51 @@ async def lifespan(app: FastAPI):
             else:
                 logger.error(f"❌ 데이터베이스 연결 실패: {e}")
                 logger.warning("⚠️ 데이터베이스 연결 없이 서버를 시작합니다.")
+
+    # geom 컬럼 / SPATIAL INDEX 마이그레이션 (설정 시)
+    if settings.SPATIAL_AUTO_MIGRATE:
+        try:
+            ensure_spatial_columns(engine)
+        except Exception as e:
+            logger.error(f"❌ 공간 컬럼 마이그레이션 실패: {e}")
+
+    # geom이 준비된 테이블만 SPATIAL INDEX로 검색 (나머지는 lat/lon 조건)
+    try:
+        detect_spatial_columns(engine)
+    except Exception as e:
+        logger.warning(f"⚠️ 공간 컬럼 확인 실패, lat/lon 조건으로 검색합니다: {e}")
+
+    # 조회용 보조 인덱스 마이그레이션 (설정 시)
+    if settings.INDEX_AUTO_MIGRATE:
+        try:
+            ensure_query_indexes(engine)
+        except Exception as e:
+            logger.error(f"❌ 인덱스 마이그레이션 실패: {e}")
+
+    # 생성 컬럼이 있을 때만 인덱스용 컬럼으로 정렬 (없으면 원본 컬럼)
+    try:
+        detect_query_columns(engine)
+    except Exception as e:
+        logger.warning(f"⚠️ 조회용 컬럼 확인 실패, 원본 컬럼으로 정렬합니다: {e}")
+
+    # 리뷰 집계 테이블 (없으면 생성 후 기존 리뷰로 채움 - 리뷰 작성/검색이 조회)
+    try:
+        ensure_review_stats(engine)
+    except Exception as e:
+        logger.error(f"❌ 리뷰 집계 테이블 준비 실패: {e}")
+
+    # 인프라/소음 공간 인덱스 생성 (실패 시 첫 요청에서 생성)
+    try:
+        build_infra_indexes()
+        sync_noise_index()
+    except Exception as e:
+        logger.warning(f"⚠️ 인프라 인덱스 생성 실패, 첫 요청 시 다시 시도합니다: {e}")
+
+    # 법정동 통계 스냅샷 생성 (실패 시 첫 요청에서 생성)
+    try:
+        refresh_region_stats()
+    except Exception as e:
+        logger.warning(f"⚠️ 법정동 통계 생성 실패, 첫 요청 시 다시 시도합니다: {e}")
     
     logger.info("=" * 50)
     
@@ -45,13 +97,15 @@ async def lifespan(app: FastAPI):
     
     # 종료 시 (필요시 정리 작업)
     logger.info("BUDONG API 서버 종료 중...")
+    await async_engine.dispose()
 
 
 app = FastAPI(
     title="BUDONG API",
     description="BUDONG Database Project API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정 (프론트엔드와 통신을 위해)
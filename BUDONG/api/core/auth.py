@@ -1,11 +1,16 @@
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from BUDONG.api.core.cache import principal_cache, principal_key
 from BUDONG.api.core.database import get_db
+from BUDONG.api.core.executor import auth_pool
 from BUDONG.api.models.models import TUser
 from BUDONG.config import settings
 from BUDONG.api.models.enums.user_role import UserRole
@@ -20,6 +25,39 @@ oauth2_scheme = OAuth2PasswordBearer(
 )
 
 
+@dataclass(frozen=True)
+class Principal:
+    """요청 처리에 필요한 인증 사용자 정보 (TUser 대신 의존성으로 주입)"""
+    user_id: int
+    email: Optional[str] = None
+    nickname: Optional[str] = None
+    created_at: Optional[datetime] = None
+    role: Optional[str] = None
+
+    @classmethod
+    def from_user(cls, user: TUser) -> "Principal":
+        # t_user에 role 컬럼이 없는 스키마도 있어 getattr 사용
+        return cls(
+            user_id=user.user_id,
+            email=user.email,
+            nickname=user.nickname,
+            created_at=user.created_at,
+            role=getattr(user, "role", None),
+        )
+
+    def to_json(self) -> dict:
+        data = asdict(self)
+        if self.created_at is not None:
+            data["created_at"] = self.created_at.isoformat()
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Principal":
+        if data.get("created_at"):
+            data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return cls(**data)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -65,21 +103,19 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
-async def authenticate_user(email: str, password: str, db: Session) -> Optional[TUser]:
-    """사용자 인증 (OAuth2 표준)"""
-    user = db.query(TUser).filter(TUser.email == email).first()
+async def authenticate_user(email: str, password: str, db: AsyncSession) -> Optional[TUser]:
+    """사용자 인증 (OAuth2 표준). bcrypt 검증은 블로킹이므로 auth_pool에서 실행한다."""
+    result = await db.execute(select(TUser).where(TUser.email == email))
+    user = result.scalar_one_or_none()
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await auth_pool.run(verify_password, password, user.password_hash):
         return None
     return user
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> TUser:
-    """현재 로그인한 사용자 가져오기 (OAuth2 표준)"""
+def _access_token_subject(token: str) -> int:
+    """액세스 토큰을 검증하고 sub(사용자 ID)를 반환"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="인증 정보를 확인할 수 없습니다.",
@@ -99,30 +135,70 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user_id: int = payload.get("sub")
-    if user_id is None:
+    try:
+        return int(payload["sub"])
+    except (KeyError, TypeError, ValueError):
         raise credentials_exception
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    현재 로그인한 사용자 가져오기 (OAuth2 표준, principal 캐시 사용)
+    캐시/DB 조회가 블로킹이므로 동기 함수로 두어 FastAPI 스레드풀에서 실행되게 한다.
+    """
+    user_id = _access_token_subject(token)
+
+    cached = principal_cache.get_json(principal_key(user_id))
+    if cached is not None:
+        return Principal.from_json(cached)
     
     user = db.query(TUser).filter(TUser.user_id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 정보를 확인할 수 없습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     
-    return user
+    principal = Principal.from_user(user)
+    principal_cache.set_json(principal_key(user_id), principal.to_json(), settings.PRINCIPAL_CACHE_TTL)
+    return principal
+
+
+async def get_current_claims(
+    token: str = Depends(oauth2_scheme)
+) -> Principal:
+    """
+    토큰 클레임만으로 사용자 확인 (DB/캐시 조회 없음).
+    사용자 정보가 필요 없는 읽기 전용 엔드포인트에서 사용한다.
+    """
+    return Principal(user_id=_access_token_subject(token))
 
 
 async def get_current_active_user(
-    current_user: TUser = Depends(get_current_user)
-) -> TUser:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """현재 활성 사용자 가져오기"""
     # 필요시 비활성 사용자 체크 로직 추가 가능
     return current_user
 
 
 async def get_current_admin_user(
-    current_user: TUser = Depends(get_current_user)
-) -> TUser:
-    """현재 관리자 사용자 가져오기"""
-    if current_user.role != UserRole.ADMIN.value:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
+    """
+    현재 관리자 사용자 가져오기.
+    t_user에 role 컬럼이 없으므로 ADMIN_USER_IDS에 등록된 회원을 관리자로 본다
+    (role 컬럼이 있는 스키마라면 admin 역할도 허용).
+    """
+    is_admin = (
+        current_user.user_id in settings.get_admin_user_ids()
+        or current_user.role == UserRole.ADMIN.value
+    )
+    if not is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="관리자 권한이 필요합니다."
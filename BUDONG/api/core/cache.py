@@ -0,0 +1,185 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from redis.exceptions import RedisError
+
+from BUDONG.api.core.redis import redis_client
+from BUDONG.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """TTL을 지원하는 스레드 안전 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_items: int = 1024):
+        self.max_items = max_items
+        self._data: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class TieredCache:
+    """
+    Redis 우선 캐시. Redis 연결에 실패하면 retry_seconds 동안
+    프로세스 내 LRU로 대체하고, 이후 다시 Redis를 시도한다.
+    """
+
+    def __init__(self, client, local: LRUCache, retry_seconds: int = 30):
+        self.client = client
+        self.local = local
+        self.retry_seconds = retry_seconds
+        self._redis_down_until = 0.0
+
+    def _redis_available(self) -> bool:
+        return self.client is not None and time.monotonic() >= self._redis_down_until
+
+    def _mark_redis_down(self, e: Exception) -> None:
+        if time.monotonic() >= self._redis_down_until:
+            logger.warning(f"Redis 사용 불가, 로컬 캐시로 대체합니다: {e}")
+        self._redis_down_until = time.monotonic() + self.retry_seconds
+
+    def get_many(self, keys: list[str]) -> list[Optional[str]]:
+        if self._redis_available():
+            try:
+                return self.client.mget(keys)
+            except RedisError as e:
+                self._mark_redis_down(e)
+        return [self.local.get(key) for key in keys]
+
+    def get(self, key: str) -> Optional[str]:
+        return self.get_many([key])[0]
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        if self._redis_available():
+            try:
+                self.client.set(key, value, ex=ttl)
+                return
+            except RedisError as e:
+                self._mark_redis_down(e)
+        self.local.set(key, value, ttl)
+
+    def set_many(self, items: dict[str, str], ttl: int) -> None:
+        """여러 키를 같은 TTL로 저장 (Redis는 파이프라인 한 번)"""
+        if not items:
+            return
+        if self._redis_available():
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipe.set(key, value, ex=ttl)
+                pipe.execute()
+                return
+            except RedisError as e:
+                self._mark_redis_down(e)
+        for key, value in items.items():
+            self.local.set(key, value, ttl)
+
+    def delete(self, *keys: str) -> None:
+        # 장애 중 로컬에 기록된 값이 남지 않도록 양쪽 모두 삭제
+        self.local.delete(*keys)
+        if self._redis_available():
+            try:
+                self.client.delete(*keys)
+            except RedisError as e:
+                self._mark_redis_down(e)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """prefix로 시작하는 모든 키 삭제 (대량 갱신 후 사용)"""
+        self.local.delete_prefix(prefix)
+        if self._redis_available():
+            try:
+                keys = list(self.client.scan_iter(match=f"{prefix}*", count=1000))
+                for start in range(0, len(keys), 1000):
+                    self.client.delete(*keys[start:start + 1000])
+            except RedisError as e:
+                self._mark_redis_down(e)
+
+    def get_json(self, key: str) -> Optional[Any]:
+        value = self.get(key)
+        return json.loads(value) if value is not None else None
+
+    def set_json(self, key: str, value: Any, ttl: int) -> None:
+        self.set(key, json.dumps(value, ensure_ascii=False, default=str), ttl)
+
+    def set_many_json(self, items: dict[str, Any], ttl: int) -> None:
+        self.set_many(
+            {key: json.dumps(value, ensure_ascii=False, default=str) for key, value in items.items()},
+            ttl,
+        )
+
+
+cache = TieredCache(redis_client, LRUCache(settings.LOCAL_CACHE_MAX_ITEMS))
+
+
+# -----------------------------------------------------------
+# 건물 상세 캐시 키
+# -----------------------------------------------------------
+
+# static: 건물/주변 인프라/범죄/소음/CCTV, dynamic: 리뷰 첫 페이지(+개수/평균)/실거래가
+DETAIL_SECTIONS = ("static", "review_page", "transactions")
+
+
+def building_detail_key(building_id: int, section: str) -> str:
+    return f"building_detail:{building_id}:{section}"
+
+
+def invalidate_building_detail(building_id: int, *sections: str) -> None:
+    """건물 상세 캐시 무효화 (섹션 미지정 시 전체)"""
+    sections = sections or DETAIL_SECTIONS
+    cache.delete(*(building_detail_key(building_id, s) for s in sections))
+
+
+# -----------------------------------------------------------
+# 인증 사용자(principal) 캐시
+# -----------------------------------------------------------
+
+principal_cache = TieredCache(
+    redis_client if settings.PRINCIPAL_CACHE_REDIS else None,
+    LRUCache(settings.LOCAL_CACHE_MAX_ITEMS),
+)
+
+
+def principal_key(user_id) -> str:
+    return f"principal:{user_id}"
+
+
+def invalidate_principal(user_id: int) -> None:
+    """비밀번호 변경/회원 탈퇴 시 호출"""
+    principal_cache.delete(principal_key(user_id))
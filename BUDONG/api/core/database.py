@@ -1,25 +1,48 @@
 from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from BUDONG.api.core.db_pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    engine_options,
+    instrument_engine,
+)
 from BUDONG.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 동기/비동기 엔진 공통 커넥션 풀 설정 (config.Settings의 DB_POOL_*)
+ENGINE_OPTIONS = engine_options()
+
 # 데이터베이스 엔진 생성
-engine = create_engine(
-    settings.get_database_url(),
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=False  # SQL 쿼리 로깅 (개발 시 True로 변경 가능)
-)
+engine = create_engine(settings.get_database_url(), poolclass=InstrumentedQueuePool, **ENGINE_OPTIONS)
+instrument_engine(engine)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (asyncmy) - async def 라우터에서 이벤트 루프를 막지 않고 조회
+async_engine = create_async_engine(
+    settings.get_async_database_url(), poolclass=InstrumentedAsyncQueuePool, **ENGINE_OPTIONS
+)
+instrument_engine(async_engine.sync_engine)
+
+# commit 후에도 응답 생성 시 속성 접근이 추가 조회를 일으키지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 # Base 클래스 (모든 모델이 상속받을 클래스)
 Base = declarative_base()
 
+# 서비스가 직접 채우는 파생 테이블 (원본 데이터와 별개로 시작 시 없으면 생성)
+# 비어 있어도 조회 측은 실시간 계산으로 동작하고, 채우는 작업은 각 모듈의 CLI로 실행한다
+DERIVED_TABLES = (
+    "t_building_neighbourhood",  # core/neighbourhood.py
+)
+
 
 # 의존성 주입을 위한 DB 세션 생성기
 def get_db():
@@ -30,6 +53,12 @@ def get_db():
         db.close()
 
 
+# 비동기 라우터용 DB 세션 생성기
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def check_database_connection():
     """데이터베이스 연결 확인"""
     try:
@@ -41,6 +70,17 @@ def check_database_connection():
         return False
 
 
+async def check_async_database_connection():
+    """비동기 엔진 데이터베이스 연결 확인"""
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        logger.error(f"비동기 데이터베이스 연결 실패: {e}")
+        return False
+
+
 def table_exists(table_name: str) -> bool:
     """특정 테이블이 존재하는지 확인"""
     try:
@@ -60,9 +100,21 @@ def check_and_create_tables():
         logger.error("데이터베이스에 연결할 수 없습니다.")
         return False
 
+    create_derived_tables()
     return True
 
 
+def create_derived_tables():
+    """DERIVED_TABLES 중 없는 테이블만 생성"""
+    from BUDONG.api.models.models import Base as ModelBase
+
+    tables = [ModelBase.metadata.tables[name] for name in DERIVED_TABLES]
+    try:
+        ModelBase.metadata.create_all(bind=engine, tables=tables, checkfirst=True)
+    except Exception as e:
+        logger.error(f"파생 테이블 생성 실패: {e}")
+
+
 # 데이터베이스 테이블 생성 함수 (개발용 - 모든 테이블 강제 생성)
 def create_tables():
     """모든 테이블 생성 (기존 테이블 무시)"""
@@ -0,0 +1,174 @@
+"""
+커넥션 풀 계측과 pre-ping 전략
+
+QueuePool을 감싸 체크아웃 대기 시간, 오버플로 커넥션 생성, 타임아웃,
+무효화 횟수를 기록한다. 통계는 관리자 API(/admin/pool_stats)에서 확인한다.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from BUDONG.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 체크아웃 대기 시간 히스토그램 상한 (ms)
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+PRE_PING_STRATEGIES = ("always", "none", "idle")
+
+
+class PoolStats:
+    """풀 하나의 누적 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.overflow_created = 0
+        self.invalidations = 0
+        self.pre_ping_failures = 0
+        self.max_wait_ms = 0.0
+        self._total_wait_ms = 0.0
+        self._buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_checkout(self, wait_ms: float, overflow: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+            if overflow:
+                self.overflow_created += 1
+            for i, limit in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= limit:
+                    self._buckets[i] += 1
+                    break
+            else:
+                self._buckets[-1] += 1
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"<={limit}ms" for limit in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "overflow_created": self.overflow_created,
+                "invalidations": self.invalidations,
+                "pre_ping_failures": self.pre_ping_failures,
+                "avg_wait_ms": round(self._total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "wait_histogram": dict(zip(labels, self._buckets)),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """QueuePool._do_get을 감싸 대기 시간/오버플로/타임아웃을 기록"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        overflow_before = self._overflow
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.incr("timeouts")
+            logger.warning(f"커넥션 풀 타임아웃: {self.status()}")
+            raise
+        wait_ms = (time.perf_counter() - start) * 1000
+        # _overflow는 -pool_size에서 시작해 새 커넥션마다 증가하므로 0보다 크면 오버플로 커넥션
+        self.stats.record_checkout(wait_ms, self._overflow > overflow_before and self._overflow > 0)
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options() -> dict:
+    """Settings 기반 create_engine / create_async_engine 공통 옵션"""
+    if settings.DB_POOL_PRE_PING not in PRE_PING_STRATEGIES:
+        raise ValueError(
+            f"DB_POOL_PRE_PING은 {PRE_PING_STRATEGIES} 중 하나여야 합니다: {settings.DB_POOL_PRE_PING}"
+        )
+    return dict(
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING == "always",
+        echo=False,  # SQL 쿼리 로깅 (개발 시 True로 변경 가능)
+    )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    무효화 횟수 기록과 idle pre-ping 전략을 엔진에 연결한다.
+    비동기 엔진은 async_engine.sync_engine을 넘긴다.
+    """
+    pool = engine.pool
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        pool.stats.incr("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        pool.stats.incr("invalidations")
+
+    if settings.DB_POOL_PRE_PING != "idle":
+        return
+
+    # 일정 시간 이상 쉬었던 커넥션만 체크아웃 시 SELECT 1로 확인
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at: Optional[float] = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < settings.DB_POOL_PRE_PING_IDLE_SECONDS:
+            return
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as e:
+            pool.stats.incr("pre_ping_failures")
+            # DisconnectionError를 던지면 풀이 커넥션을 버리고 새로 연결해 재시도한다
+            raise exc.DisconnectionError(f"idle 커넥션 확인 실패: {e}") from e
+
+
+def pool_status(engine: Engine) -> dict:
+    """현재 풀 상태와 누적 통계"""
+    pool = engine.pool
+    status = {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout(),
+    }
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        status.update(stats.snapshot())
+    return status
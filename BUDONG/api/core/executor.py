@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.replica import ReadSessionLocal
+from BUDONG.api.exception.global_exception_handler import APIError
+from BUDONG.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 전체 요청이 공유하는 조회 전용 스레드 풀 (동시 실행 상한)
+query_pool = ThreadPoolExecutor(
+    max_workers=settings.QUERY_FANOUT_MAX_WORKERS,
+    thread_name_prefix="query-fanout",
+)
+
+
+def _run_with_session(task: Callable[[Session], T]) -> T:
+    """작업마다 풀에서 별도의 읽기 커넥션(세션)을 사용"""
+    db = ReadSessionLocal()
+    try:
+        return task(db)
+    finally:
+        db.close()
+
+
+def fan_out(
+    tasks: dict[str, Callable[[Session], T]],
+    db: Optional[Session] = None,
+) -> dict[str, T]:
+    """
+    서로 독립적인 조회 작업들을 병렬로 실행하고 {이름: 결과}를 반환한다.
+    병렬 실행이 꺼져 있으면 전달받은 세션으로 순서대로 실행한다.
+    """
+    if not settings.QUERY_FANOUT_ENABLED or len(tasks) <= 1:
+        if db is None:
+            return {name: _run_with_session(task) for name, task in tasks.items()}
+        return {name: task(db) for name, task in tasks.items()}
+
+    futures = {
+        name: query_pool.submit(_run_with_session, task)
+        for name, task in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+class BoundedPool:
+    """
+    이벤트 루프를 막는 동기 작업(bcrypt 해싱, 동기 DB 세션)을 실행하는 스레드 풀.
+    동시 실행은 max_workers로, 대기열은 max_queue로 제한하며
+    대기열이 가득 차면 503을 반환해 요청이 무한히 쌓이지 않게 한다.
+    """
+
+    SLOW_WAIT_SECONDS = 1.0
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+
+    def _job(self, submitted_at: float, fn: Callable[..., T], args: tuple) -> T:
+        started_at = time.monotonic()
+        wait = started_at - submitted_at
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        if wait > self.SLOW_WAIT_SECONDS:
+            logger.warning(f"{self.name} 풀 대기 {wait:.2f}s (대기열 {self._queued})")
+
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._total_run += time.monotonic() - started_at
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """fn(*args)를 풀에서 실행하고 결과를 기다린다"""
+        with self._lock:
+            if self._queued >= self.max_queue:
+                self._rejected += 1
+                raise APIError(
+                    code="SERVER_BUSY",
+                    message="요청이 많아 잠시 후 다시 시도해주세요.",
+                    status_code=503,
+                )
+            self._queued += 1
+
+        future = self._executor.submit(self._job, time.monotonic(), fn, args)
+        # 클라이언트 연결 종료로 실행 전에 취소되면 대기열 수만 되돌린다
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            started = self._completed + self._active
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queued": self._queued,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._total_wait / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+                "avg_run_ms": round(self._total_run / self._completed * 1000, 2) if self._completed else 0.0,
+            }
+
+
+# 로그인/회원가입/비밀번호 변경 전용 (bcrypt + 동기 DB 작업)
+auth_pool = BoundedPool(
+    "auth-worker",
+    max_workers=settings.AUTH_POOL_MAX_WORKERS,
+    max_queue=settings.AUTH_POOL_MAX_QUEUE,
+)
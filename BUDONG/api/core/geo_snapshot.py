@@ -0,0 +1,176 @@
+"""
+정적 지리 참조 데이터의 컬럼형 스냅샷
+
+학교/공원/역/CCTV/소음/자치구 범죄 테이블은 일괄 적재 때만 바뀌므로
+한 번 파일로 내보내 두고, 각 워커는 파일을 mmap 해서 사용한다 (util.columnar).
+GEO_SNAPSHOT_PATH가 설정되어 있으면 인프라/소음/타일 인덱스와 자치구 범죄 지표를
+MySQL 대신 스냅샷에서 읽는다. 데이터를 다시 적재했다면 스냅샷도 다시 내보내야 한다.
+
+    - 인프라/소음 인덱스: snapshot_index()로 mmap 좌표 배열을 그대로 사용
+      (워커마다 생기는 것은 행 번호 배열뿐, 항목은 결과 행만 만든다)
+    - 타일 레이어: 줌별 클러스터를 워커마다 계산하므로 snapshot_rows()로 행을 복사해 사용
+    - 상세/지점 검색의 반경 조회는 SPATIAL INDEX를 쓰는 SQL이라 스냅샷과 무관하게 MySQL에서 조회
+
+    python -m BUDONG.api.core.geo_snapshot [파일 경로]   # 기본값 GEO_SNAPSHOT_PATH
+"""
+
+import logging
+import os
+import sys
+import threading
+from datetime import datetime
+from typing import Any, Callable, NamedTuple, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.replica import ReadSessionLocal
+from BUDONG.api.models.models import (
+    TSchool,
+    TPark,
+    TStation,
+    TCCTVInfo,
+    TNoise,
+    TCrimeCCTV,
+)
+from BUDONG.config import settings
+from BUDONG.util.columnar import ColumnarFile, write_columnar
+from BUDONG.util.geoindex import ArrayGridIndex
+
+logger = logging.getLogger(__name__)
+
+
+class CrimeStats(NamedTuple):
+    """fetch_crime 조회 결과와 같은 속성 이름"""
+    crime_num: Optional[int]
+    dangerous_rating: Optional[int]
+    CCTV_security_rating: Optional[int]
+
+
+# 테이블 → (모델, {컬럼: 타입})
+SNAPSHOT_TABLES = {
+    "t_school": (TSchool, {
+        "school_id": "i8", "school_name": "str", "address": "str", "lat": "f8", "lon": "f8",
+    }),
+    "t_park": (TPark, {
+        "park_name": "str", "address": "str", "lat": "f8", "lon": "f8",
+    }),
+    "t_station": (TStation, {
+        "station_id": "i8", "station_name": "str", "line": "i8", "lat": "f8", "lon": "f8",
+    }),
+    "t_cctv_info": (TCCTVInfo, {
+        "id": "i8", "cnt": "i8", "lat": "f8", "lon": "f8",
+    }),
+    "t_noise": (TNoise, {
+        "address": "str", "noise_max": "i8", "noise_avg": "i8", "noise_min": "i8", "lat": "f8", "lon": "f8",
+    }),
+    "t_crime_CCTV": (TCrimeCCTV, {
+        "jcg_name": "str", "crime_num": "i8", "cctv_num": "i8",
+        "dangerous_rating": "i8", "CCTV_security_rating": "i8",
+    }),
+}
+
+_snapshot: Optional[ColumnarFile] = None
+_snapshot_checked = False
+_crime: Optional[dict[str, CrimeStats]] = None
+_lock = threading.Lock()
+
+
+def export_snapshot(path: Optional[str] = None, db: Optional[Session] = None) -> str:
+    """참조 테이블을 컬럼형 파일로 내보내고 경로를 반환"""
+    path = path or settings.GEO_SNAPSHOT_PATH
+    if not path:
+        raise ValueError("스냅샷 경로가 없습니다 (GEO_SNAPSHOT_PATH).")
+
+    own_session = db is None
+    if own_session:
+        db = ReadSessionLocal()
+    try:
+        tables = {}
+        for table, (model, columns) in SNAPSHOT_TABLES.items():
+            rows = db.execute(select(*(getattr(model, name) for name in columns))).all()
+            tables[table] = {
+                name: (col_type, [row[i] for row in rows])
+                for i, (name, col_type) in enumerate(columns.items())
+            }
+            logger.info(f"스냅샷 {table}: {len(rows)}건")
+    finally:
+        if own_session:
+            db.close()
+
+    write_columnar(path, tables, meta={"created_at": datetime.now().isoformat()})
+    logger.info(f"스냅샷 저장 완료: {path} ({os.path.getsize(path)} bytes)")
+    return path
+
+
+def get_snapshot() -> Optional[ColumnarFile]:
+    """GEO_SNAPSHOT_PATH의 스냅샷 (설정이 없거나 파일이 없으면 None → DB 사용)"""
+    global _snapshot, _snapshot_checked
+
+    if _snapshot_checked:
+        return _snapshot
+
+    with _lock:
+        if not _snapshot_checked:
+            path = settings.GEO_SNAPSHOT_PATH
+            if path and os.path.exists(path):
+                _snapshot = ColumnarFile(path)
+                logger.info(f"지리 스냅샷 로딩: {path} (생성 {_snapshot.meta.get('created_at')})")
+            elif path:
+                logger.warning(f"지리 스냅샷 파일이 없어 DB를 사용합니다: {path}")
+            _snapshot_checked = True
+    return _snapshot
+
+
+def snapshot_rows(table: str, *columns: Optional[str]) -> Optional[list[tuple]]:
+    """
+    스냅샷 테이블의 행 튜플 목록 (스냅샷이 없으면 None).
+    컬럼 자리에 None을 주면 해당 위치는 None으로 채운다.
+    """
+    snapshot = get_snapshot()
+    if snapshot is None or table not in snapshot:
+        return None
+
+    t = snapshot.table(table)
+    values = [t.values(name) if name else [None] * t.rows for name in columns]
+    return list(zip(*values))
+
+
+def snapshot_index(
+    table: str, factory: Callable[..., Any], *columns: Optional[str]
+) -> Optional[ArrayGridIndex]:
+    """
+    스냅샷 테이블의 lat/lon 컬럼을 복사 없이 쓰는 공간 인덱스 (스냅샷이 없으면 None).
+    결과에 포함된 행만 factory(*columns 값)로 항목을 만든다 (None 컬럼은 None).
+    """
+    snapshot = get_snapshot()
+    if snapshot is None or table not in snapshot:
+        return None
+
+    t = snapshot.table(table)
+    getters = [t.accessor(name) if name else (lambda i: None) for name in columns]
+    return ArrayGridIndex(
+        t.column("lat"), t.column("lon"), lambda i: factory(*(get(i) for get in getters))
+    )
+
+
+def crime_lookup() -> Optional[dict[str, CrimeStats]]:
+    """
+    스냅샷의 자치구별 범죄/CCTV 지표 {jcg_name: CrimeStats}.
+    스냅샷이 없으면 None을 반환하므로 호출 측에서 DB로 조회한다.
+    """
+    global _crime
+
+    if _crime is None:
+        rows = snapshot_rows(
+            "t_crime_CCTV", "jcg_name", "crime_num", "dangerous_rating", "CCTV_security_rating"
+        )
+        if rows is None:
+            return None
+        _crime = {name: CrimeStats(*rest) for name, *rest in rows}
+    return _crime
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    export_snapshot(sys.argv[1] if len(sys.argv) > 1 else None)
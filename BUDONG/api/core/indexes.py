@@ -0,0 +1,116 @@
+"""
+조회용 보조 인덱스 마이그레이션
+
+create_all은 이미 존재하는 테이블에 컬럼/인덱스를 추가하지 않으므로,
+QUERY_COLUMNS(인덱스용 생성 컬럼)와 QUERY_INDEXES에 등록된 것 중 없는 것만 만든다.
+생성 컬럼이 아직 없는 DB에서는 transaction_order()가 원본 컬럼으로 정렬한다.
+
+STORED 생성 컬럼 추가는 테이블 전체를 다시 쓰므로(복제 지연 포함) 서버 시작과 분리해
+배포 단계에서 한 번 실행한다 (INDEX_AUTO_MIGRATE를 켜면 시작 시 실행).
+
+    python -m BUDONG.api.core.indexes
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn
+
+from BUDONG.api.models.models import TBuildingReview, TRealTransactionPrice
+
+logger = logging.getLogger(__name__)
+
+# (모델, 컬럼 이름) - 인덱스보다 먼저 추가
+QUERY_COLUMNS = (
+    (TRealTransactionPrice, "transaction_day"),
+)
+
+# (모델, 인덱스 이름)
+QUERY_INDEXES = (
+    (TRealTransactionPrice, "idx_building_tx_day"),
+    (TBuildingReview, "idx_building_created"),
+)
+
+# 더 이상 쓰지 않는 인덱스 (TEXT prefix 인덱스 → idx_building_tx_day로 대체)
+OBSOLETE_INDEXES = (
+    (TRealTransactionPrice, "idx_building_tx_date"),
+)
+
+# 존재가 확인된 QUERY_COLUMNS ("테이블.컬럼", None: 아직 확인 전)
+_ready_columns: Optional[set[str]] = None
+
+
+def ensure_query_indexes(engine: Engine) -> None:
+    """없는 생성 컬럼/인덱스만 만들고 대체된 인덱스는 삭제 (여러 번 실행해도 안전)"""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    for model, column_name in QUERY_COLUMNS:
+        table = model.__tablename__
+        if table not in existing_tables:
+            continue
+        if column_name in {c["name"] for c in inspector.get_columns(table)}:
+            continue
+
+        column = CreateColumn(model.__table__.c[column_name]).compile(dialect=engine.dialect)
+        logger.info(f"{table}: 컬럼 {column_name} 추가")
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column}"))
+
+    for model, index_name in QUERY_INDEXES:
+        table = model.__tablename__
+        if table not in existing_tables:
+            continue
+        if index_name in {i["name"] for i in inspector.get_indexes(table)}:
+            continue
+
+        index = next(i for i in model.__table__.indexes if i.name == index_name)
+        logger.info(f"{table}: INDEX {index_name} 생성")
+        index.create(bind=engine)
+
+    for model, index_name in OBSOLETE_INDEXES:
+        table = model.__tablename__
+        if table in existing_tables and index_name in {i["name"] for i in inspector.get_indexes(table)}:
+            logger.info(f"{table}: INDEX {index_name} 삭제")
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP INDEX {index_name} ON {table}"))
+
+
+def detect_query_columns(engine: Engine) -> set[str]:
+    """QUERY_COLUMNS 중 실제로 존재하는 컬럼을 확인해 정렬 키에 반영"""
+    global _ready_columns
+
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    ready = set()
+    for model, column_name in QUERY_COLUMNS:
+        table = model.__tablename__
+        if table in existing_tables and column_name in {c["name"] for c in inspector.get_columns(table)}:
+            ready.add(f"{table}.{column_name}")
+
+    _ready_columns = ready
+    return ready
+
+
+def has_query_column(model, column_name: str) -> bool:
+    return _ready_columns is not None and f"{model.__tablename__}.{column_name}" in _ready_columns
+
+
+def transaction_day():
+    """거래일 정렬 컬럼 (생성 컬럼이 없으면 TEXT 원본 컬럼)"""
+    t = TRealTransactionPrice
+    return t.transaction_day if has_query_column(t, "transaction_day") else t.transaction_date
+
+
+def transaction_order() -> tuple:
+    """건물별 최근 거래 정렬 키 (거래일 내림차순, tx_id 내림차순)"""
+    return transaction_day().desc(), TRealTransactionPrice.tx_id.desc()
+
+
+if __name__ == "__main__":
+    from BUDONG.api.core.database import engine
+
+    logging.basicConfig(level=logging.INFO)
+    ensure_query_indexes(engine)
@@ -0,0 +1,99 @@
+import logging
+import threading
+from functools import partial
+from typing import NamedTuple, Optional, Union
+
+from sqlalchemy import null, select
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.geo_snapshot import snapshot_index
+from BUDONG.api.core.replica import ReadSessionLocal
+from BUDONG.api.models.models import TSchool, TPark, TStation
+from BUDONG.util.geoindex import ArrayGridIndex, GridIndex
+
+logger = logging.getLogger(__name__)
+
+
+class InfraPoint(NamedTuple):
+    """인덱스에 저장되는 인프라 항목 (ORM 객체 대신 가벼운 튜플)"""
+    infra_id: str
+    infra_category: str
+    name: Optional[str]
+    address: Optional[str]
+    latitude: float
+    longitude: float
+
+
+# 카테고리별 조회 컬럼: (id, name, address, lat, lon)
+INFRA_SOURCES = {
+    "school": (TSchool.school_id, TSchool.school_name, TSchool.address, TSchool.lat, TSchool.lon),
+    "park": (TPark.park_name, TPark.park_name, TPark.address, TPark.lat, TPark.lon),
+    "subway_station": (TStation.station_id, TStation.station_name, null(), TStation.lat, TStation.lon),
+}
+
+# 스냅샷 사용 시 카테고리별 (테이블, id, name, address, lat, lon)
+INFRA_SNAPSHOT_SOURCES = {
+    "school": ("t_school", "school_id", "school_name", "address", "lat", "lon"),
+    "park": ("t_park", "park_name", "park_name", "address", "lat", "lon"),
+    "subway_station": ("t_station", "station_id", "station_name", None, "lat", "lon"),
+}
+
+
+def _infra_point(category: str, infra_id, name, address, lat, lon) -> InfraPoint:
+    return InfraPoint(str(infra_id), category, name, address, lat, lon)
+
+
+_indexes: dict[str, Union[GridIndex, ArrayGridIndex]] = {}
+_lock = threading.Lock()
+
+
+def _load_index(db: Session, category: str) -> Union[GridIndex, ArrayGridIndex]:
+    # 스냅샷이 있으면 mmap 좌표 배열을 그대로 인덱싱 (결과 행만 InfraPoint로 변환)
+    table, *columns = INFRA_SNAPSHOT_SOURCES[category]
+    index = snapshot_index(table, partial(_infra_point, category), *columns)
+    if index is not None:
+        return index
+
+    rows = db.execute(select(*INFRA_SOURCES[category])).all()
+    points = [
+        (lat, lon, _infra_point(category, infra_id, name, address, lat, lon))
+        for infra_id, name, address, lat, lon in rows
+        if lat is not None and lon is not None
+    ]
+    return GridIndex.build(points)
+
+
+def build_infra_indexes(db: Optional[Session] = None) -> None:
+    """모든 인프라 카테고리의 공간 인덱스를 (재)생성"""
+    own_session = db is None
+    if own_session:
+        db = ReadSessionLocal()
+    try:
+        for category in INFRA_SOURCES:
+            index = _load_index(db, category)
+            with _lock:
+                _indexes[category] = index
+            logger.info(f"인프라 인덱스 생성 완료: {category} ({len(index)}건)")
+    finally:
+        if own_session:
+            db.close()
+
+
+def get_infra_index(category: str, db: Optional[Session] = None) -> Union[GridIndex, ArrayGridIndex]:
+    """카테고리 인덱스 반환 (시작 시 생성되지 않았다면 최초 호출 시 생성)"""
+    index = _indexes.get(category)
+    if index is not None:
+        return index
+
+    with _lock:
+        index = _indexes.get(category)
+        if index is None:
+            own_session = db is None
+            session = ReadSessionLocal() if own_session else db
+            try:
+                index = _load_index(session, category)
+            finally:
+                if own_session:
+                    session.close()
+            _indexes[category] = index
+    return index
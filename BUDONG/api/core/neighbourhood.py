@@ -0,0 +1,259 @@
+"""
+건물별 주변 정보(t_building_neighbourhood) 사전 계산 작업
+
+학교/공원/지하철역(1km), CCTV(500m), 가장 가까운 소음 지점(1km)을
+메모리 공간 인덱스로 계산해 건물마다 한 행으로 저장한다.
+인프라 테이블을 다시 적재했다면 해당 섹션만 갱신하면 된다.
+
+    python -m BUDONG.api.core.neighbourhood            # 전체
+    python -m BUDONG.api.core.neighbourhood park cctv  # 특정 섹션만
+"""
+
+import logging
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.cache import cache
+from BUDONG.api.core.database import SessionLocal
+from BUDONG.api.core.noise_index import nearest_noise, sync_noise_index
+from BUDONG.api.core.replica import ReadSessionLocal
+from BUDONG.api.models.models import (
+    TBuilding,
+    TBuildingNeighbourhood,
+    TSchool,
+    TPark,
+    TStation,
+    TPublicTransportByAdminDong,
+    TCCTVInfo,
+)
+from BUDONG.config import settings
+from BUDONG.util.geoindex import GridIndex
+
+logger = logging.getLogger(__name__)
+
+INFRA_RADIUS_M = 1000
+CCTV_RADIUS_M = 500
+BATCH_SIZE = 1000
+
+# 섹션 → 갱신되는 컬럼
+SECTIONS = {
+    "school": ("schools",),
+    "park": ("parks",),
+    "subway_station": ("stations",),
+    "cctv": ("real_cctv", "cctv_count"),
+    "noise": ("nearest_noise",),
+}
+
+# compute_neighbourhood용 섹션 인덱스: 섹션 → (생성 시각, 인덱스)
+# NEIGHBOURHOOD_INDEX_TTL마다 다시 로딩해 인프라 재적재가 API 워커에도 반영되도록 한다
+_indexes: dict[str, tuple[float, Optional[GridIndex]]] = {}
+_indexes_lock = threading.Lock()
+# 섹션별 로딩 잠금 (한 섹션을 다시 읽는 동안 다른 섹션 조회는 막지 않음)
+_section_locks = {section: threading.Lock() for section in SECTIONS}
+
+
+def _infra_item(infra_id, category, name, address, lat, lon, extra_data=None) -> dict:
+    """NearbyInfrastructure 형식의 dict"""
+    return {
+        "infra_id": str(infra_id),
+        "infra_category": category,
+        "name": name,
+        "address": address,
+        "latitude": lat,
+        "longitude": lon,
+        "extra_data": extra_data,
+    }
+
+
+def _load_index(db: Session, section: str) -> Optional[GridIndex]:
+    if section == "school":
+        rows = db.execute(
+            select(TSchool.school_id, TSchool.school_name, TSchool.address, TSchool.lat, TSchool.lon)
+        ).all()
+        points = [
+            (r.lat, r.lon, _infra_item(r.school_id, "school", r.school_name, r.address, r.lat, r.lon))
+            for r in rows
+        ]
+    elif section == "park":
+        rows = db.execute(
+            select(TPark.park_name, TPark.address, TPark.lat, TPark.lon)
+        ).all()
+        points = [
+            (r.lat, r.lon, _infra_item(r.park_name, "park", r.park_name, r.address, r.lat, r.lon))
+            for r in rows
+        ]
+    elif section == "subway_station":
+        # 상세 API와 동일하게 대중교통 복잡도 정보가 있는 역만 포함
+        rows = db.execute(
+            select(
+                TStation.station_id,
+                TStation.station_name,
+                TStation.line,
+                TStation.lat,
+                TStation.lon,
+                TPublicTransportByAdminDong.passenger_num,
+                TPublicTransportByAdminDong.complexity_rating,
+            ).join(
+                TPublicTransportByAdminDong,
+                TPublicTransportByAdminDong.station_id == TStation.station_id,
+            )
+        ).all()
+        points = [
+            (r.lat, r.lon, _infra_item(
+                r.station_id, "subway_station", r.station_name, None, r.lat, r.lon,
+                {
+                    "passenger_num": r.passenger_num,
+                    "complexity_rating": r.complexity_rating,
+                    "line": r.line,
+                },
+            ))
+            for r in rows
+        ]
+    elif section == "cctv":
+        rows = db.execute(select(TCCTVInfo.lat, TCCTVInfo.lon, TCCTVInfo.cnt)).all()
+        points = [(r.lat, r.lon, (r.lat, r.lon, r.cnt or 0)) for r in rows]
+    else:
+        return None
+
+    return GridIndex.build(points)
+
+
+def _compute(section: str, index: Optional[GridIndex], lat: float, lon: float) -> dict:
+    """건물 한 곳의 섹션 값 계산 ({컬럼: 값})"""
+    if section == "noise":
+        return {
+            "nearest_noise": [
+                {
+                    "address": p.address,
+                    "noise_max": p.noise_max,
+                    "noise_avg": p.noise_avg,
+                    "noise_min": p.noise_min,
+                    "latitude": p.latitude,
+                    "longitude": p.longitude,
+                }
+                for _, p in nearest_noise(lat, lon, k=1, max_distance_m=INFRA_RADIUS_M)
+            ]
+        }
+
+    if section == "cctv":
+        found = [item for _, item in index.query_radius(lat, lon, CCTV_RADIUS_M)]
+        return {
+            "real_cctv": [{"lon": c_lon, "lat": c_lat} for c_lat, c_lon, _ in found],
+            "cctv_count": sum(cnt for _, _, cnt in found),
+        }
+
+    column = SECTIONS[section][0]
+    return {column: [item for _, item in index.query_radius(lat, lon, INFRA_RADIUS_M)]}
+
+
+def _is_fresh(entry: Optional[tuple[float, Optional[GridIndex]]]) -> bool:
+    return entry is not None and time.monotonic() - entry[0] < settings.NEIGHBOURHOOD_INDEX_TTL
+
+
+def _get_index(section: str) -> Optional[GridIndex]:
+    """섹션 인덱스 반환 (NEIGHBOURHOOD_INDEX_TTL이 지나면 다시 로딩)"""
+    entry = _indexes.get(section)
+    if _is_fresh(entry):
+        return entry[1]
+
+    with _section_locks[section]:
+        entry = _indexes.get(section)
+        if not _is_fresh(entry):
+            db = ReadSessionLocal()
+            try:
+                index = _load_index(db, section)
+            finally:
+                db.close()
+            entry = (time.monotonic(), index)
+            with _indexes_lock:
+                _indexes[section] = entry
+    return entry[1]
+
+
+def compute_neighbourhood(buildings: Iterable[tuple[int, float, float]]) -> dict[int, dict]:
+    """
+    (building_id, lat, lon) 목록의 주변 정보를 한 번에 계산한다 ({building_id: {컬럼: 값}}).
+    사전 계산 행이 없는 건물을 요청 시점에 채우는 용도이며 테이블에 저장하지 않는다.
+    """
+    indexes = {section: _get_index(section) for section in SECTIONS}
+    result = {}
+    for building_id, lat, lon in buildings:
+        columns = {}
+        for section, index in indexes.items():
+            columns.update(_compute(section, index, lat, lon))
+        result[building_id] = columns
+    return result
+
+
+def refresh_building_neighbourhood(
+    sections: Iterable[str] = tuple(SECTIONS),
+    building_ids: Optional[list[int]] = None,
+    db: Optional[Session] = None,
+) -> int:
+    """
+    주변 정보 테이블을 계산해 upsert 한다.
+    sections로 갱신할 섹션을, building_ids로 대상 건물을 제한할 수 있다.
+    처리한 건물 수를 반환한다.
+    """
+    sections = list(sections)
+    unknown = set(sections) - SECTIONS.keys()
+    if unknown:
+        raise ValueError(f"알 수 없는 섹션입니다: {sorted(unknown)}")
+
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+    try:
+        TBuildingNeighbourhood.__table__.create(bind=db.get_bind(), checkfirst=True)
+
+        if "noise" in sections:
+            sync_noise_index(db)
+        indexes = {section: _load_index(db, section) for section in sections}
+        columns = [column for section in sections for column in SECTIONS[section]]
+
+        query = select(TBuilding.building_id, TBuilding.lat, TBuilding.lon).order_by(TBuilding.building_id)
+        if building_ids is not None:
+            query = query.where(TBuilding.building_id.in_(building_ids))
+
+        buildings = db.execute(query).all()
+
+        processed = 0
+        for start in range(0, len(buildings), BATCH_SIZE):
+            now = datetime.now()
+            rows = []
+            for building_id, lat, lon in buildings[start:start + BATCH_SIZE]:
+                row = {"building_id": building_id, "updated_at": now}
+                for section in sections:
+                    row.update(_compute(section, indexes[section], lat, lon))
+                rows.append(row)
+
+            stmt = insert(TBuildingNeighbourhood).values(rows)
+            stmt = stmt.on_duplicate_key_update(
+                **{column: stmt.inserted[column] for column in columns + ["updated_at"]}
+            )
+            db.execute(stmt)
+            db.commit()
+
+            processed += len(rows)
+            logger.info(f"주변 정보 갱신 {processed}건 ({', '.join(sections)})")
+    finally:
+        if own_session:
+            db.close()
+
+    # 갱신된 값이 상세 API에 바로 반영되도록 static 캐시 무효화
+    with _indexes_lock:
+        _indexes.clear()
+    cache.delete_prefix("building_detail:")
+    return processed
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    refresh_building_neighbourhood(sys.argv[1:] or tuple(SECTIONS))
@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from typing import NamedTuple, Optional, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.geo_snapshot import get_snapshot, snapshot_index
+from BUDONG.api.core.replica import ReadSessionLocal
+from BUDONG.api.models.models import TNoise
+from BUDONG.config import settings
+from BUDONG.util.geoindex import ArrayGridIndex, KDTree
+
+logger = logging.getLogger(__name__)
+
+
+class NoisePoint(NamedTuple):
+    """kNN 인덱스에 저장되는 소음 측정 지점"""
+    address: Optional[str]
+    noise_max: Optional[int]
+    noise_avg: Optional[int]
+    noise_min: Optional[int]
+    latitude: float
+    longitude: float
+
+
+NOISE_COLUMNS = (
+    TNoise.address,
+    TNoise.noise_max,
+    TNoise.noise_avg,
+    TNoise.noise_min,
+    TNoise.lat,
+    TNoise.lon,
+)
+NOISE_SNAPSHOT_COLUMNS = ("address", "noise_max", "noise_avg", "noise_min", "lat", "lon")
+
+# DB: upsert/remove 가능한 KDTree, 스냅샷: mmap 좌표를 그대로 쓰는 ArrayGridIndex
+_tree: Optional[Union[KDTree, ArrayGridIndex]] = None
+_points: dict[str, NoisePoint] = {}
+_signature: Optional[tuple] = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+
+def _table_signature(db: Session) -> tuple:
+    """
+    t_noise 변경 감지용 집계값: 행 수 + 인덱싱하는 모든 컬럼의 행별 CRC32 합/XOR.
+    어느 컬럼이 바뀌어도 (서로 상쇄되는 변경 포함) 값이 달라진다.
+    """
+    row_hash = func.crc32(func.concat_ws("|", *(func.coalesce(c, "") for c in NOISE_COLUMNS)))
+    return tuple(
+        db.execute(select(func.count(), func.sum(row_hash), func.bit_xor(row_hash))).one()
+    )
+
+
+def sync_noise_index(db: Optional[Session] = None) -> None:
+    """
+    t_noise와 인덱스를 동기화한다.
+    추가/변경된 지점은 upsert, 사라진 지점은 remove 하여 트리를 점진적으로 갱신한다.
+    지리 스냅샷이 있으면 DB 대신 스냅샷 좌표 배열로 인덱스를 만든다 (프로세스 수명 동안 고정).
+    """
+    global _tree, _points, _signature, _checked_at
+
+    index = snapshot_index("t_noise", NoisePoint, *NOISE_SNAPSHOT_COLUMNS)
+    if index is not None:
+        with _lock:
+            _tree = index
+            _points = {}
+            _signature = ("snapshot", get_snapshot().meta.get("created_at"))
+            _checked_at = time.monotonic()
+        logger.info(f"소음 kNN 인덱스 생성 완료 (스냅샷 {len(index)}건)")
+        return
+
+    own_session = db is None
+    if own_session:
+        db = ReadSessionLocal()
+    try:
+        signature = _table_signature(db)
+        rows = db.execute(select(*NOISE_COLUMNS)).all()
+    finally:
+        if own_session:
+            db.close()
+
+    points = (NoisePoint(*row) for row in rows)
+    latest = {
+        p.address: p
+        for p in points
+        if p.latitude is not None and p.longitude is not None
+    }
+
+    with _lock:
+        if _tree is None:
+            _tree = KDTree.build((p.address, p.latitude, p.longitude, p) for p in latest.values())
+            logger.info(f"소음 kNN 인덱스 생성 완료 ({len(_tree)}건)")
+        else:
+            removed = _points.keys() - latest.keys()
+            changed = [p for key, p in latest.items() if _points.get(key) != p]
+            for key in removed:
+                _tree.remove(key)
+            for p in changed:
+                _tree.upsert(p.address, p.latitude, p.longitude, p)
+            if removed or changed:
+                logger.info(f"소음 kNN 인덱스 갱신: 추가/변경 {len(changed)}건, 삭제 {len(removed)}건")
+
+        _points = latest
+        _signature = signature
+        _checked_at = time.monotonic()
+
+
+def _refresh_if_changed(db: Optional[Session]) -> None:
+    """갱신 주기가 지났다면 t_noise 변경 여부를 확인하고 필요 시 동기화"""
+    global _checked_at
+
+    # 스냅샷은 프로세스 수명 동안 바뀌지 않는다
+    if get_snapshot() is not None:
+        return
+    if time.monotonic() - _checked_at < settings.NOISE_INDEX_REFRESH_SECONDS:
+        return
+    # 동시에 여러 요청이 확인 쿼리를 보내지 않도록 먼저 갱신
+    _checked_at = time.monotonic()
+
+    own_session = db is None
+    session = ReadSessionLocal() if own_session else db
+    try:
+        if _table_signature(session) != _signature:
+            sync_noise_index(session)
+    finally:
+        if own_session:
+            session.close()
+
+
+def nearest_noise(
+    lat: float,
+    lon: float,
+    k: int = 1,
+    max_distance_m: Optional[float] = None,
+    db: Optional[Session] = None,
+) -> list[tuple[float, NoisePoint]]:
+    """가까운 순서로 최대 k개의 (거리(m), NoisePoint) 목록 반환"""
+    if _tree is None:
+        sync_noise_index(db)
+    else:
+        _refresh_if_changed(db)
+
+    return _tree.query_nearest(lat, lon, k=k, max_distance_m=max_distance_m)
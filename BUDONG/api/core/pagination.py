@@ -0,0 +1,45 @@
+import base64
+import json
+
+from BUDONG.api.exception.global_exception_handler import APIError
+
+
+def encode_cursor(*values) -> str:
+    """정렬 키 값들을 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩 (형식이 맞지 않으면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise APIError(
+            code="INVALID_CURSOR",
+            message="유효하지 않은 커서입니다.",
+            status_code=400,
+        )
+    return values
+
+
+def decode_scoped_cursor(cursor: str, scope: tuple, *types) -> list:
+    """
+    encode_cursor(*scope, *keys)로 만든 커서를 디코딩해 keys를 반환한다.
+    scope(정렬 기준, 필터 등)가 현재 요청과 다르거나 키를 types로 변환할 수 없으면 400.
+    """
+    values = decode_cursor(cursor, len(scope) + len(types))
+    try:
+        if tuple(values[:len(scope)]) != tuple(scope):
+            raise ValueError(values[:len(scope)])
+        return [convert(value) for convert, value in zip(types, values[len(scope):])]
+    except (TypeError, ValueError):
+        raise APIError(
+            code="INVALID_CURSOR",
+            message="유효하지 않은 커서입니다.",
+            status_code=400,
+        )
@@ -0,0 +1,44 @@
+"""
+응답 스키마 기준 컬럼 프로젝션
+
+읽기 전용 경로에서 ORM 엔티티 전체(identity map, 속성 계측, TEXT 컬럼)를 적재하지 않고
+스키마에 필요한 컬럼만 Row 튜플로 조회한다.
+
+    BUILDING_COLUMNS = schema_columns(BuildingDetail, TBuilding, latitude=TBuilding.lat, longitude=TBuilding.lon)
+    rows = db.execute(select(*BUILDING_COLUMNS).where(...)).all()
+    buildings = to_schemas(BuildingDetail, rows)
+"""
+
+from typing import Iterable, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
+
+S = TypeVar("S", bound=BaseModel)
+
+
+def schema_columns(schema: type[BaseModel], model, exclude: Iterable[str] = (), **columns) -> list:
+    """
+    schema 필드 이름으로 label된 컬럼 목록.
+    기본은 같은 이름의 모델 컬럼을 사용하고, 이름이 다르면 columns로 지정한다.
+    """
+    exclude = set(exclude)
+    result = []
+    for name in schema.model_fields:
+        if name in exclude:
+            continue
+        column = columns.get(name)
+        if column is None:
+            column = getattr(model, name, None)
+        if column is None:
+            raise ValueError(f"{schema.__name__}.{name}에 대응하는 {model.__name__} 컬럼이 없습니다.")
+        result.append(column.label(name))
+    return result
+
+
+def to_schema(schema: type[S], row: Row, **extra) -> S:
+    return schema(**row._mapping, **extra)
+
+
+def to_schemas(schema: type[S], rows: Iterable[Row]) -> list[S]:
+    return [schema(**row._mapping) for row in rows]
@@ -6,6 +6,7 @@ redis_client = redis.Redis(
     host=settings.REDIS_HOST,
     port=settings.REDIS_PORT,
     db=settings.REDIS_DB,
-    decode_responses=True
+    decode_responses=True,
+    socket_connect_timeout=0.2,  # 장애 시 요청이 오래 막히지 않도록 짧게 설정
+    socket_timeout=0.2,
 )
-
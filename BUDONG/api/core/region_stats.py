@@ -0,0 +1,258 @@
+"""
+법정동(bjd_code)별 지역 통계 스냅샷
+
+법정동/자치구 매핑, 자치구 범죄·CCTV, 대중교통 복잡도, 소음을 한 번에 계산해
+{bjd_code: RegionStats} 딕셔너리로 메모리에 보관한다. /region/stats는 키 조회만 하고,
+/region/stats/bulk는 bbox/자치구 보조 인덱스와 내용 기반 버전(ETag)을 함께 사용한다.
+
+    - 법정동 중심 좌표: 해당 법정동 건물 좌표의 평균 (t_bjd_table에는 좌표가 없음)
+    - 대중교통: t_public_transport_by_admin_dong에는 행정동 키가 없으므로
+      중심 좌표에서 REGION_RADIUS_M 이내 가장 가까운 (복잡도 정보가 있는) 역
+    - 소음: 중심 좌표에서 REGION_RADIUS_M 이내 가장 가까운 측정 지점
+
+REGION_STATS_TTL이 지나면 백그라운드 스레드 하나가 다시 계산하고, 그동안 요청은
+이전 스냅샷을 그대로 받는다 (스냅샷이 아직 없을 때만 요청이 계산을 기다림).
+원본 데이터를 다시 적재했다면 refresh_region_stats()로 즉시 갱신할 수 있다.
+
+    python -m BUDONG.api.core.region_stats   # 계산 결과 요약 출력
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import NamedTuple, Optional
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.noise_index import nearest_noise
+from BUDONG.api.core.replica import ReadSessionLocal
+from BUDONG.api.models.models import (
+    TBjdTable,
+    TBuilding,
+    TJcgBjdTable,
+    TCrimeCCTV,
+    TPublicTransportByAdminDong,
+    TStation,
+)
+from BUDONG.config import settings
+from BUDONG.util.geoutil import nearest_k
+
+logger = logging.getLogger(__name__)
+
+REGION_RADIUS_M = 1000
+REFRESH_RETRY_S = 60  # 백그라운드 갱신 실패 후 재시도까지 대기 시간
+
+
+class RegionStats(NamedTuple):
+    bjd_code: int
+    bjd_name: Optional[str]
+    region_name_full: Optional[str]
+    ja_chi_gu_code: Optional[int]
+    latitude: Optional[float]  # 법정동 중심 (건물 좌표 평균)
+    longitude: Optional[float]
+    crime_num: Optional[int]
+    cctv_num: Optional[int]
+    dangerous_rating: Optional[int]
+    cctv_security_rating: Optional[int]
+    passenger_num: Optional[int]
+    complexity_rating: Optional[int]
+    noise_max: Optional[int]
+    noise_avg: Optional[int]
+    noise_min: Optional[int]
+
+
+class RegionSnapshot:
+    """계산된 법정동 통계와 bbox/자치구 조회용 보조 인덱스"""
+
+    def __init__(self, stats: dict[int, RegionStats]):
+        self.stats = stats
+
+        located = [s for s in stats.values() if s.latitude is not None]
+        self._codes = np.array([s.bjd_code for s in located], dtype=np.int64)
+        self._lats = np.array([s.latitude for s in located], dtype=np.float64)
+        self._lons = np.array([s.longitude for s in located], dtype=np.float64)
+
+        self._districts: dict[int, list[int]] = {}
+        for s in stats.values():
+            if s.ja_chi_gu_code is not None:
+                self._districts.setdefault(s.ja_chi_gu_code, []).append(s.bjd_code)
+
+        # 내용 기반 버전 (워커마다 따로 계산해도 같은 값 → ETag로 사용)
+        raw = json.dumps([stats[code] for code in sorted(stats)], default=str, ensure_ascii=False)
+        self.version = hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+    def in_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> list[int]:
+        """중심 좌표가 사각형 안에 있는 법정동 코드"""
+        mask = (
+            (self._lats >= min_lat) & (self._lats <= max_lat)
+            & (self._lons >= min_lon) & (self._lons <= max_lon)
+        )
+        return self._codes[mask].tolist()
+
+    def in_district(self, ja_chi_gu_code: int) -> list[int]:
+        return self._districts.get(ja_chi_gu_code, [])
+
+
+_snapshot: Optional[RegionSnapshot] = None
+_built_at = 0.0
+_lock = threading.Lock()  # 최초 계산 (스냅샷이 없을 때)
+_refresh_lock = threading.Lock()  # 백그라운드 갱신 single-flight
+_retry_at = 0.0
+
+
+def _district_name(region_name_full: Optional[str]) -> Optional[str]:
+    """전체 지역명에서 자치구명(…구) 추출"""
+    if not region_name_full:
+        return None
+    return next((part for part in region_name_full.split() if part.endswith("구")), None)
+
+
+def build_region_stats(db: Session) -> dict[int, RegionStats]:
+    """원본 테이블에서 법정동별 통계를 계산 (쿼리 5회 + 메모리 kNN)"""
+    bjds = db.execute(select(TBjdTable.bjd_code, TBjdTable.bjd_name)).all()
+
+    jcg = {}
+    for row in db.execute(
+        select(TJcgBjdTable.bjd_code, TJcgBjdTable.region_name_full, TJcgBjdTable.ja_chi_gu_code)
+        .where(TJcgBjdTable.bjd_code.is_not(None))
+    ).all():
+        jcg.setdefault(row.bjd_code, row)
+
+    crimes = {
+        row.jcg_name: row
+        for row in db.execute(
+            select(
+                TCrimeCCTV.jcg_name,
+                TCrimeCCTV.crime_num,
+                TCrimeCCTV.cctv_num,
+                TCrimeCCTV.dangerous_rating,
+                TCrimeCCTV.CCTV_security_rating,
+            )
+        ).all()
+    }
+
+    centroids = {
+        row.bjd_code: (row.lat, row.lon)
+        for row in db.execute(
+            select(TBuilding.bjd_code, func.avg(TBuilding.lat).label("lat"), func.avg(TBuilding.lon).label("lon"))
+            .where(TBuilding.bjd_code.is_not(None))
+            .group_by(TBuilding.bjd_code)
+        ).all()
+    }
+
+    stations = db.execute(
+        select(
+            TStation.lat,
+            TStation.lon,
+            TPublicTransportByAdminDong.passenger_num,
+            TPublicTransportByAdminDong.complexity_rating,
+        )
+        .join(TPublicTransportByAdminDong, TPublicTransportByAdminDong.station_id == TStation.station_id)
+        .where(TStation.lat.is_not(None), TStation.lon.is_not(None))
+    ).all()
+    station_lats = np.array([s.lat for s in stations], dtype=np.float64)
+    station_lons = np.array([s.lon for s in stations], dtype=np.float64)
+
+    stats = {}
+    for bjd_code, bjd_name in bjds:
+        mapping = jcg.get(bjd_code)
+        region_name_full = mapping.region_name_full if mapping else None
+        crime = crimes.get(region_name_full) or crimes.get(_district_name(region_name_full))
+
+        lat, lon = centroids.get(bjd_code, (None, None))
+        station = noise = None
+        if lat is not None:
+            lat, lon = float(lat), float(lon)
+            idx, _ = nearest_k(lat, lon, station_lats, station_lons, k=1, max_distance_m=REGION_RADIUS_M)
+            station = stations[idx[0]] if idx.size else None
+            nearest = nearest_noise(lat, lon, k=1, max_distance_m=REGION_RADIUS_M, db=db)
+            noise = nearest[0][1] if nearest else None
+
+        stats[bjd_code] = RegionStats(
+            bjd_code=bjd_code,
+            bjd_name=bjd_name,
+            region_name_full=region_name_full,
+            ja_chi_gu_code=mapping.ja_chi_gu_code if mapping else None,
+            latitude=lat,
+            longitude=lon,
+            crime_num=crime.crime_num if crime else None,
+            cctv_num=crime.cctv_num if crime else None,
+            dangerous_rating=crime.dangerous_rating if crime else None,
+            cctv_security_rating=crime.CCTV_security_rating if crime else None,
+            passenger_num=station.passenger_num if station else None,
+            complexity_rating=station.complexity_rating if station else None,
+            noise_max=noise.noise_max if noise else None,
+            noise_avg=noise.noise_avg if noise else None,
+            noise_min=noise.noise_min if noise else None,
+        )
+    return stats
+
+
+def refresh_region_stats(db: Optional[Session] = None) -> RegionSnapshot:
+    """통계를 다시 계산해 교체한다"""
+    global _snapshot, _built_at
+
+    own_session = db is None
+    if own_session:
+        db = ReadSessionLocal()
+    try:
+        stats = build_region_stats(db)
+    finally:
+        if own_session:
+            db.close()
+
+    _snapshot, _built_at = RegionSnapshot(stats), time.monotonic()
+    logger.info(f"법정동 통계 스냅샷 생성 완료 ({len(stats)}건, 버전 {_snapshot.version})")
+    return _snapshot
+
+
+def _is_fresh() -> bool:
+    return _snapshot is not None and time.monotonic() - _built_at < settings.REGION_STATS_TTL
+
+
+def _refresh_in_background() -> None:
+    """만료된 스냅샷을 백그라운드에서 갱신 (동시에 하나만 실행)"""
+    if time.monotonic() < _retry_at or not _refresh_lock.acquire(blocking=False):
+        return
+
+    def run():
+        global _retry_at
+        try:
+            refresh_region_stats()
+        except Exception:
+            _retry_at = time.monotonic() + REFRESH_RETRY_S
+            logger.exception("법정동 통계 스냅샷 갱신 실패 (이전 스냅샷 유지)")
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(target=run, name="region-stats-refresh", daemon=True).start()
+
+
+def get_region_snapshot() -> RegionSnapshot:
+    """현재 스냅샷 (REGION_STATS_TTL이 지나면 이전 스냅샷을 반환하면서 백그라운드 갱신)"""
+    if _is_fresh():
+        return _snapshot
+
+    if _snapshot is not None:
+        _refresh_in_background()
+        return _snapshot
+
+    with _lock:
+        if _snapshot is None:
+            refresh_region_stats()
+    return _snapshot
+
+
+def get_region_stats(bjd_code: int) -> Optional[RegionStats]:
+    return get_region_snapshot().stats.get(bjd_code)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    result = refresh_region_stats().stats
+    located = sum(1 for s in result.values() if s.latitude is not None)
+    print(f"법정동 {len(result)}건 (중심 좌표 {located}건)")
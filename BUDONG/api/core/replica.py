@@ -0,0 +1,169 @@
+"""
+읽기 전용 요청의 레플리카 라우팅
+
+DB_REPLICA_URLS에 설정된 레플리카 중 하나로 읽기 세션을 만든다 (가중치 랜덤 선택).
+레플리카는 DB_REPLICA_CHECK_INTERVAL마다 연결/복제 지연을 확인해
+연결 실패 또는 지연이 DB_REPLICA_MAX_LAG_SECONDS를 넘으면 제외하고,
+사용 가능한 레플리카가 없으면 primary로 대체한다. 쓰기는 항상 get_db(primary)를 사용한다.
+
+로컬 테스트는 SQLite 파일 두 개로도 가능하다 (복제 지연 확인은 MySQL에서만 수행).
+    DB_REPLICA_URLS=sqlite:////tmp/replica1.db,sqlite:////tmp/replica2.db
+    DB_REPLICA_WEIGHTS=2,1
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from BUDONG.api.core.database import ENGINE_OPTIONS, SessionLocal
+from BUDONG.api.core.db_pool import InstrumentedQueuePool, instrument_engine
+from BUDONG.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Replica:
+    def __init__(self, name: str, engine: Engine, weight: int):
+        self.name = name
+        self.engine = engine
+        self.weight = weight
+        self.session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        self.healthy = True
+        self.lag_seconds: Optional[float] = None
+        self.checked_at = 0.0
+        self.error: Optional[str] = None
+
+
+def _replication_lag(conn) -> Optional[float]:
+    """MySQL 복제 지연(초). 복제가 설정되지 않은 서버는 0, 복제 중단 시 None"""
+    if conn.dialect.name != "mysql":
+        return 0.0
+    for statement, column in (
+        ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+        ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+    ):
+        try:
+            row = conn.execute(text(statement)).mappings().first()
+        except Exception:
+            continue  # 8.0.22 미만은 SHOW REPLICA STATUS 미지원
+        if row is None:
+            return 0.0
+        lag = row.get(column)
+        return None if lag is None else float(lag)
+    return 0.0
+
+
+class ReadRouter:
+    """읽기 세션을 레플리카(가중치/지연 기반) 또는 primary로 보낸다"""
+
+    def __init__(self, replicas: list[Replica], max_lag_seconds: float, check_interval: float):
+        self.replicas = replicas
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "ReadRouter":
+        urls = [u.strip() for u in settings.DB_REPLICA_URLS.split(",") if u.strip()]
+        weights = [int(w) for w in settings.DB_REPLICA_WEIGHTS.split(",") if w.strip()]
+        if weights and len(weights) != len(urls):
+            raise ValueError("DB_REPLICA_WEIGHTS 개수가 DB_REPLICA_URLS와 다릅니다.")
+
+        replicas = []
+        for i, url in enumerate(urls):
+            engine = create_engine(url, poolclass=InstrumentedQueuePool, **ENGINE_OPTIONS)
+            instrument_engine(engine)
+            replicas.append(Replica(f"replica{i + 1}", engine, weights[i] if weights else 1))
+
+        return cls(replicas, settings.DB_REPLICA_MAX_LAG_SECONDS, settings.DB_REPLICA_CHECK_INTERVAL)
+
+    def _check(self, replica: Replica) -> None:
+        try:
+            with replica.engine.connect() as conn:
+                lag = _replication_lag(conn)
+            healthy = lag is not None and lag <= self.max_lag_seconds
+            error = None if healthy else f"복제 지연 {lag}s"
+        except Exception as e:
+            lag, healthy, error = None, False, str(e)
+
+        if healthy != replica.healthy:
+            level = logging.INFO if healthy else logging.WARNING
+            logger.log(level, f"{replica.name} {'복구' if healthy else '제외'}: {error or 'OK'}")
+        replica.healthy, replica.lag_seconds, replica.error = healthy, lag, error
+        replica.checked_at = time.monotonic()
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        stale = [r for r in self.replicas if now - r.checked_at >= self.check_interval]
+        # 한 스레드만 확인하고 나머지는 직전 결과를 사용
+        if stale and self._lock.acquire(blocking=False):
+            try:
+                for replica in stale:
+                    self._check(replica)
+            finally:
+                self._lock.release()
+
+    def choose(self) -> Optional[Replica]:
+        if not self.replicas:
+            return None
+        self._refresh()
+        candidates = [r for r in self.replicas if r.healthy and r.weight > 0]
+        if not candidates:
+            return None
+        return random.choices(candidates, weights=[r.weight for r in candidates])[0]
+
+    def session(self) -> Session:
+        replica = self.choose()
+        if replica is None:
+            return SessionLocal()
+        return replica.session_factory()
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "name": r.name,
+                "url": r.engine.url.render_as_string(hide_password=True),
+                "weight": r.weight,
+                "healthy": r.healthy,
+                "lag_seconds": r.lag_seconds,
+                "error": r.error,
+            }
+            for r in self.replicas
+        ]
+
+
+read_router = ReadRouter.from_settings()
+
+
+def ReadSessionLocal() -> Session:
+    """읽기 전용 세션 (레플리카가 없거나 모두 제외되면 primary)"""
+    return read_router.session()
+
+
+# 읽기 전용 라우터용 DB 세션 생성기
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def run_on_primary(task: Callable[[Session], T]) -> T:
+    """
+    primary 세션으로 조회 (쓰기 직후 무효화된 캐시를 다시 채우는 값처럼
+    레플리카 복제 지연이 있으면 안 되는 읽기용)
+    """
+    db = SessionLocal()
+    try:
+        return task(db)
+    finally:
+        db.close()
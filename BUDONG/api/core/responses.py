@@ -0,0 +1,55 @@
+"""
+빠른 JSON 응답 경로
+
+핸들러가 이미 response_model 타입의 인스턴스를 만들었다면 model_response()로 감싸 반환한다.
+Response 객체를 반환하면 FastAPI가 response_model 재검증과 jsonable_encoder를 건너뛰고,
+직렬화는 pydantic-core가 모델에서 바로 JSON 바이트를 만든다.
+response_model은 OpenAPI 문서용으로 그대로 둔다.
+
+변경이 드문 응답은 make_etag()로 ETag를 만들고, 요청의 If-None-Match와 같으면
+본문을 만들지 않고 not_modified()(304)를 반환한다.
+"""
+
+import hashlib
+import json
+from typing import Union
+
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from BUDONG.config import settings
+
+
+class PydanticJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return to_json(content)
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Union[Response, BaseModel]:
+    """검증이 끝난 응답 모델을 재검증 없이 직렬화 (FAST_JSON_RESPONSES가 꺼져 있으면 모델 그대로 반환)"""
+    if not settings.FAST_JSON_RESPONSES:
+        return model
+    return PydanticJSONResponse(model, status_code=status_code)
+
+
+def make_etag(*parts) -> str:
+    """응답을 결정하는 값들로 만든 강한 ETag"""
+    raw = json.dumps(parts, separators=(",", ":"), default=str, ensure_ascii=False)
+    return f'"{hashlib.sha1(raw.encode()).hexdigest()[:20]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match에 etag가 포함되어 있는지 (약한 비교, '*' 허용)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip().removeprefix("W/") for value in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
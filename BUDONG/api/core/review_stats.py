@@ -0,0 +1,157 @@
+"""
+건물별 리뷰 집계(t_building_review_stats) 유지와 재계산
+
+리뷰 작성 시 record_review()로 같은 트랜잭션에서 집계 행을 upsert 하고,
+상세/리뷰/검색은 리뷰 행 대신 집계 행을 PK로 조회한다.
+누락/불일치(직접 적재, 삭제 등)는 재계산 작업으로 맞춘다.
+집계 테이블이 없으면 서버 시작 시 ensure_review_stats()가 만들고 전체를 한 번 계산한다.
+
+    python -m BUDONG.api.core.review_stats          # 전체 재계산
+    python -m BUDONG.api.core.review_stats 1 2 3    # 특정 건물만
+"""
+
+import logging
+import sys
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import case, delete, func, inspect, select
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.database import SessionLocal
+from BUDONG.api.models.models import TBuildingReview, TBuildingReviewStats
+
+logger = logging.getLogger(__name__)
+
+RATINGS = (1, 2, 3, 4, 5)
+HISTOGRAM_COLUMNS = tuple(f"rating_{r}" for r in RATINGS)
+
+# 조회용 컬럼 (상세/리뷰/검색 공용)
+REVIEW_STATS_COLUMNS = (
+    TBuildingReviewStats.building_id,
+    TBuildingReviewStats.review_count,
+    TBuildingReviewStats.rating_avg,
+    *(getattr(TBuildingReviewStats, c) for c in HISTOGRAM_COLUMNS),
+    TBuildingReviewStats.latest_review_at,
+)
+
+
+def record_review(db: Session, building_id: int, rating: int, created_at: datetime) -> None:
+    """
+    새 리뷰 한 건을 집계에 반영한다 (commit은 호출 측에서 리뷰 INSERT와 함께).
+    INSERT ... ON DUPLICATE KEY UPDATE 한 문장이라 동시 작성에도 증분이 유실되지 않는다.
+    """
+    if rating not in RATINGS:
+        raise ValueError(f"평점은 1~5 사이여야 합니다: {rating}")
+
+    t = TBuildingReviewStats.__table__.c
+    rating_column = f"rating_{rating}"
+    now = datetime.now()
+
+    stmt = insert(TBuildingReviewStats).values(
+        building_id=building_id,
+        review_count=1,
+        rating_sum=rating,
+        rating_avg=rating,
+        **{c: int(c == rating_column) for c in HISTOGRAM_COLUMNS},
+        latest_review_at=created_at,
+        updated_at=now,
+    )
+    # 평균은 기존 값으로 먼저 계산 (이후 대입이 갱신된 값을 보더라도 결과가 같도록)
+    stmt = stmt.on_duplicate_key_update([
+        ("rating_avg", (t.rating_sum + rating) / (t.review_count + 1)),
+        ("review_count", t.review_count + 1),
+        ("rating_sum", t.rating_sum + rating),
+        (rating_column, t[rating_column] + 1),
+        ("latest_review_at", func.greatest(func.coalesce(t.latest_review_at, created_at), created_at)),
+        ("updated_at", now),
+    ])
+    db.execute(stmt)
+
+
+def review_summary(stats) -> dict:
+    """집계 행(또는 None)을 응답용 dict로 변환"""
+    if stats is None:
+        return {"review_count": 0, "average_rating": None, "rating_histogram": [0] * len(RATINGS)}
+    return {
+        "review_count": stats.review_count,
+        "average_rating": round(float(stats.rating_avg), 2) if stats.rating_avg is not None else None,
+        "rating_histogram": [getattr(stats, c) for c in HISTOGRAM_COLUMNS],
+    }
+
+
+def get_review_stats(db: Session, building_id: int):
+    return db.execute(
+        select(*REVIEW_STATS_COLUMNS).where(TBuildingReviewStats.building_id == building_id)
+    ).first()
+
+
+def get_review_stats_many(db: Session, building_ids: list[int]) -> dict:
+    rows = db.execute(
+        select(*REVIEW_STATS_COLUMNS).where(TBuildingReviewStats.building_id.in_(building_ids))
+    ).all()
+    return {row.building_id: row for row in rows}
+
+
+def ensure_review_stats(engine) -> bool:
+    """집계 테이블이 없으면 생성 후 전체 재계산 (생성했으면 True)"""
+    if inspect(engine).has_table(TBuildingReviewStats.__tablename__):
+        return False
+    TBuildingReviewStats.__table__.create(bind=engine, checkfirst=True)
+    logger.info(f"{TBuildingReviewStats.__tablename__} 생성, 기존 리뷰로 집계를 채웁니다")
+    reconcile_review_stats()
+    return True
+
+
+def reconcile_review_stats(building_ids: Optional[list[int]] = None, db: Optional[Session] = None) -> int:
+    """
+    t_building_review에서 집계를 다시 계산해 덮어쓰고, 리뷰가 없는 건물의 집계 행은 삭제한다.
+    INSERT ... SELECT 한 문장으로 실행하므로 재계산 중 작성된 리뷰도 유실되지 않는다.
+    upsert 문의 영향 행 수를 반환한다 (MySQL: 추가 1, 변경 2, 동일 0).
+    """
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+    try:
+        TBuildingReviewStats.__table__.create(bind=db.get_bind(), checkfirst=True)
+        r = TBuildingReview
+
+        aggregate = select(
+            r.building_id,
+            func.count(),
+            func.sum(r.rating),
+            func.avg(r.rating),
+            *(func.sum(case((r.rating == rating, 1), else_=0)) for rating in RATINGS),
+            func.max(r.created_at),
+            func.now(),
+        ).group_by(r.building_id)
+        if building_ids is not None:
+            aggregate = aggregate.where(r.building_id.in_(building_ids))
+
+        columns = [
+            "building_id", "review_count", "rating_sum", "rating_avg",
+            *HISTOGRAM_COLUMNS, "latest_review_at", "updated_at",
+        ]
+        stmt = insert(TBuildingReviewStats).from_select(columns, aggregate)
+        stmt = stmt.on_duplicate_key_update(**{c: stmt.inserted[c] for c in columns[1:]})
+        affected = db.execute(stmt).rowcount
+
+        orphans = delete(TBuildingReviewStats).where(
+            TBuildingReviewStats.building_id.not_in(select(r.building_id).distinct())
+        )
+        if building_ids is not None:
+            orphans = orphans.where(TBuildingReviewStats.building_id.in_(building_ids))
+        removed = db.execute(orphans).rowcount
+
+        db.commit()
+        logger.info(f"리뷰 집계 재계산 완료 (영향 행 {affected}, 삭제 {removed}건)")
+        return affected
+    finally:
+        if own_session:
+            db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    reconcile_review_stats([int(b) for b in sys.argv[1:]] or None)
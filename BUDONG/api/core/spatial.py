@@ -0,0 +1,188 @@
+"""
+공간 인덱스 기반 반경 검색 조건과 geom 컬럼 마이그레이션
+
+모든 반경 검색은 MBRContains(사각형, geom)으로 SPATIAL INDEX 후보를 먼저 좁히고,
+후보에 대해서만 ST_Distance_Sphere로 정확한 거리를 계산한다.
+geom 컬럼/SPATIAL INDEX가 아직 없는 테이블(마이그레이션 전)은
+lat/lon 사각형 조건 + ST_Distance_Sphere로 같은 결과를 반환한다.
+
+기존 DB 마이그레이션/백필 (배포 단계에서 한 번, 서버 시작 시 자동 실행은 SPATIAL_AUTO_MIGRATE):
+    python -m BUDONG.api.core.spatial
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import and_, func, inspect, text
+from sqlalchemy.engine import Engine
+
+from BUDONG.api.models.models import (
+    TBuilding,
+    TSchool,
+    TStation,
+    TPark,
+    TCCTVInfo,
+    TNoise,
+)
+from BUDONG.util.geoutil import bounding_box
+
+logger = logging.getLogger(__name__)
+
+SRID = 4326
+SPATIAL_MODELS = (TBuilding, TSchool, TStation, TPark, TCCTVInfo, TNoise)
+BACKFILL_BATCH_SIZE = 10000
+
+# geom 컬럼과 SPATIAL INDEX가 준비된 테이블 (None: 아직 확인 전 → lat/lon 조건 사용)
+_spatial_tables: Optional[set[str]] = None
+
+
+def distance_expression(model, lat: float, lon: float):
+    """모델 좌표와 중심 좌표 사이의 구면 거리 (미터)"""
+    return func.ST_Distance_Sphere(
+        func.Point(model.lon, model.lat),
+        func.Point(lon, lat)
+    )
+
+
+def bbox_geometry(lat: float, lon: float, radius_m: float):
+    """반경을 덮는 사각형 POLYGON (SRID 4326)"""
+    min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, radius_m)
+    wkt = (
+        f"POLYGON(({min_lon} {min_lat}, {max_lon} {min_lat}, {max_lon} {max_lat}, "
+        f"{min_lon} {max_lat}, {min_lon} {min_lat}))"
+    )
+    return func.ST_GeomFromText(wkt, SRID, "axis-order=long-lat")
+
+
+def within_radius(model, lat: float, lon: float, radius_m: float):
+    """공간 인덱스 사전 필터 + 정확한 거리 조건 (geom이 없으면 lat/lon 사각형 필터)"""
+    if _spatial_tables is not None and model.__tablename__ in _spatial_tables:
+        prefilter = func.MBRContains(bbox_geometry(lat, lon, radius_m), model.geom)
+    else:
+        min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, radius_m)
+        prefilter = and_(model.lat.between(min_lat, max_lat), model.lon.between(min_lon, max_lon))
+    return and_(prefilter, distance_expression(model, lat, lon) <= radius_m)
+
+
+def detect_spatial_columns(engine: Engine) -> set[str]:
+    """geom 컬럼과 SPATIAL INDEX가 모두 있는 테이블을 확인해 within_radius에 반영"""
+    global _spatial_tables
+
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    ready = set()
+    for model in SPATIAL_MODELS:
+        table = model.__tablename__
+        if table not in existing_tables:
+            continue
+        columns = {c["name"] for c in inspector.get_columns(table)}
+        indexes = {i["name"] for i in inspector.get_indexes(table)}
+        if "geom" in columns and _spatial_index_name(model) in indexes:
+            ready.add(table)
+
+    _spatial_tables = ready
+    missing = [m.__tablename__ for m in SPATIAL_MODELS if m.__tablename__ not in ready]
+    if missing:
+        logger.warning(f"geom/SPATIAL INDEX가 없어 lat/lon 조건으로 검색합니다: {', '.join(missing)}")
+    return ready
+
+
+def _spatial_index_name(model) -> str:
+    return next(i.name for i in model.__table__.indexes if "geom" in i.columns)
+
+
+# -----------------------------------------------------------
+# 마이그레이션 / 백필
+# -----------------------------------------------------------
+
+def _point_sql(prefix: str = "") -> str:
+    # 좌표가 없는 행은 POINT(0 0)으로 채워 NOT NULL 제약을 만족시킨다 (검색 범위 밖)
+    return (
+        f"ST_GeomFromText(CONCAT('POINT(', COALESCE({prefix}lon, 0), ' ', "
+        f"COALESCE({prefix}lat, 0), ')'), {SRID}, 'axis-order=long-lat')"
+    )
+
+
+def _geom_column(conn, table: str) -> Optional[tuple[bool, Optional[int]]]:
+    """geom 컬럼의 (NULL 허용 여부, SRID), 컬럼이 없으면 None"""
+    row = conn.execute(text(
+        "SELECT IS_NULLABLE, SRS_ID FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND COLUMN_NAME = 'geom'"
+    ), {"table": table}).first()
+    if row is None:
+        return None
+    return row[0] == "YES", row[1]
+
+
+def _existing_triggers(conn, table: str) -> set[str]:
+    return set(conn.execute(text(
+        "SELECT TRIGGER_NAME FROM information_schema.TRIGGERS "
+        "WHERE TRIGGER_SCHEMA = DATABASE() AND EVENT_OBJECT_TABLE = :table"
+    ), {"table": table}).scalars())
+
+
+def ensure_spatial_columns(engine: Engine) -> None:
+    """
+    geom 컬럼 추가, 동기화 트리거 생성, lat/lon 백필, NOT NULL 전환, SPATIAL INDEX 생성.
+    이미 적용된 단계는 DDL 없이 건너뛰므로 (트리거도 없을 때만 생성) 여러 번 실행해도 안전하다.
+    테이블 재작성/잠금이 생길 수 있어 서버 시작과 분리된 배포 단계에서 CLI로 실행한다.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+
+    for model in SPATIAL_MODELS:
+        table = model.__tablename__
+        if table not in existing_tables:
+            continue
+
+        indexes = {i["name"] for i in inspector.get_indexes(table)}
+        index_name = _spatial_index_name(model)
+
+        with engine.begin() as conn:
+            geom = _geom_column(conn, table)
+            if geom is None:
+                logger.info(f"{table}: geom 컬럼 추가")
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN geom POINT SRID {SRID} NULL"))
+                geom = (True, SRID)
+
+            # 백필 전에 트리거부터 만들어 마이그레이션 중 적재되는 행도 geom이 채워지도록 한다
+            # (lat/lon만 적재하는 기존 로더 대응, 이미 있으면 그대로 둠)
+            triggers = _existing_triggers(conn, table)
+            for timing, event in (("bi", "INSERT"), ("bu", "UPDATE")):
+                trigger = f"trg_{table}_geom_{timing}"
+                if trigger in triggers:
+                    continue
+                logger.info(f"{table}: 트리거 {trigger} 생성")
+                conn.execute(text(
+                    f"CREATE TRIGGER {trigger} BEFORE {event} ON {table} "
+                    f"FOR EACH ROW SET NEW.geom = {_point_sql('NEW.')}"
+                ))
+
+        nullable, srid = geom
+        if nullable:
+            # 대용량 테이블을 고려해 배치 단위로 백필
+            while True:
+                with engine.begin() as conn:
+                    updated = conn.execute(text(
+                        f"UPDATE {table} SET geom = {_point_sql()} "
+                        f"WHERE geom IS NULL LIMIT {BACKFILL_BATCH_SIZE}"
+                    )).rowcount
+                if updated == 0:
+                    break
+                logger.info(f"{table}: geom 백필 {updated}건")
+
+        with engine.begin() as conn:
+            if nullable or srid != SRID:
+                logger.info(f"{table}: geom NOT NULL SRID {SRID} 적용")
+                conn.execute(text(f"ALTER TABLE {table} MODIFY geom POINT NOT NULL SRID {SRID}"))
+
+            if index_name not in indexes:
+                logger.info(f"{table}: SPATIAL INDEX {index_name} 생성")
+                conn.execute(text(f"CREATE SPATIAL INDEX {index_name} ON {table} (geom)"))
+
+
+if __name__ == "__main__":
+    from BUDONG.api.core.database import engine
+
+    logging.basicConfig(level=logging.INFO)
+    ensure_spatial_columns(engine)
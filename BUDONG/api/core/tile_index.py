@@ -0,0 +1,211 @@
+"""
+지도 타일(z/x/y)별 클러스터 집계
+
+레이어의 좌표를 Web Mercator로 한 번 투영해 두고, 줌 레벨마다
+타일을 CLUSTER_GRID x CLUSTER_GRID 셀로 나눈 집계(개수, 중심점)를 만들어 캐시한다.
+RAW_POINT_MIN_ZOOM 이상에서는 타일 내 원본 좌표를 그대로 반환한다.
+TILE_CACHE_TTL이 지난 레이어는 요청 경로 밖(백그라운드)에서 다시 로딩해 교체한다.
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from sqlalchemy import null, select
+
+from BUDONG.api.core.geo_snapshot import snapshot_rows
+from BUDONG.api.core.replica import ReadSessionLocal
+from BUDONG.api.models.models import TBuilding, TCCTVInfo, TSchool, TPark, TStation
+from BUDONG.config import settings
+
+logger = logging.getLogger(__name__)
+
+CLUSTER_GRID_BITS = 3  # 타일당 8 x 8 클러스터 셀
+RAW_POINT_MIN_ZOOM = 16
+MAX_RAW_POINTS = 2000  # 원본 좌표 반환 상한 (초과 시 클러스터로 반환)
+MAX_LATITUDE = 85.05112878
+REFRESH_RETRY_S = 60  # 백그라운드 재로딩 실패 후 재시도까지 대기 시간
+
+# 레이어별 조회 컬럼: (id, name, lat, lon, weight)
+LAYER_SOURCES = {
+    "building": (TBuilding.building_id, TBuilding.building_name, TBuilding.lat, TBuilding.lon, null()),
+    "cctv": (TCCTVInfo.id, null(), TCCTVInfo.lat, TCCTVInfo.lon, TCCTVInfo.cnt),
+    "school": (TSchool.school_id, TSchool.school_name, TSchool.lat, TSchool.lon, null()),
+    "park": (TPark.park_name, TPark.park_name, TPark.lat, TPark.lon, null()),
+    "subway_station": (TStation.station_id, TStation.station_name, TStation.lat, TStation.lon, null()),
+}
+
+# 스냅샷 사용 시 레이어별 (테이블, id, name, lat, lon, weight) - building은 스냅샷 대상 아님
+# 줌별 클러스터는 워커마다 계산하므로 스냅샷에서도 행을 복사해 TilePoint로 만든다
+LAYER_SNAPSHOT_SOURCES = {
+    "cctv": ("t_cctv_info", "id", None, "lat", "lon", "cnt"),
+    "school": ("t_school", "school_id", "school_name", "lat", "lon", None),
+    "park": ("t_park", "park_name", "park_name", "lat", "lon", None),
+    "subway_station": ("t_station", "station_id", "station_name", "lat", "lon", None),
+}
+
+
+class TilePoint(NamedTuple):
+    id: str
+    name: Optional[str]
+    latitude: float
+    longitude: float
+    count: int
+    mx: float  # Web Mercator x (0~1)
+    my: float  # Web Mercator y (0~1)
+
+
+class TileCluster(NamedTuple):
+    count: int
+    latitude: float
+    longitude: float
+
+
+def project(lat: float, lon: float) -> tuple[float, float]:
+    """위경도를 0~1 범위의 Web Mercator 좌표로 변환"""
+    lat = max(min(lat, MAX_LATITUDE), -MAX_LATITUDE)
+    mx = (lon + 180.0) / 360.0
+    phi = math.radians(lat)
+    my = (1.0 - math.log(math.tan(phi) + 1.0 / math.cos(phi)) / math.pi) / 2.0
+    return min(max(mx, 0.0), 1.0 - 1e-12), min(max(my, 0.0), 1.0 - 1e-12)
+
+
+class TileLayer:
+    """한 레이어의 줌별 클러스터 집계 캐시"""
+
+    def __init__(self, points: list[TilePoint]):
+        self.points = points
+        self._clusters: dict[int, dict[tuple[int, int], list[TileCluster]]] = {}
+        self._raw: Optional[dict[tuple[int, int], list[TilePoint]]] = None
+        self._lock = threading.Lock()
+
+    def _build_clusters(self, z: int) -> dict[tuple[int, int], list[TileCluster]]:
+        scale = 1 << (z + CLUSTER_GRID_BITS)
+        # 셀 → [가중치 합, 가중 위도 합, 가중 경도 합, 개수, 위도 합, 경도 합]
+        cells: dict[tuple[int, int], list[float]] = {}
+        for p in self.points:
+            key = (int(p.mx * scale), int(p.my * scale))
+            acc = cells.get(key)
+            if acc is None:
+                acc = cells[key] = [0, 0.0, 0.0, 0, 0.0, 0.0]
+            acc[0] += p.count
+            acc[1] += p.latitude * p.count
+            acc[2] += p.longitude * p.count
+            acc[3] += 1
+            acc[4] += p.latitude
+            acc[5] += p.longitude
+
+        tiles: dict[tuple[int, int], list[TileCluster]] = {}
+        for (cx, cy), (weight, w_lat, w_lon, n, sum_lat, sum_lon) in cells.items():
+            tile = (cx >> CLUSTER_GRID_BITS, cy >> CLUSTER_GRID_BITS)
+            # 가중치가 0인 셀(CCTV 개수 0 등)은 단순 평균 좌표 사용
+            if weight > 0:
+                cluster = TileCluster(int(weight), w_lat / weight, w_lon / weight)
+            else:
+                cluster = TileCluster(0, sum_lat / n, sum_lon / n)
+            tiles.setdefault(tile, []).append(cluster)
+        return tiles
+
+    def _build_raw(self) -> dict[tuple[int, int], list[TilePoint]]:
+        scale = 1 << RAW_POINT_MIN_ZOOM
+        tiles: dict[tuple[int, int], list[TilePoint]] = {}
+        for p in self.points:
+            tiles.setdefault((int(p.mx * scale), int(p.my * scale)), []).append(p)
+        return tiles
+
+    def clusters(self, z: int, x: int, y: int) -> list[TileCluster]:
+        tiles = self._clusters.get(z)
+        if tiles is None:
+            with self._lock:
+                tiles = self._clusters.get(z)
+                if tiles is None:
+                    tiles = self._build_clusters(z)
+                    self._clusters[z] = tiles
+        return tiles.get((x, y), [])
+
+    def raw_points(self, z: int, x: int, y: int) -> list[TilePoint]:
+        """RAW_POINT_MIN_ZOOM 이상 줌에서 타일 내 원본 좌표"""
+        if self._raw is None:
+            with self._lock:
+                if self._raw is None:
+                    self._raw = self._build_raw()
+
+        shift = z - RAW_POINT_MIN_ZOOM
+        bucket = self._raw.get((x >> shift, y >> shift), [])
+        if shift == 0:
+            return bucket
+
+        scale = 1 << z
+        return [p for p in bucket if int(p.mx * scale) == x and int(p.my * scale) == y]
+
+
+_layers: dict[str, tuple[float, TileLayer]] = {}
+_layers_lock = threading.Lock()  # _layers 교체용 (로딩 중에는 잡지 않음)
+# 레이어별 로딩 single-flight (한 레이어를 다시 읽는 동안 다른 레이어 요청은 막지 않음)
+_load_locks = {layer: threading.Lock() for layer in LAYER_SOURCES}
+
+
+def _load_layer(layer: str) -> TileLayer:
+    rows = None
+    if layer in LAYER_SNAPSHOT_SOURCES:
+        rows = snapshot_rows(*LAYER_SNAPSHOT_SOURCES[layer])
+    if rows is None:
+        db = ReadSessionLocal()
+        try:
+            rows = db.execute(select(*LAYER_SOURCES[layer])).all()
+        finally:
+            db.close()
+
+    points = []
+    for point_id, name, lat, lon, weight in rows:
+        if lat is None or lon is None:
+            continue
+        mx, my = project(lat, lon)
+        points.append(TilePoint(str(point_id), name, lat, lon, 1 if weight is None else weight, mx, my))
+
+    logger.info(f"타일 레이어 로딩 완료: {layer} ({len(points)}건)")
+    return TileLayer(points)
+
+
+def _store_layer(layer: str, built_at: float, tile_layer: TileLayer) -> None:
+    with _layers_lock:
+        _layers[layer] = (built_at, tile_layer)
+
+
+def _reload_in_background(layer: str, stale: TileLayer) -> None:
+    """만료된 레이어를 다시 로딩해 교체 (실패하면 이전 레이어를 REFRESH_RETRY_S 뒤 다시 시도)"""
+    try:
+        _store_layer(layer, time.monotonic(), _load_layer(layer))
+    except Exception:
+        logger.exception(f"타일 레이어 재로딩 실패, 이전 레이어 유지: {layer}")
+        _store_layer(layer, time.monotonic() - settings.TILE_CACHE_TTL + REFRESH_RETRY_S, stale)
+    finally:
+        _load_locks[layer].release()
+
+
+def get_tile_layer(layer: str) -> TileLayer:
+    """
+    레이어 반환. TILE_CACHE_TTL이 지나면 이전 레이어를 그대로 반환하면서
+    백그라운드 스레드 하나가 다시 로딩한다 (레이어가 아직 없을 때만 요청이 로딩을 기다림).
+    """
+    entry = _layers.get(layer)
+    if entry is not None and time.monotonic() - entry[0] < settings.TILE_CACHE_TTL:
+        return entry[1]
+
+    lock = _load_locks[layer]
+    if entry is not None:
+        if lock.acquire(blocking=False):
+            threading.Thread(
+                target=_reload_in_background, args=(layer, entry[1]),
+                name=f"tile-layer-{layer}", daemon=True,
+            ).start()
+        return entry[1]
+
+    with lock:
+        entry = _layers.get(layer)
+        if entry is None:
+            entry = (time.monotonic(), _load_layer(layer))
+            _store_layer(layer, *entry)
+    return entry[1]
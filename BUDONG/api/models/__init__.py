@@ -14,7 +14,9 @@ from .models import (
     TPark,
     TNoise,
     TJcgBjdTable,
-    TCCTVInfo
+    TCCTVInfo,
+    TBuildingNeighbourhood,
+    TBuildingReviewStats
 )
 
 
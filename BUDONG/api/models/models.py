@@ -7,9 +7,10 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
     BigInteger, Integer, String, Text, Float, DateTime, 
-    SmallInteger, ForeignKey, Index, UniqueConstraint
+    SmallInteger, ForeignKey, Index, UniqueConstraint, JSON, Computed
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import UserDefinedType
 
 
 class Base(DeclarativeBase):
@@ -17,6 +18,30 @@ class Base(DeclarativeBase):
     pass
 
 
+class Point(UserDefinedType):
+    """MySQL POINT 공간 타입 (SRID 지정)"""
+    cache_ok = True
+
+    def __init__(self, srid: int = 4326):
+        self.srid = srid
+
+    def get_col_spec(self, **kw):
+        return f"POINT SRID {self.srid}"
+
+
+def geom_column():
+    """
+    lat/lon에서 생성되는 공간 좌표 컬럼 (SPATIAL INDEX 대상).
+    값은 DB 트리거로 채워지므로 ORM에서는 기본적으로 로딩하지 않는다.
+    """
+    return mapped_column(
+        Point(4326),
+        nullable=False,
+        deferred=True,
+        comment="공간 좌표 (SRID 4326)"
+    )
+
+
 # =====================================================
 # 1. 사용자 및 활동 테이블
 # =====================================================
@@ -66,6 +91,8 @@ class TBuildingReview(Base):
     __table_args__ = (
         Index("idx_user_id", "user_id"),
         Index("idx_building_id", "building_id"),
+        # 건물별 최신순 리뷰 keyset 페이지
+        Index("idx_building_created", "building_id", "created_at", "review_id"),
         {"comment": "건물 리뷰 정보"}
     )
 
@@ -169,6 +196,7 @@ class TBuilding(Base):
     __tablename__ = "t_building"
     __table_args__ = (
         Index("idx_bjd_code", "bjd_code"),
+        Index("sidx_building_geom", "geom", mysql_prefix="SPATIAL"),
     )
 
     building_id: Mapped[int] = mapped_column(
@@ -187,9 +215,10 @@ class TBuilding(Base):
     building_type: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     build_year: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     total_units: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    location: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    location: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     lon: Mapped[float] = mapped_column(Float, nullable=False)
     lat: Mapped[float] = mapped_column(Float, nullable=False)
+    geom: Mapped[bytes] = geom_column()
 
     # Relationships
     bjd: Mapped[Optional["TBjdTable"]] = relationship(back_populates="buildings")
@@ -216,6 +245,8 @@ class TRealTransactionPrice(Base):
     __table_args__ = (
         Index("idx_building_id", "building_id"),
         Index("idx_transaction_date", "transaction_date"),
+        # 건물별 최근 거래 조회 (building_id, transaction_day DESC, tx_id DESC 순서로 역방향 스캔)
+        Index("idx_building_tx_day", "building_id", "transaction_day"),
     )
 
     tx_id: Mapped[int] = mapped_column(
@@ -230,6 +261,14 @@ class TRealTransactionPrice(Base):
         comment="건물 ID"
     )
     transaction_date: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # TEXT는 prefix 인덱스만 가능하고 prefix 인덱스는 ORDER BY에 쓰이지 않으므로 고정 길이 생성 컬럼으로 정렬
+    transaction_day: Mapped[Optional[str]] = mapped_column(
+        String(10),
+        Computed("LEFT(transaction_date, 10)", persisted=True),
+        nullable=True,
+        deferred=True,
+        comment="거래일 YYYY-MM-DD (정렬/인덱스용 생성 컬럼)"
+    )
     price: Mapped[int] = mapped_column(BigInteger, nullable=False)
     area_sqm: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     floor: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -273,6 +312,9 @@ class TPoliceStationInfo(Base):
 # =====================================================
 class TCCTVInfo(Base):
     __tablename__ = 't_cctv_info'
+    __table_args__ = (
+        Index("sidx_cctv_geom", "geom", mysql_prefix="SPATIAL"),
+    )
 
     id = mapped_column(Integer, primary_key=True, autoincrement=True, comment='고유 ID')
     
@@ -280,9 +322,13 @@ class TCCTVInfo(Base):
     
     lat: Mapped[Optional[float]] = mapped_column(Float, nullable=False)
     lon: Mapped[Optional[float]] = mapped_column(Float, nullable=False)
+    geom: Mapped[bytes] = geom_column()
 
 class TStation(Base):
     __tablename__ = "t_station"
+    __table_args__ = (
+        Index("sidx_station_geom", "geom", mysql_prefix="SPATIAL"),
+    )
 
     station_id: Mapped[int] = mapped_column(
         BigInteger,
@@ -293,6 +339,7 @@ class TStation(Base):
     station_name: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    geom: Mapped[bytes] = geom_column()
 
 
 class TPublicTransportByAdminDong(Base):
@@ -311,6 +358,7 @@ class TSchool(Base):
     __tablename__ = "t_school"
     __table_args__ = (
         Index("idx_school_name", "school_name"),
+        Index("sidx_school_geom", "geom", mysql_prefix="SPATIAL"),
     )
 
     school_id: Mapped[int] = mapped_column(
@@ -327,23 +375,28 @@ class TSchool(Base):
     address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    geom: Mapped[bytes] = geom_column()
 
 
 class TPark(Base):
     __tablename__ = "t_park"
+    __table_args__ = (
+        Index("sidx_park_geom", "geom", mysql_prefix="SPATIAL"),
+    )
 
     park_name: Mapped[str] = mapped_column(
         String(200),
         primary_key=True,
         comment="공원명"
     )
-    park_introduce: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    park_introduce: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     park_size: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     region: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     management: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    geom: Mapped[bytes] = geom_column()
 
 
 # =====================================================
@@ -352,6 +405,9 @@ class TPark(Base):
 
 class TNoise(Base):
     __tablename__ = "t_noise"
+    __table_args__ = (
+        Index("sidx_noise_geom", "geom", mysql_prefix="SPATIAL"),
+    )
 
     noise_max: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     noise_avg: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
@@ -359,6 +415,7 @@ class TNoise(Base):
     address: Mapped[Optional[str]] = mapped_column(Text, nullable=True, primary_key=True)
     lat: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     lon: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    geom: Mapped[bytes] = geom_column()
 
 
 class TJcgBjdTable(Base):
@@ -379,3 +436,63 @@ class TJcgBjdTable(Base):
 
     # Relationships
     bjd: Mapped[Optional["TBjdTable"]] = relationship(back_populates="jcg_mappings")
+
+
+# =====================================================
+# 7. 사전 계산 테이블
+# =====================================================
+
+class TBuildingNeighbourhood(Base):
+    """건물별 주변 인프라/CCTV/소음 요약 (core.neighbourhood 작업으로 생성)"""
+    __tablename__ = "t_building_neighbourhood"
+    __table_args__ = {"comment": "건물 주변 정보 사전 계산"}
+
+    building_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("t_building.building_id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="건물 ID"
+    )
+    schools: Mapped[Optional[list]] = mapped_column(JSON, nullable=True, comment="1km 이내 학교")
+    parks: Mapped[Optional[list]] = mapped_column(JSON, nullable=True, comment="1km 이내 공원")
+    stations: Mapped[Optional[list]] = mapped_column(JSON, nullable=True, comment="1km 이내 지하철역")
+    real_cctv: Mapped[Optional[list]] = mapped_column(JSON, nullable=True, comment="500m 이내 CCTV 좌표")
+    cctv_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, comment="500m 이내 CCTV 수")
+    nearest_noise: Mapped[Optional[list]] = mapped_column(JSON, nullable=True, comment="1km 이내 가장 가까운 소음 지점")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now
+    )
+
+
+class TBuildingReviewStats(Base):
+    """건물별 리뷰 집계 (리뷰 작성 시 같은 트랜잭션에서 갱신, core.review_stats 작업으로 재계산)"""
+    __tablename__ = "t_building_review_stats"
+    __table_args__ = (
+        Index("idx_rating_avg", "rating_avg"),
+        {"comment": "건물 리뷰 집계"}
+    )
+
+    building_id: Mapped[int] = mapped_column(
+        BigInteger,
+        ForeignKey("t_building.building_id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="건물 ID"
+    )
+    review_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="리뷰 수")
+    rating_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="평점 합계")
+    rating_avg: Mapped[Optional[float]] = mapped_column(Float, nullable=True, comment="평균 평점")
+    rating_1: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="1점 리뷰 수")
+    rating_2: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="2점 리뷰 수")
+    rating_3: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="3점 리뷰 수")
+    rating_4: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="4점 리뷰 수")
+    rating_5: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="5점 리뷰 수")
+    latest_review_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, comment="최근 리뷰 작성 시각")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        default=datetime.now,
+        onupdate=datetime.now
+    )
@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+from BUDONG.api.routers.v1.admin import pool_stats
+
+router = APIRouter()
+
+# 각 라우터 등록
+router.include_router(pool_stats.router, tags=["admin"])
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+from BUDONG.api.core.auth import Principal, get_current_admin_user
+from BUDONG.api.core.database import async_engine, engine
+from BUDONG.api.core.db_pool import pool_status
+from BUDONG.api.core.executor import auth_pool
+from BUDONG.api.core.replica import read_router
+
+router = APIRouter()
+
+
+@router.get("/pool_stats", response_model=dict)
+def get_pool_stats(
+    current_user: Principal = Depends(get_current_admin_user)
+):
+    """
+    DB 커넥션 풀 / 워커 풀 상태 확인
+    """
+    return {
+        "database": {
+            "sync": pool_status(engine),
+            "async": pool_status(async_engine.sync_engine),
+            "replicas": [
+                {**replica, "pool": pool_status(r.engine)}
+                for r, replica in zip(read_router.replicas, read_router.status())
+            ],
+        },
+        "workers": {
+            "auth": auth_pool.stats(),
+        },
+    }
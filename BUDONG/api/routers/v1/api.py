@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from BUDONG.api.routers.v1 import auth ,search, buildings, reviews, user, environment, region, infrastructure
+from BUDONG.api.routers.v1 import auth ,search, buildings, reviews, user, environment, region, infrastructure, map, admin
 router = APIRouter()
 
 # Auth 라우터 등록
@@ -11,6 +11,8 @@ router.include_router(user.router, prefix="/user", tags=["user"])
 router.include_router(environment.router, prefix="/environment", tags=["environment"])
 router.include_router(region.router, prefix="/region", tags=["region"])
 router.include_router(infrastructure.router, prefix="/infrastructure", tags=["infrastructure"])
+router.include_router(map.router, prefix="/map", tags=["map"])
+router.include_router(admin.router, prefix="/admin", tags=["admin"])
 
 @router.get("/")
 async def api_root():
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from BUDONG.api.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from BUDONG.api.core.database import get_async_db
 from BUDONG.api.models.models import TUser
 from BUDONG.api.schemas.schema_auth import Token, TokenWithRefresh
 from BUDONG.api.core.auth import authenticate_user, create_access_token, create_refresh_token
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.post("/login", response_model=TokenWithRefresh, summary="OAuth2 로그인", description="OAuth2 표준 형식으로 로그인합니다. form-data 형식으로 username(이메일)과 password를 전송하세요.")
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OAuth2 표준 로그인 엔드포인트
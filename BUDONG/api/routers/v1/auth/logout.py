@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 from BUDONG.api.core.database import get_db
 from BUDONG.api.models.models import TUser
-from BUDONG.api.core.auth import get_current_active_user
+from BUDONG.api.core.auth import Principal, get_current_active_user
 from BUDONG.api.schemas.schema_auth import UserResponse
 
 router = APIRouter()
@@ -10,7 +10,7 @@ router = APIRouter()
 
 @router.post("/logout", response_model=dict, status_code=status.HTTP_200_OK)
 async def logout(
-    current_user: TUser = Depends(get_current_active_user)
+    current_user: Principal = Depends(get_current_active_user)
 ):
     """
     로그아웃
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from BUDONG.api.core.database import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from BUDONG.api.core.database import get_async_db
 from BUDONG.api.models.models import TUser
 from BUDONG.api.schemas.schema_auth import TokenWithRefresh, RefreshTokenRequest
 from BUDONG.api.core.auth import verify_token, create_access_token, create_refresh_token
@@ -13,7 +14,7 @@ router = APIRouter()
 @router.post("/refresh", response_model=TokenWithRefresh, summary="토큰 갱신", description="리프레시 토큰을 사용하여 새로운 액세스 토큰과 리프레시 토큰을 발급받습니다.")
 async def refresh_token(
     refresh_data: RefreshTokenRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     OAuth2 리프레시 토큰을 사용하여 새로운 토큰 발급
@@ -54,7 +55,8 @@ async def refresh_token(
         raise credentials_exception
     
     # 사용자 확인
-    user = db.query(TUser).filter(TUser.user_id == user_id).first()
+    result = await db.execute(select(TUser).where(TUser.user_id == user_id))
+    user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
     
@@ -2,31 +2,48 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from BUDONG.api.core.database import get_db
 from BUDONG.api.models.models import TUser
-from BUDONG.api.core.auth import get_current_active_user, verify_password, get_password_hash
+from BUDONG.api.core.auth import Principal, get_current_active_user, verify_password, get_password_hash
+from BUDONG.api.core.cache import invalidate_principal
+from BUDONG.api.core.executor import auth_pool
 from BUDONG.api.schemas.schema_auth import PasswordUpdate
 
 router = APIRouter()
 
 
-@router.post("/update_password", status_code=status.HTTP_200_OK)
-async def update_password(
-    password_data: PasswordUpdate,
-    current_user: TUser = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
-):
-    """
-    비밀번호 변경
-    """
+def _change_password(user_id: int, password_data: PasswordUpdate, db: Session) -> None:
+    # principal 캐시에는 비밀번호 해시가 없으므로 사용자 행을 직접 조회
+    user = db.query(TUser).filter(TUser.user_id == user_id).first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 정보를 확인할 수 없습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     # 현재 비밀번호 확인
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    if not verify_password(password_data.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다."
         )
     
     # 새 비밀번호 해싱 및 업데이트
-    current_user.password_hash = get_password_hash(password_data.new_password)
+    user.password_hash = get_password_hash(password_data.new_password)
     db.commit()
+    invalidate_principal(user.user_id)
+
+
+@router.post("/update_password", status_code=status.HTTP_200_OK)
+async def update_password(
+    password_data: PasswordUpdate,
+    current_user: Principal = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    비밀번호 변경
+    """
+    # bcrypt 검증/해싱과 동기 DB 작업은 워커 풀에서 실행
+    await auth_pool.run(_change_password, current_user.user_id, password_data, db)
     
     return {
         "message": "비밀번호가 성공적으로 변경되었습니다."
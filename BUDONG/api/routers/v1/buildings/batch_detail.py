@@ -0,0 +1,166 @@
+"""
+건물 상세 일괄 조회 (POST /buildings/details)
+
+목록/비교 화면에서 건물마다 /buildings/detail을 호출하면 건물당 쿼리가 반복되므로,
+요청한 건물 전체를 건물/범죄/실거래가/리뷰 IN (...) 쿼리로 한 번씩 조회하고 (리뷰는 첫 페이지)
+사전 계산이 없는 건물의 주변 정보는 메모리 공간 인덱스로 한 번에 계산한다.
+섹션 캐시는 /buildings/detail과 같은 키를 공유한다.
+"""
+
+import json
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from BUDONG.api.core.auth import get_current_claims
+from BUDONG.api.core.cache import DETAIL_SECTIONS, building_detail_key, cache
+from BUDONG.api.core.executor import fan_out
+from BUDONG.api.core.neighbourhood import compute_neighbourhood
+from BUDONG.api.core.projections import to_schema
+from BUDONG.api.core.replica import get_read_db
+from BUDONG.api.core.responses import model_response
+from BUDONG.api.models import TBuilding, TBuildingNeighbourhood
+from BUDONG.api.routers.v1.buildings.detail import (
+    BUILDING_COLUMNS,
+    NEIGHBOURHOOD_COLUMNS,
+    build_static_section,
+    fetch_crimes,
+    detail_response,
+    fetch_first_review_pages_many,
+    fetch_transactions_many,
+    neighbourhood_is_complete,
+    neighbourhood_results,
+)
+from BUDONG.api.schemas.schema_buildings import (
+    BuildingBatchRequest,
+    BuildingDetail,
+    BuildingDetailBatchResponse,
+)
+from BUDONG.config import settings
+
+router = APIRouter()
+
+
+def _load_cached_sections_many(building_ids: list[int]) -> dict[int, dict]:
+    """캐시된 상세 섹션 일괄 조회 ({building_id: {섹션: 데이터 또는 None}}, MGET 한 번)"""
+    if not settings.CACHE_ENABLED:
+        return {building_id: dict.fromkeys(DETAIL_SECTIONS) for building_id in building_ids}
+
+    keys = [
+        building_detail_key(building_id, section)
+        for building_id in building_ids
+        for section in DETAIL_SECTIONS
+    ]
+    values = iter(cache.get_many(keys))
+    return {
+        building_id: {
+            section: json.loads(value) if value is not None else None
+            for section, value in zip(DETAIL_SECTIONS, values)
+        }
+        for building_id in building_ids
+    }
+
+
+def _store_sections_many(section: str, data: dict[int, object], ttl: int) -> None:
+    """{building_id: 섹션 데이터}를 한 번에 저장"""
+    if settings.CACHE_ENABLED:
+        cache.set_many_json(
+            {building_detail_key(building_id, section): value for building_id, value in data.items()},
+            ttl,
+        )
+
+
+@router.post("/details", response_model=BuildingDetailBatchResponse)
+def get_building_details(
+    payload: BuildingBatchRequest,
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_claims),
+):
+    # 개수 상한(DETAIL_BATCH_MAX_IDS)은 요청 검증 단계에서 확인됨
+    building_ids = list(dict.fromkeys(payload.building_ids))
+
+    # ------------------------------------------------------------------
+    # 0. 캐시 조회
+    # ------------------------------------------------------------------
+    sections = _load_cached_sections_many(building_ids)
+
+    # ------------------------------------------------------------------
+    # 1. static 섹션이 없는 건물 + 사전 계산된 주변 정보 (IN 쿼리 한 번)
+    # ------------------------------------------------------------------
+    static_ids = [building_id for building_id in building_ids if sections[building_id]["static"] is None]
+    rows = {}
+    if static_ids:
+        rows = {
+            row.building_id: row
+            for row in db.execute(
+                select(*BUILDING_COLUMNS, *NEIGHBOURHOOD_COLUMNS)
+                .outerjoin(
+                    TBuildingNeighbourhood,
+                    TBuildingNeighbourhood.building_id == TBuilding.building_id,
+                )
+                .where(TBuilding.building_id.in_(static_ids))
+            ).all()
+        }
+
+    missing_ids = [building_id for building_id in static_ids if building_id not in rows]
+    for building_id in missing_ids:
+        del sections[building_id]
+
+    buildings = {building_id: to_schema(BuildingDetail, row) for building_id, row in rows.items()}
+    region_names = {building.address.split(' ')[0] for building in buildings.values()}
+    transaction_ids = [b for b, data in sections.items() if data["transactions"] is None]
+    review_ids = [b for b, data in sections.items() if data["review_page"] is None]
+
+    # ------------------------------------------------------------------
+    # 2. 범죄/실거래가/리뷰는 섹션별 IN 쿼리를 병렬로 실행
+    # ------------------------------------------------------------------
+    tasks = {}
+    if region_names:
+        tasks["crime"] = lambda s: fetch_crimes(s, region_names)
+    if transaction_ids:
+        tasks["transactions"] = lambda s: fetch_transactions_many(s, transaction_ids)
+    if review_ids:
+        tasks["review_page"] = lambda s: fetch_first_review_pages_many(s, review_ids)
+    results = fan_out(tasks, db) if tasks else {}
+
+    # ------------------------------------------------------------------
+    # 3. 사전 계산 결과가 없는 건물의 주변 정보는 공간 인덱스로 한 번에 계산
+    # ------------------------------------------------------------------
+    computed = compute_neighbourhood(
+        (building_id, building.latitude, building.longitude)
+        for building_id, building in buildings.items()
+        if not neighbourhood_is_complete(rows[building_id])
+    )
+
+    for building_id, building in buildings.items():
+        neighbourhood = computed.get(building_id) or rows[building_id]._mapping
+        region_name = building.address.split(' ')[0]
+        sections[building_id]["static"] = build_static_section(
+            building,
+            results["crime"].get(region_name),
+            neighbourhood_results(neighbourhood),
+        )
+    _store_sections_many(
+        "static",
+        {building_id: sections[building_id]["static"] for building_id in buildings},
+        settings.DETAIL_CACHE_STATIC_TTL,
+    )
+
+    fresh = {}
+    for building_id, items in results.get("transactions", {}).items():
+        fresh[building_id] = [item.model_dump(mode="json") for item in items]
+        sections[building_id]["transactions"] = fresh[building_id]
+    _store_sections_many("transactions", fresh, settings.DETAIL_CACHE_DYNAMIC_TTL)
+
+    for building_id, page in results.get("review_page", {}).items():
+        sections[building_id]["review_page"] = page
+    _store_sections_many("review_page", results.get("review_page", {}), settings.DETAIL_CACHE_DYNAMIC_TTL)
+
+    # ------------------------------------------------------------------
+    # 최종 반환 (요청 순서 유지)
+    # ------------------------------------------------------------------
+    return model_response(BuildingDetailBatchResponse(
+        buildings={building_id: detail_response(data) for building_id, data in sections.items()},
+        missing_ids=missing_ids,
+    ))
@@ -1,8 +1,20 @@
+import json
+from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from BUDONG.api.core.auth import get_current_active_user
-from BUDONG.api.core.database import get_db
+from sqlalchemy import String, cast, func, literal, null, select, tuple_, union_all
+from BUDONG.api.core.auth import get_current_claims
+from BUDONG.api.core.cache import DETAIL_SECTIONS, building_detail_key, cache
+from BUDONG.api.core.replica import get_read_db, run_on_primary
+from BUDONG.api.core.responses import model_response
+from BUDONG.api.core.executor import fan_out
+from BUDONG.api.core.geo_snapshot import crime_lookup
+from BUDONG.api.core.indexes import transaction_day, transaction_order
+from BUDONG.api.core.neighbourhood import SECTIONS as NEIGHBOURHOOD_SECTIONS
+from BUDONG.api.core.pagination import decode_scoped_cursor, encode_cursor
+from BUDONG.api.core.review_stats import get_review_stats, get_review_stats_many, review_summary
+from BUDONG.api.core.noise_index import nearest_noise
 from BUDONG.api.models import (
     TBuilding,
     TRealTransactionPrice,
@@ -10,13 +22,10 @@ from BUDONG.api.models import (
     TSchool,
     TPark,
     TStation,
-    TPoliceStationInfo,
     TCrimeCCTV,
     TPublicTransportByAdminDong,
-    TBjdTable,
-    TJcgBjdTable,
-    TNoise,
-    TCCTVInfo
+    TCCTVInfo,
+    TBuildingNeighbourhood
 )
 
 from BUDONG.api.schemas.schema_buildings import (
@@ -31,254 +40,424 @@ from BUDONG.api.schemas.schema_buildings import (
     cctv_info_detail
 )
 
-from BUDONG.util.geoutil import haversine
+from BUDONG.api.core.projections import schema_columns, to_schema, to_schemas
+from BUDONG.api.core.spatial import within_radius
+from BUDONG.config import settings
 
 router = APIRouter()
 
+INFRA_RADIUS_M = 1000
+CCTV_RADIUS_M = 500
+TRANSACTION_LIMIT = 10
+REVIEW_PAGE_SIZE = 20
 
-@router.post("/detail", response_model=BuildingDetailResponse)
-def get_building_detail(
-    payload: BuildingRequest,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_active_user),
-):
-
-    # ------------------------------------------------------------------
-    # 1. 건물 정보 조회
-    # ------------------------------------------------------------------
-    building = (
-        db.query(TBuilding)
-        .filter(TBuilding.building_id == payload.building_id)
-        .first()
-    )
-
-    if not building:
-        raise HTTPException(status_code=404, detail="Building not found")
-
-    b_lat = building.lat
-    b_lon = building.lon
-
-    building_schema = BuildingDetail(
-        building_id=building.building_id,
-        bjd_code=building.bjd_code,
-        address=building.address,
-        building_name=building.building_name,
-        building_type=building.building_type,
-        build_year=building.build_year,
-        total_units=building.total_units,
-        latitude=b_lat,
-        longitude=b_lon,
-    )
-
-    # ------------------------------------------------------------------
-    # 2. 실거래가 정보
-    # ------------------------------------------------------------------
-    tx_list = (
-        db.query(TRealTransactionPrice)
-        .filter(TRealTransactionPrice.building_id == building.building_id)
-        .all()
-    )
-
-    transactions_schema = [
-        BuildingTransaction(
-            tx_id=tx.tx_id,
-            building_id=tx.building_id,
-            transaction_date=tx.transaction_date,
-            price=tx.price,
-            area_sqm=tx.area_sqm,
-            floor=tx.floor,
+# 응답 스키마에 필요한 컬럼만 Row 튜플로 조회 (ORM 엔티티/TEXT 컬럼 적재 없음)
+BUILDING_COLUMNS = schema_columns(
+    BuildingDetail, TBuilding, latitude=TBuilding.lat, longitude=TBuilding.lon
+)
+NEIGHBOURHOOD_COLUMNS = [
+    getattr(TBuildingNeighbourhood, column)
+    for columns in NEIGHBOURHOOD_SECTIONS.values()
+    for column in columns
+]
+TRANSACTION_COLUMNS = schema_columns(BuildingTransaction, TRealTransactionPrice)
+REVIEW_COLUMNS = schema_columns(ReviewSchema, TBuildingReview)
+
+
+def nearby_infrastructure(db: Session, lat: float, lon: float, radius_m: float) -> list[NearbyInfrastructure]:
+    """
+    학교/공원/지하철역을 UNION ALL 한 번으로 조회한다.
+    지하철역은 대중교통 복잡도와 JOIN 하여 복잡도 정보가 있는 역만 포함한다.
+    """
+    school_q = select(
+        cast(TSchool.school_id, String).label("infra_id"),
+        literal("school").label("infra_category"),
+        TSchool.school_name.label("name"),
+        TSchool.address.label("address"),
+        TSchool.lat.label("lat"),
+        TSchool.lon.label("lon"),
+        null().label("passenger_num"),
+        null().label("complexity_rating"),
+        null().label("line"),
+    ).where(within_radius(TSchool, lat, lon, radius_m))
+
+    park_q = select(
+        TPark.park_name,
+        literal("park"),
+        TPark.park_name,
+        TPark.address,
+        TPark.lat,
+        TPark.lon,
+        null(),
+        null(),
+        null(),
+    ).where(within_radius(TPark, lat, lon, radius_m))
+
+    station_q = select(
+        cast(TStation.station_id, String),
+        literal("subway_station"),
+        TStation.station_name,
+        null(),
+        TStation.lat,
+        TStation.lon,
+        TPublicTransportByAdminDong.passenger_num,
+        TPublicTransportByAdminDong.complexity_rating,
+        TStation.line,
+    ).join(
+        TPublicTransportByAdminDong,
+        TPublicTransportByAdminDong.station_id == TStation.station_id,
+    ).where(within_radius(TStation, lat, lon, radius_m))
+
+    rows = db.execute(union_all(school_q, park_q, station_q)).all()
+
+    return [
+        NearbyInfrastructure(
+            infra_id=row.infra_id,
+            infra_category=row.infra_category,
+            name=row.name,
+            address=row.address,
+            latitude=row.lat,
+            longitude=row.lon,
+            extra_data={
+                "passenger_num": row.passenger_num,
+                "complexity_rating": row.complexity_rating,
+                "line": row.line,
+            } if row.infra_category == "subway_station" else None,
         )
-        for tx in tx_list
-    ][:10]
+        for row in rows
+    ]
 
-    # ------------------------------------------------------------------
-    # 3. 리뷰 정보
-    # ------------------------------------------------------------------
-    review_list = (
-        db.query(TBuildingReview)
-        .filter(TBuildingReview.building_id == building.building_id)
-        .all()
-    )
 
-    reviews_schema = [
-        ReviewSchema(
-            review_id=r.review_id,
-            user_id=r.user_id,
-            building_id=r.building_id,
-            rating=r.rating,
-            content=r.content,
-            created_at=r.created_at,
+def nearby_cctv(db: Session, lat: float, lon: float, radius_m: float):
+    """반경 내 CCTV 좌표/개수 목록"""
+    return db.execute(
+        select(TCCTVInfo.lat, TCCTVInfo.lon, TCCTVInfo.cnt)
+        .where(within_radius(TCCTVInfo, lat, lon, radius_m))
+    ).all()
+
+
+def fetch_transactions(db: Session, building_id: int) -> list[BuildingTransaction]:
+    """최근 실거래가 정보 (거래일 내림차순 TRANSACTION_LIMIT건)"""
+    rows = db.execute(
+        select(*TRANSACTION_COLUMNS)
+        .where(TRealTransactionPrice.building_id == building_id)
+        .order_by(*transaction_order())
+        .limit(TRANSACTION_LIMIT)
+    ).all()
+
+    return to_schemas(BuildingTransaction, rows)
+
+
+def fetch_transactions_many(db: Session, building_ids: list[int]) -> dict[int, list[BuildingTransaction]]:
+    """
+    여러 건물의 최근 실거래가 정보 (쿼리 한 번).
+    건물마다 ORDER BY ... LIMIT 쿼리를 UNION ALL로 묶어 각각 idx_building_tx_day 역방향 스캔으로 끝낸다
+    (ROW_NUMBER 윈도우는 건물별 전체 거래를 정렬해야 함).
+    """
+    grouped = {building_id: [] for building_id in building_ids}
+    if not building_ids:
+        return grouped
+
+    latest = union_all(*(
+        select(
+            select(*TRANSACTION_COLUMNS, transaction_day().label("tx_day"))
+            .where(TRealTransactionPrice.building_id == building_id)
+            .order_by(*transaction_order())
+            .limit(TRANSACTION_LIMIT)
+            .subquery()
         )
-        for r in review_list
-    ]
-
+        for building_id in building_ids
+    )).subquery()
+
+    # UNION ALL 결과 순서는 보장되지 않으므로 (최대 건물 수 x TRANSACTION_LIMIT 행만) 다시 정렬
+    rows = db.execute(
+        select(latest).order_by(latest.c.building_id, latest.c.tx_day.desc(), latest.c.tx_id.desc())
+    ).all()
+    for tx in to_schemas(BuildingTransaction, rows):
+        grouped[tx.building_id].append(tx)
+    return grouped
+
+
+def decode_review_cursor(cursor: str) -> list:
+    """리뷰 커서 → [created_at, review_id]"""
+    return decode_scoped_cursor(cursor, (), datetime.fromisoformat, int)
+
+
+def _review_page(rows: list, stats) -> dict:
+    """리뷰 섹션 (JSON 직렬화 가능한 dict): 한 페이지 + 다음 커서 + 리뷰 집계(개수/평균/분포)"""
+    has_next = len(rows) > REVIEW_PAGE_SIZE
+    rows = rows[:REVIEW_PAGE_SIZE]
+    return {
+        "items": [r.model_dump(mode="json") for r in to_schemas(ReviewSchema, rows)],
+        "next_cursor": encode_cursor(rows[-1].created_at.isoformat(), rows[-1].review_id) if has_next else None,
+        **review_summary(stats),
+    }
 
-    # ------------------------------------------------------------------
-    # 4. 주변 인프라 (학교, 공원, 지하철)
-    # ------------------------------------------------------------------
-    INFRA_RADIUS_M = 1000
-    infra_schema = []
 
-    # school
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TSchool.lon, TSchool.lat),  
-        func.Point(b_lon, b_lat)
-    )
+def fetch_review_page(db: Session, building_id: int, after: Optional[list] = None) -> dict:
+    """
+    최신순 리뷰 keyset 페이지.
+    after=(created_at, review_id) 이후의 리뷰를 최대 REVIEW_PAGE_SIZE개 조회하고,
+    개수/평균 평점은 리뷰 집계(t_building_review_stats)에서 PK로 조회한다.
+    """
+    query = select(*REVIEW_COLUMNS).where(TBuildingReview.building_id == building_id)
+    if after is not None:
+        query = query.where(tuple_(TBuildingReview.created_at, TBuildingReview.review_id) < tuple_(*after))
+
+    rows = db.execute(
+        query.order_by(TBuildingReview.created_at.desc(), TBuildingReview.review_id.desc())
+        .limit(REVIEW_PAGE_SIZE + 1)
+    ).all()
+
+    return _review_page(rows, get_review_stats(db, building_id))
+
+
+def fetch_review_pages_many(db: Session, building_ids: list[int]) -> dict[int, dict]:
+    """여러 건물의 리뷰 첫 페이지와 리뷰 집계 (페이지/집계 쿼리 각 한 번)"""
+    ranked = select(
+        *REVIEW_COLUMNS,
+        func.row_number().over(
+            partition_by=TBuildingReview.building_id,
+            order_by=(TBuildingReview.created_at.desc(), TBuildingReview.review_id.desc()),
+        ).label("rn"),
+    ).where(TBuildingReview.building_id.in_(building_ids)).subquery()
+
+    rows = db.execute(
+        select(ranked).where(ranked.c.rn <= REVIEW_PAGE_SIZE + 1).order_by(ranked.c.building_id, ranked.c.rn)
+    ).all()
+    stats = get_review_stats_many(db, building_ids)
+
+    grouped = {building_id: [] for building_id in building_ids}
+    for row in rows:
+        grouped[row.building_id].append(row)
+    return {
+        building_id: _review_page(items, stats.get(building_id))
+        for building_id, items in grouped.items()
+    }
 
-    school_list = db.query(TSchool).filter(distance_expression <= INFRA_RADIUS_M).all()
-    school_result = [
-        NearbyInfrastructure(
-            infra_id=str(s.school_id),
-            infra_category="school",
-            name=s.school_name,
-            address=s.address,
-            latitude=s.lat,
-            longitude=s.lon,
-        )
-        for s in school_list
-    ]
 
-    # subway
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TStation.lon, TStation.lat),  
-        func.Point(b_lon, b_lat)
-    )
+def fetch_first_review_page(db: Session, building_id: int) -> dict:
+    """
+    캐시에 저장할 리뷰 첫 페이지. 캐시를 쓰면 primary에서 조회한다
+    (리뷰 작성 시 무효화된 캐시를 복제가 늦은 레플리카의 이전 페이지로 다시 채우지 않도록).
+    """
+    if not settings.CACHE_ENABLED:
+        return fetch_review_page(db, building_id)
+    return run_on_primary(lambda primary: fetch_review_page(primary, building_id))
+
+
+def fetch_first_review_pages_many(db: Session, building_ids: list[int]) -> dict[int, dict]:
+    """fetch_first_review_page의 여러 건물 버전"""
+    if not settings.CACHE_ENABLED:
+        return fetch_review_pages_many(db, building_ids)
+    return run_on_primary(lambda primary: fetch_review_pages_many(primary, building_ids))
+
+
+def fetch_crime(db: Session, region_name: str):
+    """자치구 범죄/CCTV 지표 (지리 스냅샷이 있으면 스냅샷에서 조회)"""
+    lookup = crime_lookup()
+    if lookup is not None:
+        return lookup.get(region_name)
+    return db.execute(
+        select(
+            TCrimeCCTV.crime_num,
+            TCrimeCCTV.dangerous_rating,
+            TCrimeCCTV.CCTV_security_rating,
+        ).where(TCrimeCCTV.jcg_name == region_name)
+    ).first()
+
+
+def fetch_crimes(db: Session, region_names: set[str]) -> dict:
+    """여러 자치구의 범죄/CCTV 지표 ({자치구: Row})"""
+    lookup = crime_lookup()
+    if lookup is not None:
+        return {name: lookup[name] for name in region_names if name in lookup}
+    rows = db.execute(
+        select(
+            TCrimeCCTV.jcg_name,
+            TCrimeCCTV.crime_num,
+            TCrimeCCTV.dangerous_rating,
+            TCrimeCCTV.CCTV_security_rating,
+        ).where(TCrimeCCTV.jcg_name.in_(region_names))
+    ).all()
+    return {row.jcg_name: row for row in rows}
+
+
+def _load_cached_sections(building_id: int) -> dict:
+    """캐시된 상세 섹션 조회 ({섹션: 데이터 또는 None})"""
+    if not settings.CACHE_ENABLED:
+        return dict.fromkeys(DETAIL_SECTIONS)
+
+    keys = [building_detail_key(building_id, section) for section in DETAIL_SECTIONS]
+    values = cache.get_many(keys)
+    return {
+        section: json.loads(value) if value is not None else None
+        for section, value in zip(DETAIL_SECTIONS, values)
+    }
 
-    station_list = db.query(TStation).filter(distance_expression <= INFRA_RADIUS_M).all()
-    station_result = []
-    for st in station_list:
-        st_complexity = db.query(TPublicTransportByAdminDong).filter(TPublicTransportByAdminDong.station_id == st.station_id).first()
-        ext = None
-        if st_complexity != None:
-            ext = {
-                "passenger_num":st_complexity.passenger_num,
-                "complexity_rating":st_complexity.complexity_rating,
-                "line":st.line
-            }
-            
-            station_result.append(
-                NearbyInfrastructure(
-                    infra_id=str(st.station_id),
-                    infra_category="subway_station",
-                    name=st.station_name,
-                    address=None,
-                    latitude=st.lat,
-                    longitude=st.lon,
-                    extra_data=ext
-                )
-            )
 
-    # park
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TPark.lon, TPark.lat),  
-        func.Point(b_lon, b_lat)
-    )
+def _store_section(building_id: int, section: str, data, ttl: int) -> None:
+    if settings.CACHE_ENABLED:
+        cache.set_json(building_detail_key(building_id, section), data, ttl)
 
-    park_list = db.query(TPark).filter(distance_expression <= INFRA_RADIUS_M).all()
-    park_result = [
-        NearbyInfrastructure(
-            infra_id=p.park_name,
-            infra_category="park",
-            name=p.park_name,
-            address=p.address,
-            latitude=p.lat,
-            longitude=p.lon,
-        )
-        for p in park_list
-    ]
 
-    # ------------------------------------------------------------------
-    # 6. 범죄/CCTV 정보 (자치구)
-    # ------------------------------------------------------------------
-    crime = None
-    region_name = None
-    jcg_name = building.address.split(' ')[0]
-    region_name = jcg_name
-    print()
-
-    crime = (
-        db.query(TCrimeCCTV)
-        .filter(TCrimeCCTV.jcg_name == region_name)
-        .first()
-    )
-    
-    # cctv
-    radius_m = 500
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TCCTVInfo.lon, TCCTVInfo.lat),  
-        func.Point(b_lon, b_lat)
+def neighbourhood_is_complete(neighbourhood) -> bool:
+    """사전 계산된 주변 정보(NEIGHBOURHOOD_COLUMNS를 포함한 Row)가 모든 섹션을 포함하는지 확인"""
+    if neighbourhood is None:
+        return False
+    return all(
+        getattr(neighbourhood, column) is not None
+        for columns in NEIGHBOURHOOD_SECTIONS.values()
+        for column in columns
     )
 
-    cctv_list = db.query(TCCTVInfo).filter(distance_expression <= radius_m).all()
 
-    total_count = db.query(
-        func.sum(TCCTVInfo.cnt)
-    ).filter(
-        distance_expression <= radius_m
-    ).scalar() 
-
-    total_cnt = int(total_count) if total_count is not None else 0
+def neighbourhood_results(neighbourhood) -> dict:
+    """사전 계산된 주변 정보({컬럼: 값})를 실시간 조회 결과와 같은 형태로 변환"""
+    return {
+        "infra": neighbourhood["schools"] + neighbourhood["parks"] + neighbourhood["stations"],
+        "cctv": neighbourhood["real_cctv"],
+        "cctv_count": neighbourhood["cctv_count"],
+        "environment": neighbourhood["nearest_noise"],
+    }
 
-    region_stats = []
 
-    # 범죄지표
-    crime_stat = {
-        "crime_num": crime.crime_num if crime else None,
-        "cctv_num": crime.cctv_num if crime else None,
-        "dangerous_rating": crime.dangerous_rating if crime else None,
-        "cctv_security_rating": crime.CCTV_security_rating if crime else None,
+def live_results(results: dict) -> dict:
+    """실시간 조회 결과를 JSON 직렬화 가능한 형태로 변환"""
+    return {
+        "infra": [i.model_dump(mode="json") for i in results["infra"]],
+        "cctv": [
+            cctv_info_detail(lon=row.lon, lat=row.lat).model_dump(mode="json")
+            for row in results["cctv"]
+        ],
+        "cctv_count": sum(row.cnt or 0 for row in results["cctv"]),
+        "environment": [
+            EnvironmentData(**noise._asdict()).model_dump(mode="json")
+            for _, noise in results["noise"]
+        ],
     }
 
 
-    region_stats.append(
+def build_static_section(building: BuildingDetail, crime, nearby: dict) -> dict:
+    """건물/인프라/범죄/소음/CCTV 섹션 생성 (결과는 JSON 직렬화 가능한 dict)"""
+    region_name = building.address.split(' ')[0]
+
+    # 범죄/CCTV 정보 (자치구) - CCTV 합계는 주변 CCTV 목록에서 계산
+    region_stats = [
         RegionStat(
             region_name=region_name,
-            crime_num=crime_stat["crime_num"],
-            cctv_num=total_cnt,
-            dangerous_rating=crime_stat["dangerous_rating"],
-            cctv_security_rating=crime_stat["cctv_security_rating"],
+            crime_num=crime.crime_num if crime else None,
+            cctv_num=nearby["cctv_count"],
+            dangerous_rating=crime.dangerous_rating if crime else None,
+            cctv_security_rating=crime.CCTV_security_rating if crime else None,
         )
+    ]
+
+    return {
+        "building": building.model_dump(mode="json"),
+        "nearby_infrastructure": nearby["infra"],
+        "region_stats": [r.model_dump(mode="json") for r in region_stats],
+        "environment_data": nearby["environment"],
+        "real_cctv": nearby["cctv"],
+    }
+
+
+def detail_response(sections: dict) -> BuildingDetailResponse:
+    """캐시/조회된 섹션을 최종 응답으로 조립"""
+    review_page = sections["review_page"]
+    return BuildingDetailResponse(
+        **sections["static"],
+        transactions=sections["transactions"],
+        reviews=review_page["items"],
+        reviews_next_cursor=review_page["next_cursor"],
+        review_count=review_page["review_count"],
+        average_rating=review_page["average_rating"],
+        rating_histogram=review_page.get("rating_histogram"),
     )
 
 
+@router.post("/detail", response_model=BuildingDetailResponse)
+def get_building_detail(
+    payload: BuildingRequest,
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_claims),
+):
+    building_id = payload.building_id
+    review_after = decode_review_cursor(payload.review_cursor) if payload.review_cursor else None
+
     # ------------------------------------------------------------------
-    # 8. 환경 데이터 (가장 가까운 noise 지점 1개)
+    # 0. 캐시 조회 (섹션별 TTL: 인프라/범죄/소음은 길게, 리뷰/거래는 짧게)
     # ------------------------------------------------------------------
-    environment_schema = []
+    sections = _load_cached_sections(building_id)
+    tasks = {}
 
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TNoise.lon, TNoise.lat),  
-        func.Point(b_lon, b_lat)
-    )
-
-    near_noise = db.query(TNoise).filter(distance_expression <= INFRA_RADIUS_M).order_by(distance_expression.asc()).limit(1).first()
-    if near_noise:
-        environment_schema.append(
-            EnvironmentData(
-                address=near_noise.address,
-                noise_max=near_noise.noise_max,
-                noise_avg=near_noise.noise_avg,
-                noise_min=near_noise.noise_min,
-                latitude=near_noise.lat,
-                longitude=near_noise.lon,
+    # ------------------------------------------------------------------
+    # 1. 건물 정보 조회 (static 섹션이 캐시에 없을 때만)
+    #    사전 계산된 주변 정보(t_building_neighbourhood)를 PK로 함께 조회
+    # ------------------------------------------------------------------
+    building = None
+    neighbourhood = None
+    if sections["static"] is None:
+        row = db.execute(
+            select(*BUILDING_COLUMNS, *NEIGHBOURHOOD_COLUMNS)
+            .outerjoin(
+                TBuildingNeighbourhood,
+                TBuildingNeighbourhood.building_id == TBuilding.building_id,
             )
-        )
+            .where(TBuilding.building_id == building_id)
+        ).first()
+
+        if not row:
+            raise HTTPException(status_code=404, detail="Building not found")
+
+        # 한 Row에 건물 컬럼과 주변 정보 컬럼이 함께 들어 있음 (스키마에 없는 컬럼은 무시됨)
+        building = to_schema(BuildingDetail, row)
+        neighbourhood = row
+        b_lat = building.latitude
+        b_lon = building.longitude
+        region_name = building.address.split(' ')[0]
+
+        tasks["crime"] = lambda s: fetch_crime(s, region_name)
+
+        # 사전 계산 결과가 없으면 실시간으로 계산
+        if not neighbourhood_is_complete(neighbourhood):
+            tasks.update({
+                "infra": lambda s: nearby_infrastructure(s, b_lat, b_lon, INFRA_RADIUS_M),
+                "cctv": lambda s: nearby_cctv(s, b_lat, b_lon, CCTV_RADIUS_M),
+                "noise": lambda s: nearest_noise(b_lat, b_lon, k=1, max_distance_m=INFRA_RADIUS_M, db=s),
+            })
+
+    if sections["transactions"] is None:
+        tasks["transactions"] = lambda s: fetch_transactions(s, building_id)
+    # 첫 페이지만 캐시하고 커서로 요청한 다음 페이지는 항상 조회
+    if review_after is not None:
+        tasks["review_page"] = lambda s: fetch_review_page(s, building_id, review_after)
+    elif sections["review_page"] is None:
+        tasks["review_page"] = lambda s: fetch_first_review_page(s, building_id)
 
-    infra_schema += school_result + park_result + station_result
+    # ------------------------------------------------------------------
+    # 2~8. 캐시에 없는 섹션의 조회는 병렬로 실행
+    # ------------------------------------------------------------------
+    results = fan_out(tasks, db) if tasks else {}
+
+    if building is not None:
+        if neighbourhood_is_complete(neighbourhood):
+            nearby = neighbourhood_results(neighbourhood._mapping)
+        else:
+            nearby = live_results(results)
+        sections["static"] = build_static_section(building, results["crime"], nearby)
+        _store_section(building_id, "static", sections["static"], settings.DETAIL_CACHE_STATIC_TTL)
+
+    if sections["transactions"] is None:
+        sections["transactions"] = [item.model_dump(mode="json") for item in results["transactions"]]
+        _store_section(building_id, "transactions", sections["transactions"], settings.DETAIL_CACHE_DYNAMIC_TTL)
+
+    if "review_page" in results:
+        sections["review_page"] = results["review_page"]
+        if review_after is None:
+            _store_section(building_id, "review_page", sections["review_page"], settings.DETAIL_CACHE_DYNAMIC_TTL)
 
-    cctv_data = [
-        cctv_info_detail(lon=cctv.lon, lat=cctv.lat)
-        for cctv in cctv_list
-    ]
     # ------------------------------------------------------------------
     # 최종 반환
     # ------------------------------------------------------------------
-    return BuildingDetailResponse(
-        building=building_schema,
-        transactions=transactions_schema,
-        reviews=reviews_schema,
-        nearby_infrastructure=infra_schema,
-        region_stats=region_stats,
-        environment_data=environment_schema,
-        real_cctv=cctv_data
-    )
+    return model_response(detail_response(sections))
@@ -1,26 +1,80 @@
 # BUDONG/api/routers/v1/reviews/get_reviews.py
+"""
+건물 리뷰 목록 (최신순 커서 페이지)
 
-from fastapi import APIRouter, Depends, HTTPException
+(created_at, review_id) 내림차순 keyset 페이지이며 idx_building_created 인덱스를 사용한다.
+첫 페이지는 건물 상세와 같은 "review_page" 캐시 섹션을 공유하므로 리뷰 작성 시 함께 무효화된다.
+ETag는 캐시된 첫 페이지로 만들기 때문에, 캐시가 살아 있는 동안
+If-None-Match로 다시 요청하면 DB 조회 없이 304를 받는다.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
-from BUDONG.api.core.auth import get_current_active_user
-from BUDONG.api.core.database import get_db
+from BUDONG.api.core.auth import get_current_claims
+from BUDONG.api.core.cache import building_detail_key, cache
+from BUDONG.api.core.replica import get_read_db
+from BUDONG.api.core.responses import etag_matches, make_etag, not_modified
+from BUDONG.api.routers.v1.buildings.detail import decode_review_cursor, fetch_first_review_page, fetch_review_page
 from BUDONG.api.schemas.schema_reviews import ReviewFetchRequest, ReviewListResponse
-from BUDONG.api.models.models import TBuildingReview
+from BUDONG.config import settings
 
 router = APIRouter()  # ← THIS MUST EXIST
 
-@router.post("/reviews", response_model=ReviewListResponse)
-def get_reviews_by_building(request: ReviewFetchRequest, db: Session = Depends(get_db), current_user = Depends(get_current_active_user)):
-    # 1) Fetch reviews
-    reviews = db.query(TBuildingReview).filter(
-        TBuildingReview.building_id == request.building_id
-    ).all()
 
-    if not reviews:
+def _first_page(db: Session, building_id: int) -> dict:
+    """리뷰 첫 페이지 (캐시 우선, 없으면 primary에서 조회 후 저장)"""
+    key = building_detail_key(building_id, "review_page")
+    if settings.CACHE_ENABLED:
+        page = cache.get_json(key)
+        if page is not None:
+            return page
+
+    page = fetch_first_review_page(db, building_id)
+    if settings.CACHE_ENABLED:
+        cache.set_json(key, page, settings.DETAIL_CACHE_DYNAMIC_TTL)
+    return page
+
+
+def review_feed(request: Request, db: Session, building_id: int, cursor: Optional[str]):
+    after = decode_review_cursor(cursor) if cursor else None
+
+    # 1) 첫 페이지 (캐시) - 리뷰가 없으면 404
+    first_page = _first_page(db, building_id)
+    if not first_page["items"]:
         raise HTTPException(status_code=404, detail="리뷰가 존재하지 않습니다.")
 
-    # 2) Return response format
-    return {
-        "reviews": reviews,
-        "total_count": len(reviews)
-    }
+    # 2) 첫 페이지가 그대로면 (새 리뷰 없음) 본문을 만들지 않고 304
+    # 이후 페이지도 total_count가 첫 페이지와 함께 바뀌므로 같은 기준을 사용한다
+    etag = make_etag(building_id, cursor, first_page)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    # 3) 이후 페이지는 커서 기준으로 조회
+    page = first_page if after is None else fetch_review_page(db, building_id, after)
+
+    return ORJSONResponse(
+        {
+            "reviews": page["items"],
+            "total_count": first_page["review_count"],
+            "next_cursor": page["next_cursor"],
+        },
+        headers={"ETag": etag},
+    )
+
+
+@router.get("/reviews", response_model=ReviewListResponse)
+def list_reviews_by_building(
+    request: Request,
+    building_id: int = Query(..., description="건물 ID"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_claims),
+):
+    return review_feed(request, db, building_id, cursor)
+
+
+@router.post("/reviews", response_model=ReviewListResponse)
+def get_reviews_by_building(request: Request, payload: ReviewFetchRequest, db: Session = Depends(get_read_db), current_user = Depends(get_current_claims)):
+    return review_feed(request, db, payload.building_id, payload.cursor)
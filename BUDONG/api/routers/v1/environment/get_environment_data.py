@@ -1,15 +1,15 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from BUDONG.api.core.auth import get_current_active_user
-from BUDONG.api.core.database import get_db
-from BUDONG.api.models.models import TNoise
+from BUDONG.api.core.auth import get_current_claims
+from BUDONG.api.core.replica import get_read_db
+from BUDONG.api.core.responses import model_response
+from BUDONG.api.core.noise_index import nearest_noise
 from BUDONG.api.schemas.schema_environment import (
     EnvironmentDataItem,
     EnvironmentDataResponse,
 )
 
-from BUDONG.util.geoutil import haversine
-
 router = APIRouter()
 
 
@@ -17,42 +17,24 @@ router = APIRouter()
 def get_environment_data(
     latitude: float = Query(..., description="위도"),
     longitude: float = Query(..., description="경도"),
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_active_user),
+    k: int = Query(1, ge=1, le=50, description="반환할 가까운 소음 지점 수"),
+    max_distance_meters: Optional[float] = Query(None, gt=0, description="최대 검색 거리 (미터)"),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_claims),
 ):
-    # 모든 noise 지점 조회
-    noise_list = db.query(TNoise).all()
-    if not noise_list:
-        raise HTTPException(status_code=404, detail="환경 데이터가 없습니다.")
-
-    nearest_noise = None
-    min_dist = float("inf")
-
-    for n in noise_list:
-        if n is None:
-            continue
-        if n.lat is None or n.lon is None:
-            continue
-
-        dist = haversine(latitude, longitude, n.lat, n.lon)
-        if dist < min_dist:
-            min_dist = dist
-            nearest_noise = n
+    # kNN 인덱스에서 가까운 noise 지점 조회
+    nearest = nearest_noise(latitude, longitude, k=k, max_distance_m=max_distance_meters, db=db)
 
-    if nearest_noise is None:
+    if not nearest:
         raise HTTPException(status_code=404, detail="가까운 소음 지점을 찾을 수 없습니다.")
 
-    item = EnvironmentDataItem(
-        address=nearest_noise.address,
-        noise_max=nearest_noise.noise_max,
-        noise_avg=nearest_noise.noise_avg,
-        noise_min=nearest_noise.noise_min,
-        latitude=nearest_noise.lat,
-        longitude=nearest_noise.lon,
-    )
+    items = [
+        EnvironmentDataItem(**point._asdict(), distance_meters=dist)
+        for dist, point in nearest
+    ]
 
-    return EnvironmentDataResponse(
-        environment_data=[item],
+    return model_response(EnvironmentDataResponse(
+        environment_data=items,
         latitude=latitude,
         longitude=longitude,
-    )
+    ))
@@ -1,19 +1,15 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from BUDONG.api.core.auth import get_current_active_user
-from BUDONG.api.core.database import get_db
+from BUDONG.api.core.auth import get_current_claims
+from BUDONG.api.core.replica import get_read_db
 from BUDONG.api.exception.global_exception_handler import APIError
-from BUDONG.api.models.models import (
-    TSchool,
-    TPark,
-    TStation,
-)
 from BUDONG.api.schemas.schema_infrastructure import (
     InfrastructureCategoryRequest,
     InfrastructureItem,
     InfrastructureResponse,
 )
-from BUDONG.util.geoutil import haversine
+from BUDONG.api.core.infra_index import get_infra_index
+from BUDONG.api.core.responses import model_response
 
 router = APIRouter()
 
@@ -27,8 +23,8 @@ VALID_CATEGORIES = {
 @router.post("/category", response_model=InfrastructureResponse)
 def search_infrastructure_by_category(
     payload: InfrastructureCategoryRequest,
-    current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_claims),
+    db: Session = Depends(get_read_db)
 ):
     category = payload.category
     lat = payload.latitude
@@ -42,71 +38,11 @@ def search_infrastructure_by_category(
             status_code=400,
         )
 
-    result = []
-
-    # ------------------------------------------------
-    # SCHOOL
-    # ------------------------------------------------
-    if category == "school":
-        items = db.query(TSchool).all()
-        for s in items:
-            if s is None:
-                continue
-            if s.lat is None or s.lon is None:
-                continue
-            dist = haversine(lat, lon, s.lat, s.lon)
-            if dist <= radius:
-                result.append(
-                    InfrastructureItem(
-                        infra_id=str(s.school_id),
-                        infra_category="school",
-                        name=s.school_name,
-                        address=s.address,
-                        latitude=s.lat,
-                        longitude=s.lon,
-                    )
-                )
-
-    # ------------------------------------------------
-    # PARK
-    # ------------------------------------------------
-    elif category == "park":
-        items = db.query(TPark).all()
-        for p in items:
-            if p.lat is None or p.lon is None:
-                continue
-            dist = haversine(lat, lon, p.lat, p.lon)
-            if dist <= radius:
-                result.append(
-                    InfrastructureItem(
-                        infra_id=p.park_name,
-                        infra_category="park",
-                        name=p.park_name,
-                        address=p.address,
-                        latitude=p.lat,
-                        longitude=p.lon,
-                    )
-                )
-
-    # ------------------------------------------------
-    # STATION (지하철역)
-    # ------------------------------------------------
-    elif category == "subway_station":
-        items = db.query(TStation).all()
-        for st in items:
-            if st.lat is None or st.lon is None:
-                continue
-            dist = haversine(lat, lon, st.lat, st.lon)
-            if dist <= radius:
-                result.append(
-                    InfrastructureItem(
-                        infra_id=str(st.station_id),
-                        infra_category="subway_station",
-                        name=st.station_name,
-                        address=None,
-                        latitude=st.lat,
-                        longitude=st.lon,
-                    )
-                )
+    # 시작 시 생성된 메모리 공간 인덱스에서 반경 검색 (테이블 전체 조회 없음)
+    index = get_infra_index(category, db)
+    result = [
+        InfrastructureItem(**point._asdict())
+        for _, point in index.query_radius(lat, lon, radius)
+    ]
 
-    return InfrastructureResponse(infrastructure=result)
+    return model_response(InfrastructureResponse(infrastructure=result))
@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+from BUDONG.api.routers.v1.map import tiles
+
+router = APIRouter()
+
+# 각 라우터 등록
+router.include_router(tiles.router, tags=["map"])
@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, Path
+from BUDONG.api.core.auth import get_current_claims
+from BUDONG.api.core.tile_index import (
+    LAYER_SOURCES,
+    MAX_RAW_POINTS,
+    RAW_POINT_MIN_ZOOM,
+    get_tile_layer,
+)
+from BUDONG.api.core.responses import model_response
+from BUDONG.api.exception.global_exception_handler import APIError
+from BUDONG.api.schemas.schema_map import MapCluster, MapPoint, MapTileResponse
+
+router = APIRouter()
+
+MAX_ZOOM = 22
+
+
+@router.get("/tiles/{layer}/{z}/{x}/{y}", response_model=MapTileResponse)
+def get_map_tile(
+    layer: str,
+    z: int = Path(..., ge=0, le=MAX_ZOOM, description="줌 레벨"),
+    x: int = Path(..., ge=0, description="타일 X"),
+    y: int = Path(..., ge=0, description="타일 Y"),
+    current_user = Depends(get_current_claims),
+):
+    if layer not in LAYER_SOURCES:
+        raise APIError(
+            code="INVALID_LAYER",
+            message=f"'{layer}'는 지원하지 않는 레이어입니다.",
+            status_code=400,
+        )
+    if x >= 1 << z or y >= 1 << z:
+        raise APIError(
+            code="INVALID_TILE",
+            message="줌 레벨 범위를 벗어난 타일 좌표입니다.",
+            status_code=400,
+        )
+
+    tile_layer = get_tile_layer(layer)
+
+    # 고배율에서는 원본 좌표 반환 (상한을 넘으면 클러스터로 대체)
+    if z >= RAW_POINT_MIN_ZOOM:
+        points = tile_layer.raw_points(z, x, y)
+        if len(points) <= MAX_RAW_POINTS:
+            return model_response(MapTileResponse(
+                layer=layer, z=z, x=x, y=y,
+                clustered=False,
+                total_count=sum(p.count for p in points),
+                points=[
+                    MapPoint(id=p.id, name=p.name, latitude=p.latitude, longitude=p.longitude, count=p.count)
+                    for p in points
+                ],
+            ))
+
+    clusters = tile_layer.clusters(z, x, y)
+    return model_response(MapTileResponse(
+        layer=layer, z=z, x=x, y=y,
+        clustered=True,
+        total_count=sum(c.count for c in clusters),
+        clusters=[MapCluster(**c._asdict()) for c in clusters],
+    ))
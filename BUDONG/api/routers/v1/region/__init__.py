@@ -1,7 +1,8 @@
 from fastapi import APIRouter
-from BUDONG.api.routers.v1.region import get_region_stats
+from BUDONG.api.routers.v1.region import bulk_region_stats, get_region_stats
 
 router = APIRouter()
 
 # 각 라우터 등록
-router.include_router(get_region_stats.router, tags=["region"])
\ No newline at end of file
+router.include_router(get_region_stats.router, tags=["region"])
+router.include_router(bulk_region_stats.router, tags=["region"])
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+법정동 통계 일괄 조회 (지도 오버레이용)
+
+bjd_codes 목록, bbox(법정동 중심 좌표 기준) 또는 자치구 코드 중 하나로 범위를 지정한다.
+응답은 사전 계산된 스냅샷(core/region_stats.py)에서 만들며,
+ETag가 스냅샷 버전과 요청 조건으로 정해지므로 같은 화면을 다시 요청하면 304로 끝난다.
+"""
+
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse
+
+from BUDONG.api.core.auth import get_current_claims
+from BUDONG.api.core.region_stats import RegionStats, get_region_snapshot
+from BUDONG.api.core.responses import etag_matches, make_etag, not_modified
+from BUDONG.api.exception.global_exception_handler import APIError
+from BUDONG.api.schemas.schema_region import RegionStatsBulkResponse
+
+router = APIRouter()
+
+MAX_BJD_CODES = 1000
+
+
+def _invalid(message: str) -> APIError:
+    return APIError(code="INVALID_REGION_QUERY", message=message, status_code=400)
+
+
+def _parse_bbox(bbox: str) -> tuple[float, float, float, float]:
+    """'min_lon,min_lat,max_lon,max_lat' → (min_lat, min_lon, max_lat, max_lon)"""
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox.split(","))
+    except ValueError:
+        raise _invalid("bbox는 'min_lon,min_lat,max_lon,max_lat' 형식이어야 합니다.")
+    if min_lat > max_lat or min_lon > max_lon:
+        raise _invalid("bbox의 최솟값이 최댓값보다 큽니다.")
+    return min_lat, min_lon, max_lat, max_lon
+
+
+@router.get("/stats/bulk", response_model=RegionStatsBulkResponse)
+def get_region_stats_bulk(
+    request: Request,
+    bjd_codes: Optional[List[int]] = Query(None, description="법정동 코드 (반복 지정, 최대 1000개)"),
+    bbox: Optional[str] = Query(None, description="min_lon,min_lat,max_lon,max_lat"),
+    ja_chi_gu_code: Optional[int] = Query(None, description="자치구 코드"),
+    format: Literal["rows", "columnar"] = Query("rows", description="rows: 객체 목록, columnar: 필드별 배열"),
+    current_user = Depends(get_current_claims),
+):
+    selectors = [s for s in (bjd_codes, bbox, ja_chi_gu_code) if s is not None]
+    if len(selectors) != 1:
+        raise _invalid("bjd_codes, bbox, ja_chi_gu_code 중 하나만 지정해야 합니다.")
+
+    codes = sorted(set(bjd_codes)) if bjd_codes is not None else None
+    if codes is not None and len(codes) > MAX_BJD_CODES:
+        raise _invalid(f"bjd_codes는 최대 {MAX_BJD_CODES}개까지 지정할 수 있습니다.")
+    box = _parse_bbox(bbox) if bbox is not None else None
+
+    # ------------------------------------------------------------------
+    # 스냅샷 버전 + 조건이 같으면 본문을 만들지 않고 304
+    # ------------------------------------------------------------------
+    snapshot = get_region_snapshot()
+    etag = make_etag(snapshot.version, codes, box, ja_chi_gu_code, format)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    if box is not None:
+        codes = sorted(snapshot.in_bbox(*box))
+    elif ja_chi_gu_code is not None:
+        codes = sorted(snapshot.in_district(ja_chi_gu_code))
+
+    regions = [snapshot.stats[code] for code in codes if code in snapshot.stats]
+
+    content = {"version": snapshot.version, "count": len(regions)}
+    if format == "columnar":
+        content["regions"] = []
+        content["columns"] = {
+            field: [getattr(r, field) for r in regions] for field in RegionStats._fields
+        }
+    else:
+        content["regions"] = [r._asdict() for r in regions]
+        content["columns"] = None
+
+    return ORJSONResponse(content, headers={"ETag": etag})
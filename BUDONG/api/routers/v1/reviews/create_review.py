@@ -1,10 +1,16 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from BUDONG.api.core.database import get_db
 from BUDONG.api.core.auth import get_current_active_user
+from BUDONG.api.core.cache import invalidate_building_detail
+from BUDONG.api.core.review_stats import record_review
 from BUDONG.api.models.models import TBuildingReview, TBuilding
 from BUDONG.api.schemas.schema_reviews import ReviewCreate, ReviewResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 @router.post("/create", response_model=ReviewResponse)
@@ -24,8 +30,19 @@ def create_review(
         content=review.content
     )
     db.add(new_review)
+    db.flush()
+
+    # 리뷰와 건물 리뷰 집계를 같은 트랜잭션으로 저장
+    # 집계 반영이 실패해도 리뷰는 저장 (SAVEPOINT만 되돌리고, 집계는 재계산 작업으로 맞춤)
+    try:
+        with db.begin_nested():
+            record_review(db, new_review.building_id, new_review.rating, new_review.created_at)
+    except Exception as e:
+        logger.warning(f"리뷰 집계 반영 실패 (building_id={new_review.building_id}): {e}")
     db.commit()
-    db.refresh(new_review)
+
+    # 건물 상세의 리뷰 캐시 무효화
+    invalidate_building_detail(review.building_id, "review_page")
 
     return ReviewResponse(
         success=True,
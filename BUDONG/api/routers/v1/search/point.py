@@ -1,11 +1,16 @@
+import json
+from typing import Iterator, Optional
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, literal, null, select, tuple_
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from BUDONG.api.core.auth import get_current_active_user
+from BUDONG.api.core.auth import get_current_claims
 
-from BUDONG.api.core.database import get_db
+from BUDONG.api.core.replica import ReadSessionLocal, get_read_db
+from BUDONG.api.core.responses import model_response
+from BUDONG.api.core.executor import fan_out
 from BUDONG.api.models.models import (
-    TBuilding, TSchool, TStation, TPark
+    TBuilding, TBuildingReviewStats, TSchool, TStation, TPark
 )
 from BUDONG.api.schemas.schema_search import (
     SearchPointRequest,
@@ -13,108 +18,196 @@ from BUDONG.api.schemas.schema_search import (
     SearchPointBuilding,
     SearchPointInfra
 )
-from BUDONG.util.geoutil import haversine
+from BUDONG.api.core.pagination import decode_scoped_cursor, encode_cursor
+from BUDONG.api.core.projections import schema_columns, to_schemas
+from BUDONG.api.core.spatial import distance_expression, within_radius
 
 router = APIRouter()
 
 
+# 응답 스키마에 필요한 컬럼만 Row 튜플로 조회 (ORM 엔티티/TEXT 컬럼 적재 없음)
+BUILDING_COLUMNS = schema_columns(
+    SearchPointBuilding, TBuilding,
+    exclude=("distance_meters",),
+    latitude=TBuilding.lat,
+    longitude=TBuilding.lon,
+    review_count=func.coalesce(TBuildingReviewStats.review_count, 0),
+    average_rating=TBuildingReviewStats.rating_avg,
+)
+# 평점순 정렬 키 (리뷰가 없는 건물은 0점 취급해 마지막)
+RATING_KEY = func.coalesce(TBuildingReviewStats.rating_avg, 0)
+SCHOOL_COLUMNS = schema_columns(
+    SearchPointInfra, TSchool,
+    type=literal("school"), name=TSchool.school_name, latitude=TSchool.lat, longitude=TSchool.lon,
+)
+STATION_COLUMNS = schema_columns(
+    SearchPointInfra, TStation,
+    type=literal("subway_station"), name=TStation.station_name, address=null(),
+    latitude=TStation.lat, longitude=TStation.lon,
+)
+PARK_COLUMNS = schema_columns(
+    SearchPointInfra, TPark,
+    type=literal("park"), name=TPark.park_name, latitude=TPark.lat, longitude=TPark.lon,
+)
+
+
+def search_buildings(
+    db: Session,
+    lat: float,
+    lon: float,
+    radius: int,
+    limit: int,
+    after: Optional[list] = None,
+    sort: str = "distance",
+    min_rating: Optional[float] = None,
+) -> tuple[list[SearchPointBuilding], Optional[tuple]]:
+    """
+    keyset 페이지 조회.
+    거리순은 (거리, building_id) 오름차순, 평점순은 (평균 평점, building_id) 내림차순이며
+    after 이후의 건물을 최대 limit개 반환하고, 다음 페이지가 있으면 마지막 항목의 키를 함께 반환한다.
+    평점은 리뷰 집계(t_building_review_stats)를 PK로 조인해 사용한다.
+    """
+    distance = distance_expression(TBuilding, lat, lon)
+
+    query = (
+        select(*BUILDING_COLUMNS, distance.label("distance_meters"), RATING_KEY.label("rating_key"))
+        .outerjoin(TBuildingReviewStats, TBuildingReviewStats.building_id == TBuilding.building_id)
+        .where(within_radius(TBuilding, lat, lon, radius))
+    )
+    if min_rating is not None:
+        query = query.where(TBuildingReviewStats.rating_avg >= min_rating)
+
+    if sort == "rating":
+        if after is not None:
+            query = query.where(tuple_(RATING_KEY, TBuilding.building_id) < tuple_(*after))
+        query = query.order_by(RATING_KEY.desc(), TBuilding.building_id.desc())
+    else:
+        if after is not None:
+            query = query.where(tuple_(distance, TBuilding.building_id) > tuple_(*after))
+        query = query.order_by(distance, TBuilding.building_id)
+
+    rows = db.execute(query.limit(limit + 1)).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    buildings = to_schemas(SearchPointBuilding, rows)
+    next_key = None
+    if has_next:
+        last = rows[-1]
+        next_key = (last.rating_key if sort == "rating" else last.distance_meters, last.building_id)
+    return buildings, next_key
+
+
+def _search_infra(db: Session, model, columns: list, lat: float, lon: float, radius: int) -> list[SearchPointInfra]:
+    rows = db.execute(select(*columns).where(within_radius(model, lat, lon, radius))).all()
+    return to_schemas(SearchPointInfra, rows)
+
+
+def search_schools(db: Session, lat: float, lon: float, radius: int) -> list[SearchPointInfra]:
+    return _search_infra(db, TSchool, SCHOOL_COLUMNS, lat, lon, radius)
+
+
+def search_stations(db: Session, lat: float, lon: float, radius: int) -> list[SearchPointInfra]:
+    return _search_infra(db, TStation, STATION_COLUMNS, lat, lon, radius)
+
+
+def search_parks(db: Session, lat: float, lon: float, radius: int) -> list[SearchPointInfra]:
+    return _search_infra(db, TPark, PARK_COLUMNS, lat, lon, radius)
+
+
+INFRA_TYPES = ("school", "park", "subway_station")
+
+
+def infra_tasks(lat: float, lon: float, radius: int) -> dict:
+    """인프라(학교, 공원, 역) 조회 작업 (fan_out용)"""
+    return {
+        "school": lambda s: search_schools(s, lat, lon, radius),
+        "park": lambda s: search_parks(s, lat, lon, radius),
+        "subway_station": lambda s: search_stations(s, lat, lon, radius),
+    }
+
+
+def _stream_ndjson(
+    lat: float,
+    lon: float,
+    radius: int,
+    limit: int,
+    after: Optional[list],
+    sort: str,
+    min_rating: Optional[float],
+) -> Iterator[str]:
+    """
+    NDJSON 스트리밍: 한 줄에 한 항목씩 전송한다.
+    건물은 limit개 단위 keyset 페이지로 나누어 조회하므로 메모리에는 한 페이지만 유지된다.
+    """
+    count = 0
+
+    # 인프라는 첫 페이지에만 포함
+    if after is None:
+        results = fan_out(infra_tasks(lat, lon, radius))
+        for item in (i for t in INFRA_TYPES for i in results[t]):
+            count += 1
+            yield f'{{"type":"infrastructure","data":{item.model_dump_json()}}}\n'
+
+    while True:
+        db = ReadSessionLocal()
+        try:
+            buildings, next_key = search_buildings(db, lat, lon, radius, limit, after, sort, min_rating)
+        finally:
+            db.close()
+
+        for b in buildings:
+            count += 1
+            yield f'{{"type":"building","data":{b.model_dump_json()}}}\n'
+
+        if next_key is None:
+            break
+        after = list(next_key)
+
+    yield json.dumps({"type": "end", "search_radius": radius, "result_count": count}) + "\n"
+
+
 @router.post("/point", response_model=SearchPointResponse)
 def search_point(
     payload: SearchPointRequest,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_active_user)
+    db: Session = Depends(get_read_db),
+    current_user = Depends(get_current_claims)
 ):
 
     lat = payload.latitude
     lon = payload.longitude
     radius = payload.radius_meters
-
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TBuilding.lon, TBuilding.lat),  
-        func.Point(lon, lat)
-    )
-
-    building_list = db.query(TBuilding).filter(distance_expression <= radius).all()
-
-    result_buildings = [
-        SearchPointBuilding(
-            building_id=b.building_id,
-            bjd_code=b.bjd_code,
-            address=b.address,
-            building_name=b.building_name,
-            building_type=b.building_type,
-            build_year=b.build_year,
-            total_units=b.total_units,
-            latitude=b.lat,
-            longitude=b.lon
+    limit = payload.limit
+    # 커서는 정렬 기준/최소 평점이 같은 요청에서만 유효 (다르면 400)
+    scope = (payload.sort, payload.min_rating)
+    after = decode_scoped_cursor(payload.cursor, scope, float, int) if payload.cursor else None
+
+    if payload.stream:
+        return StreamingResponse(
+            _stream_ndjson(lat, lon, radius, limit, after, payload.sort, payload.min_rating),
+            media_type="application/x-ndjson",
         )
-        for b in building_list
-    ]
 
     # ================================
-    # 2. 인프라 조회 (학교 + 역 + 공원)
+    # 건물 페이지 + 인프라(학교, 역, 공원) 조회를 병렬로 실행
+    # 인프라는 첫 페이지에만 포함
     # ================================
-
-    # --- 학교 ---
-
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TSchool.lon, TSchool.lat),  
-        func.Point(lon, lat)
-    )
-
-    school_list = db.query(TSchool).filter(distance_expression <= radius).all()
-    school_result = [
-        SearchPointInfra(
-            type="school",
-            name=s.school_name,
-            address=s.address,
-            latitude=s.lat,
-            longitude=s.lon
+    tasks = {
+        "buildings": lambda s: search_buildings(
+            s, lat, lon, radius, limit, after, payload.sort, payload.min_rating
         )
-        for s in school_list
-    ]
+    }
+    if after is None:
+        tasks.update(infra_tasks(lat, lon, radius))
+    results = fan_out(tasks, db)
 
-    # --- 지하철역 ---
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TStation.lon, TStation.lat),  
-        func.Point(lon, lat)
-    )
-
-    station_list = db.query(TStation).filter(distance_expression <= radius).all()
-    station_result = [
-        SearchPointInfra(
-                    type="subway_station",
-                    name=st.station_name,
-                    address=None,
-                    latitude=st.lat,
-                    longitude=st.lon
-        )
-        for st in station_list
-    ]
+    result_buildings, next_key = results["buildings"]
+    infra_results = [i for t in INFRA_TYPES for i in results.get(t, [])]
 
-    distance_expression = func.ST_Distance_Sphere(
-        func.Point(TPark.lon, TPark.lat),  
-        func.Point(lon, lat)
-    )
-
-    # park
-    park_list = db.query(TPark).filter(distance_expression <= radius).all()
-    park_result = [
-        SearchPointInfra(
-            type="park",
-            name=p.park_name,
-            address=p.address,
-            latitude=p.lat,
-            longitude=p.lon
-        )
-        for p in park_list
-    ]
-    
-
-    infra_results = school_result + park_result + station_result
-    return SearchPointResponse(
+    return model_response(SearchPointResponse(
         buildings=result_buildings,
         infrastructure=infra_results,
         search_radius=radius,
-        result_count=len(result_buildings) + len(infra_results)
-    )
+        result_count=len(result_buildings) + len(infra_results),
+        next_cursor=encode_cursor(*scope, *next_key) if next_key else None,
+    ))
@@ -1,24 +1,121 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func, null, select, tuple_
+from sqlalchemy.orm import Session, contains_eager
 from BUDONG.api.core.database import get_db
-from BUDONG.api.models import TUser, TUserSavedBuilding
+from BUDONG.api.core.indexes import transaction_order
+from BUDONG.api.core.pagination import decode_scoped_cursor, encode_cursor
+from BUDONG.api.core.spatial import distance_expression
+from BUDONG.api.exception.global_exception_handler import APIError
+from BUDONG.api.models import TBuilding, TRealTransactionPrice, TUserSavedBuilding
 from BUDONG.api.core.auth import get_current_active_user
-from BUDONG.api.schemas.schema_saved_buildings import SavedBuildingsResponse
+from BUDONG.api.schemas.schema_saved_buildings import SavedBuilding, SavedBuildingsResponse
 
 router = APIRouter()
 
+def latest_price():
+    """건물별 최근 거래가 (상관 서브쿼리, idx_building_tx_day 역방향 스캔으로 한 행)"""
+    return (
+        select(TRealTransactionPrice.price)
+        .where(TRealTransactionPrice.building_id == TUserSavedBuilding.building_id)
+        .order_by(*transaction_order())
+        .limit(1)
+        .correlate(TUserSavedBuilding)
+        .scalar_subquery()
+    )
+
+
+def _sort_key(sort: str, lat: Optional[float], lon: Optional[float]):
+    """정렬 키 식과 방향 (created_at/price는 내림차순, distance는 오름차순)"""
+    if sort == "created_at":
+        return TUserSavedBuilding.created_at, True
+    if sort == "price":
+        # 거래가 없는 건물은 마지막에 오도록 -1로 대체
+        return func.coalesce(latest_price(), -1), True
+    if lat is None or lon is None:
+        raise APIError(
+            code="LOCATION_REQUIRED",
+            message="거리순 정렬에는 latitude, longitude가 필요합니다.",
+            status_code=400,
+        )
+    return distance_expression(TBuilding, lat, lon), False
+
+
+# 정렬별 커서 키 타입 (정렬 값, save_id)
+CURSOR_TYPES = {
+    "created_at": (datetime.fromisoformat, int),
+    "price": (int, int),
+    "distance": (float, int),
+}
+
+
 @router.get("/saved-buildings", response_model=SavedBuildingsResponse)
 def get_saved_buildings(
+    sort: Literal["created_at", "price", "distance"] = Query("created_at", description="정렬 기준"),
+    latitude: Optional[float] = Query(None, description="거리 계산 기준 위도"),
+    longitude: Optional[float] = Query(None, description="거리 계산 기준 경도"),
+    limit: int = Query(50, ge=1, le=200, description="한 번에 반환할 개수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    saved_buildings = (
-        db.query(TUserSavedBuilding)
-        .filter(TUserSavedBuilding.user_id == current_user.user_id)  
-        .all()
+    """
+    찜 목록을 건물 정보와 함께 JOIN 한 번으로 조회한다 (keyset 페이지).
+    전체 개수는 COUNT 집계로 계산한다.
+    """
+    sort_key, descending = _sort_key(sort, latitude, longitude)
+    has_location = latitude is not None and longitude is not None
+    distance = distance_expression(TBuilding, latitude, longitude) if has_location else null()
+
+    query = (
+        select(
+            TUserSavedBuilding,
+            sort_key.label("sort_key"),
+            latest_price().label("latest_price"),
+            distance.label("distance_meters"),
+        )
+        .join(TUserSavedBuilding.building)
+        .options(contains_eager(TUserSavedBuilding.building))
+        .where(TUserSavedBuilding.user_id == current_user.user_id)
     )
 
-    return {
-        "saved_buildings": saved_buildings,
-        "total_count": len(saved_buildings)
-    }
+    if cursor:
+        after = tuple_(*decode_scoped_cursor(cursor, (sort,), *CURSOR_TYPES[sort]))
+        current = tuple_(sort_key, TUserSavedBuilding.save_id)
+        query = query.where(current < after if descending else current > after)
+
+    if descending:
+        query = query.order_by(sort_key.desc(), TUserSavedBuilding.save_id.desc())
+    else:
+        query = query.order_by(sort_key, TUserSavedBuilding.save_id)
+
+    rows = db.execute(query.limit(limit + 1)).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    total_count = db.execute(
+        select(func.count())
+        .select_from(TUserSavedBuilding)
+        .where(TUserSavedBuilding.user_id == current_user.user_id)
+    ).scalar_one()
+
+    saved_buildings = []
+    for row in rows:
+        item = SavedBuilding.model_validate(row.TUserSavedBuilding)
+        item.latest_price = row.latest_price
+        item.distance_meters = row.distance_meters
+        saved_buildings.append(item)
+
+    next_cursor = None
+    if has_next:
+        last = rows[-1]
+        value = last.sort_key.isoformat() if sort == "created_at" else last.sort_key
+        next_cursor = encode_cursor(sort, value, last.TUserSavedBuilding.save_id)
+
+    return SavedBuildingsResponse(
+        saved_buildings=saved_buildings,
+        total_count=total_count,
+        next_cursor=next_cursor,
+    )
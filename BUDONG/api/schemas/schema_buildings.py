@@ -1,12 +1,23 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+from BUDONG.config import settings
 
 # -------------------------
 # 요청 파라미터 
 # -------------------------
 class BuildingRequest(BaseModel):
     building_id: int = Field(..., description="빌딩id")
+    review_cursor: Optional[str] = Field(None, description="이전 응답의 reviews_next_cursor (리뷰 다음 페이지)")
+
+
+class BuildingBatchRequest(BaseModel):
+    building_ids: List[int] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.DETAIL_BATCH_MAX_IDS,
+        description="빌딩id 목록 (최대 DETAIL_BATCH_MAX_IDS개)",
+    )
 
 
 # cctv output
@@ -100,9 +111,17 @@ class EnvironmentData(BaseModel):
 class BuildingDetailResponse(BaseModel):
     building: BuildingDetail
     transactions: List[BuildingTransaction]
-    reviews: List[BuildingReview]
+    reviews: List[BuildingReview]  # 최신순 한 페이지
+    reviews_next_cursor: Optional[str] = None
+    review_count: int = 0
+    average_rating: Optional[float] = None
+    rating_histogram: Optional[List[int]] = None  # 1~5점 리뷰 수
     nearby_infrastructure: List[NearbyInfrastructure]
     region_stats: List[RegionStat]
     environment_data: List[EnvironmentData]
     real_cctv: List[cctv_info_detail]
 
+
+class BuildingDetailBatchResponse(BaseModel):
+    buildings: Dict[int, BuildingDetailResponse]  # building_id → 상세 정보
+    missing_ids: List[int]  # 존재하지 않는 building_id
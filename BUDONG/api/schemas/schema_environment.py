@@ -9,6 +9,7 @@ class EnvironmentDataItem(BaseModel):
     noise_min: Optional[int]
     latitude: Optional[float]
     longitude: Optional[float]
+    distance_meters: Optional[float] = None
 
 
 class EnvironmentDataResponse(BaseModel):
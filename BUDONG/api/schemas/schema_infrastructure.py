@@ -1,11 +1,12 @@
 from pydantic import BaseModel, Field
 from typing import Optional
+from BUDONG.config import settings
 
 class InfrastructureCategoryRequest(BaseModel):
     category: str = Field(..., description="인프라 카테고리")
     latitude: float = Field(..., description="중심 위도")
     longitude: float = Field(..., description="중심 경도")
-    radius_meters: int = Field(..., description="검색 반경 (미터)")
+    radius_meters: int = Field(..., ge=1, le=settings.INFRA_RADIUS_MAX_M, description="검색 반경 (미터)")
 
 
 class InfrastructureItem(BaseModel):
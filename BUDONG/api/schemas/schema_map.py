@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class MapCluster(BaseModel):
+    count: int = Field(..., description="클러스터 내 개수 (CCTV는 대수 합계)")
+    latitude: float = Field(..., description="클러스터 중심 위도")
+    longitude: float = Field(..., description="클러스터 중심 경도")
+
+
+class MapPoint(BaseModel):
+    id: str
+    name: Optional[str]
+    latitude: float
+    longitude: float
+    count: int
+
+
+class MapTileResponse(BaseModel):
+    layer: str
+    z: int
+    x: int
+    y: int
+    clustered: bool = Field(..., description="true면 clusters, false면 points에 결과가 담김")
+    total_count: int
+    clusters: list[MapCluster] = []
+    points: list[MapPoint] = []
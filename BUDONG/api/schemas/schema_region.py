@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class RegionStatsItem(BaseModel):
@@ -23,3 +23,31 @@ class RegionInfo(BaseModel):
 class RegionStatsResponse(BaseModel):
     region_stats: RegionStatsItem
     region: RegionInfo
+
+
+# -------------------------
+# 법정동 통계 일괄 조회 (지도 오버레이)
+# -------------------------
+class RegionStatsBulkItem(BaseModel):
+    bjd_code: int
+    bjd_name: Optional[str]
+    region_name_full: Optional[str]
+    ja_chi_gu_code: Optional[int]
+    latitude: Optional[float]   # 법정동 중심 (건물 좌표 평균)
+    longitude: Optional[float]
+    crime_num: Optional[int]
+    cctv_num: Optional[int]
+    dangerous_rating: Optional[int]
+    cctv_security_rating: Optional[int]
+    passenger_num: Optional[int]
+    complexity_rating: Optional[int]
+    noise_max: Optional[int]
+    noise_avg: Optional[int]
+    noise_min: Optional[int]
+
+
+class RegionStatsBulkResponse(BaseModel):
+    version: str                    # 통계 스냅샷 버전
+    count: int
+    regions: List[RegionStatsBulkItem] = []                 # format=rows
+    columns: Optional[Dict[str, List[Any]]] = None          # format=columnar (필드별 값 배열)
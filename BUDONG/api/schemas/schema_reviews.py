@@ -1,17 +1,18 @@
 # BUDONG/api/schemas/schema_reviews.py
 
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
 from datetime import datetime
 
 
 # --- 요청(Request) ---
 class ReviewFetchRequest(BaseModel):
     building_id: int
+    cursor: Optional[str] = None  # 이전 응답의 next_cursor
 
 class ReviewCreate(BaseModel):
     building_id: int
-    rating: int
+    rating: int = Field(..., ge=1, le=5)
     content: str
 
 
@@ -19,21 +20,21 @@ class ReviewCreate(BaseModel):
 
 # 개별 리뷰 (SQLAlchemy → Pydantic 변환 허용)
 class ReviewItem(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     review_id: int
     user_id: int
     building_id: int
     rating: int
-    content: str
+    content: Optional[str]
     created_at: datetime
 
-    class Config:
-        orm_mode = True
-
 
 # 리뷰 목록 응답
 class ReviewListResponse(BaseModel):
-    reviews: List[ReviewItem]
+    reviews: List[ReviewItem]  # 최신순 한 페이지
     total_count: int
+    next_cursor: Optional[str] = None
 
 
 # 리뷰 생성 응답
@@ -1,17 +1,16 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import List, Optional
 
 class Building(BaseModel):
     building_id: int
     address: str
-    building_name: str
-    building_type: str
-    build_year: int
-    total_units: int
+    building_name: Optional[str]
+    building_type: Optional[str]
+    build_year: Optional[int]
+    total_units: Optional[int]
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class SavedBuilding(BaseModel):
     save_id: int
@@ -20,12 +19,14 @@ class SavedBuilding(BaseModel):
     memo: str | None
     created_at: datetime
     building: Building | None  # 🔥 Include joined building data
+    latest_price: Optional[int] = None  # 최근 실거래가
+    distance_meters: Optional[float] = None  # 기준 좌표를 준 경우에만
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class SavedBuildingsResponse(BaseModel):
     saved_buildings: list[SavedBuilding]
     total_count: int
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달
 class DeleteBuildingRequest(BaseModel):
     save_id: int
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 
 # 요청 스키마
@@ -7,6 +7,11 @@ class SearchPointRequest(BaseModel):
     latitude: float = Field(..., description="검색 중심 위도")
     longitude: float = Field(..., description="검색 중심 경도")
     radius_meters: int = Field(..., ge=1, description="검색 반경 (미터)")
+    limit: int = Field(100, ge=1, le=1000, description="한 번에 반환할 건물 수")
+    cursor: Optional[str] = Field(None, description="이전 응답의 next_cursor (같은 sort/min_rating의 다음 페이지)")
+    sort: Literal["distance", "rating"] = Field("distance", description="건물 정렬 기준 (거리순/평균 평점순)")
+    min_rating: Optional[float] = Field(None, ge=1, le=5, description="최소 평균 평점")
+    stream: bool = Field(False, description="NDJSON 스트리밍 응답 여부")
 
 
 class SearchPointBuilding(BaseModel):
@@ -19,6 +24,9 @@ class SearchPointBuilding(BaseModel):
     total_units: Optional[int]
     latitude: float
     longitude: float
+    review_count: int = 0
+    average_rating: Optional[float] = None
+    distance_meters: Optional[float] = None
 
 
 class SearchPointInfra(BaseModel):
@@ -35,3 +43,4 @@ class SearchPointResponse(BaseModel):
     infrastructure: List[SearchPointInfra]
     search_radius: int
     result_count: int
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
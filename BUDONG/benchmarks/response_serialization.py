@@ -0,0 +1,126 @@
+"""
+응답 직렬화 벤치마크 (DB 불필요)
+
+가장 큰 응답인 /search/point, /buildings/detail 형태의 모델을 만들어
+세 가지 경로의 응답 생성 시간(검증 + 인코딩 + 렌더링)을 비교한다.
+
+    baseline : JSONResponse + response_model 재검증 (기존)
+    orjson   : ORJSONResponse 기본 응답 클래스 + response_model 재검증
+    fast     : model_response() (재검증 생략, pydantic-core 직렬화)
+
+    python -m BUDONG.benchmarks.response_serialization [반복 횟수]
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from BUDONG.api.core.responses import PydanticJSONResponse
+from BUDONG.api.schemas.schema_buildings import BuildingDetailResponse
+from BUDONG.api.schemas.schema_search import SearchPointResponse
+
+
+def search_payload(n_buildings: int = 1000, n_infra: int = 300) -> SearchPointResponse:
+    return SearchPointResponse(
+        buildings=[
+            {
+                "building_id": i,
+                "bjd_code": 1168010100,
+                "address": f"서울특별시 강남구 역삼동 {i}",
+                "building_name": f"건물 {i}",
+                "building_type": "아파트",
+                "build_year": 2005,
+                "total_units": 120,
+                "latitude": 37.5 + i * 1e-5,
+                "longitude": 127.03 + i * 1e-5,
+                "distance_meters": float(i),
+            }
+            for i in range(n_buildings)
+        ],
+        infrastructure=[
+            {
+                "type": "school",
+                "name": f"학교 {i}",
+                "address": f"서울특별시 강남구 {i}",
+                "latitude": 37.5,
+                "longitude": 127.03,
+            }
+            for i in range(n_infra)
+        ],
+        search_radius=1000,
+        result_count=n_buildings + n_infra,
+    )
+
+
+def detail_payload(n_infra: int = 200, n_cctv: int = 150, n_reviews: int = 50) -> BuildingDetailResponse:
+    return BuildingDetailResponse(
+        building={
+            "building_id": 1, "bjd_code": 1168010100, "address": "서울특별시 강남구 역삼동 1",
+            "building_name": "건물", "building_type": "아파트", "build_year": "2005",
+            "total_units": "120", "latitude": 37.5, "longitude": 127.03,
+        },
+        transactions=[
+            {"tx_id": i, "building_id": 1, "transaction_date": "2024-01-01",
+             "price": 100000, "area_sqm": 84.9, "floor": 10}
+            for i in range(10)
+        ],
+        reviews=[
+            {"review_id": i, "user_id": i, "building_id": 1, "rating": 4,
+             "content": "좋아요 " * 20, "created_at": datetime(2024, 1, 1)}
+            for i in range(n_reviews)
+        ],
+        nearby_infrastructure=[
+            {"infra_id": str(i), "infra_category": "subway_station", "name": f"역 {i}",
+             "address": None, "latitude": 37.5, "longitude": 127.03,
+             "extra_data": {"passenger_num": 1000, "complexity_rating": 3, "line": "2호선"}}
+            for i in range(n_infra)
+        ],
+        region_stats=[
+            {"region_name": "강남구", "crime_num": 100, "cctv_num": 1000,
+             "dangerous_rating": 3, "cctv_security_rating": 4}
+        ],
+        environment_data=[
+            {"address": "역삼동", "noise_max": 70, "noise_avg": 55, "noise_min": 40,
+             "latitude": 37.5, "longitude": 127.03}
+        ],
+        real_cctv=[{"lon": 127.03, "lat": 37.5} for _ in range(n_cctv)],
+    )
+
+
+async def render(route: APIRoute, model, mode: str) -> bytes:
+    """FastAPI가 응답 하나를 만드는 과정 (검증 + 인코딩 + 렌더링)"""
+    if mode == "fast":
+        return PydanticJSONResponse(model).body
+
+    content = await serialize_response(
+        field=route.secure_cloned_response_field,
+        response_content=model,
+        is_coroutine=True,
+    )
+    response_class = ORJSONResponse if mode == "orjson" else JSONResponse
+    return response_class(content).body
+
+
+async def run(iterations: int) -> None:
+    payloads = {"search_point": search_payload(), "building_detail": detail_payload()}
+
+    print(f"{'endpoint':<18}{'mode':<10}{'ms/req':>10}{'bytes':>10}")
+    for name, model in payloads.items():
+        route = APIRoute(f"/{name}", endpoint=lambda: None, response_model=type(model))
+        baseline_ms = None
+        for mode in ("baseline", "orjson", "fast"):
+            body = await render(route, model, mode)  # warm-up
+            start = time.perf_counter()
+            for _ in range(iterations):
+                await render(route, model, mode)
+            ms = (time.perf_counter() - start) / iterations * 1000
+            baseline_ms = baseline_ms or ms
+            print(f"{name:<18}{mode:<10}{ms:>10.2f}{len(body):>10}  (x{baseline_ms / ms:.1f})")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -9,15 +9,63 @@ class Settings(BaseSettings):
     MYSQL_USER: str = os.getenv("MYSQL_USER")
     MYSQL_PASSWORD: str = os.getenv("MYSQL_PASSWORD")
     MYSQL_DATABASE: str = os.getenv("MYSQL_DATABASE")
+
+    # Connection pool (동기/비동기 엔진 공통)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 10  # 체크아웃 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 300
+    DB_POOL_PRE_PING: str = "idle"  # always: 매 체크아웃마다 / idle: 오래 쉰 커넥션만 / none
+    DB_POOL_PRE_PING_IDLE_SECONDS: int = 30
+
+    # Read replicas (읽기 전용 라우터용, 비워두면 primary 사용)
+    DB_REPLICA_URLS: str = ""  # 쉼표로 구분한 SQLAlchemy URL
+    DB_REPLICA_WEIGHTS: str = ""  # 쉼표로 구분한 가중치 (미지정 시 균등)
+    DB_REPLICA_MAX_LAG_SECONDS: int = 5  # 초과 시 해당 레플리카 제외
+    DB_REPLICA_CHECK_INTERVAL: int = 10  # 상태/지연 확인 주기 (초)
+    
+    # Redis
+    REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
+    REDIS_PORT: int = os.getenv("REDIS_PORT", 6379)
+    REDIS_DB: int = os.getenv("REDIS_DB", 0)
+
+    # Cache
+    CACHE_ENABLED: bool = True
+    LOCAL_CACHE_MAX_ITEMS: int = 2048  # Redis 장애 시 사용하는 프로세스 내 LRU 크기
+    DETAIL_CACHE_STATIC_TTL: int = 3600  # 인프라/소음/범죄 (거의 변하지 않음)
+    DETAIL_CACHE_DYNAMIC_TTL: int = 60  # 리뷰/실거래가
+    DETAIL_BATCH_MAX_IDS: int = 50  # /buildings/details 한 번에 조회할 수 있는 건물 수
+    PRINCIPAL_CACHE_TTL: int = 60  # 인증 사용자 정보
+    PRINCIPAL_CACHE_REDIS: bool = True  # False면 프로세스 내 LRU만 사용
     
     # API
     API_V1_PREFIX: str = "/api/v1"
+    FAST_JSON_RESPONSES: bool = True  # 응답 모델 재검증 생략 (core.responses.model_response)
     
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    ADMIN_USER_IDS: str = ""  # 쉼표로 구분한 관리자 회원 ID (t_user에 role 컬럼이 없어 /admin API는 이 목록으로 허용)
+
+    # Query fan-out (독립 조회 병렬 실행)
+    QUERY_FANOUT_ENABLED: bool = True
+    QUERY_FANOUT_MAX_WORKERS: int = 8  # DB 커넥션 풀 크기를 넘지 않도록 설정
+
+    # Auth worker pool (bcrypt 해싱을 이벤트 루프 밖에서 실행)
+    AUTH_POOL_MAX_WORKERS: int = 4
+    AUTH_POOL_MAX_QUEUE: int = 64  # 초과 시 503
+
+    # Geo index
+    SPATIAL_AUTO_MIGRATE: bool = False  # 시작 시 geom 컬럼/SPATIAL INDEX 자동 적용 (기본은 CLI로 별도 실행, 적용 전에는 lat/lon 조건으로 검색)
+    INDEX_AUTO_MIGRATE: bool = False  # 시작 시 조회용 생성 컬럼/보조 인덱스 자동 생성 (기본은 CLI로 별도 실행, core/indexes.py)
+    INFRA_RADIUS_MAX_M: int = 20000  # /infrastructure/category 검색 반경 상한 (미터)
+    NOISE_INDEX_REFRESH_SECONDS: int = 300  # t_noise 변경 여부 확인 주기
+    NEIGHBOURHOOD_INDEX_TTL: int = 3600  # 건물 주변 정보 실시간 계산용 섹션 인덱스 재로딩 주기
+    TILE_CACHE_TTL: int = 3600  # 지도 타일 레이어 재로딩 주기
+    REGION_STATS_TTL: int = 3600  # 법정동 통계 스냅샷 재계산 주기
+    GEO_SNAPSHOT_PATH: str = ""  # 참조 데이터 컬럼형 스냅샷 (설정 시 인프라/소음/타일 인덱스가 DB 대신 사용)
     
     class Config:
         env_file = ".env"
@@ -26,6 +74,12 @@ class Settings(BaseSettings):
     def get_database_url(self) -> str:
         return f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
 
+    def get_admin_user_ids(self) -> set[int]:
+        return {int(v) for v in self.ADMIN_USER_IDS.split(",") if v.strip()}
+
+    def get_async_database_url(self) -> str:
+        return f"mysql+asyncmy://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+
 
 settings = Settings()
 
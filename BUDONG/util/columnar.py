@@ -0,0 +1,195 @@
+"""
+읽기 전용 컬럼형 파일 포맷 (mmap 공유용)
+
+    [magic 8B][header 길이 8B][header JSON][8바이트 정렬된 데이터 블록...]
+
+header에는 테이블별 행 수와 컬럼별 타입/블록 위치가 들어 있다.
+    - 숫자 컬럼("f4", "f8", "i8"): 고정 길이 배열
+    - 문자열 컬럼("str"): int64 오프셋 배열(행 수 + 1) + UTF-8 데이터
+    - NULL이 있는 컬럼: 행마다 1바이트 NULL 마스크 블록 추가
+
+ColumnarFile은 파일을 mmap 하므로 같은 파일을 여는 모든 프로세스가
+하나의 물리 메모리(페이지 캐시)를 공유하고, 숫자 컬럼은 복사 없이 NumPy 배열로 읽는다.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+import numpy as np
+
+MAGIC = b"BDCOL\x00\x01\x00"
+NUMERIC_TYPES = {"f4": np.float32, "f8": np.float64, "i8": np.int64}
+ALIGN = 8
+
+
+def _pad(n: int) -> int:
+    return (-n) % ALIGN
+
+
+def write_columnar(path: str, tables: dict[str, dict[str, tuple[str, Sequence[Any]]]], meta: Optional[dict] = None) -> None:
+    """
+    {테이블: {컬럼: (타입, 값 목록)}}을 파일로 기록한다.
+    임시 파일에 쓴 뒤 rename 하므로 읽는 쪽은 항상 완성된 파일만 본다.
+    """
+    blocks: list[bytes] = []
+    offset = 0
+
+    def add_block(data: bytes) -> dict:
+        nonlocal offset
+        ref = {"offset": offset, "nbytes": len(data)}
+        blocks.append(data + b"\x00" * _pad(len(data)))
+        offset += len(data) + _pad(len(data))
+        return ref
+
+    header: dict = {"meta": meta or {}, "tables": {}}
+    for table, columns in tables.items():
+        lengths = {len(values) for _, values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"{table}: 컬럼 길이가 서로 다릅니다 {lengths}")
+
+        table_header = {"rows": lengths.pop() if lengths else 0, "columns": {}}
+        for name, (col_type, values) in columns.items():
+            nulls = np.fromiter((v is None for v in values), dtype=np.uint8, count=len(values))
+            col: dict = {"type": col_type}
+
+            if col_type in NUMERIC_TYPES:
+                fill = np.nan if col_type.startswith("f") else 0
+                array = np.array(
+                    [fill if v is None else v for v in values], dtype=NUMERIC_TYPES[col_type]
+                )
+                col["data"] = add_block(array.tobytes())
+            elif col_type == "str":
+                encoded = [b"" if v is None else str(v).encode("utf-8") for v in values]
+                offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+                np.cumsum([len(e) for e in encoded], out=offsets[1:])
+                col["offsets"] = add_block(offsets.tobytes())
+                col["data"] = add_block(b"".join(encoded))
+            else:
+                raise ValueError(f"{table}.{name}: 지원하지 않는 타입 {col_type}")
+
+            if nulls.any():
+                col["nulls"] = add_block(nulls.tobytes())
+            table_header["columns"][name] = col
+        header["tables"][table] = table_header
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    header_bytes += b" " * _pad(len(MAGIC) + 8 + len(header_bytes))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header_bytes)))
+        f.write(header_bytes)
+        for block in blocks:
+            f.write(block)
+    os.replace(tmp_path, path)
+
+
+class StringColumn:
+    """오프셋 테이블 기반 문자열 컬럼 (접근 시에만 디코딩)"""
+
+    def __init__(self, buf: memoryview, offsets: np.ndarray, nulls: Optional[np.ndarray]):
+        self._buf = buf
+        self._offsets = offsets
+        self._nulls = nulls
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        if self._nulls is not None and self._nulls[i]:
+            return None
+        return bytes(self._buf[self._offsets[i]:self._offsets[i + 1]]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return (self[i] for i in range(len(self)))
+
+
+class ColumnarTable:
+    def __init__(self, file: "ColumnarFile", name: str, header: dict):
+        self._file = file
+        self.name = name
+        self.rows: int = header["rows"]
+        self._columns: dict = header["columns"]
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self._columns)
+
+    def nulls(self, name: str) -> Optional[np.ndarray]:
+        ref = self._columns[name].get("nulls")
+        return None if ref is None else self._file._array(ref, np.uint8)
+
+    def column(self, name: str):
+        """숫자 컬럼은 mmap 위의 읽기 전용 NumPy 배열, 문자열 컬럼은 StringColumn"""
+        col = self._columns[name]
+        if col["type"] == "str":
+            offsets = self._file._array(col["offsets"], np.int64)
+            return StringColumn(self._file._block(col["data"]), offsets, self.nulls(name))
+        return self._file._array(col["data"], NUMERIC_TYPES[col["type"]])
+
+    def values(self, name: str) -> list:
+        """컬럼 값을 Python 목록으로 (NULL은 None)"""
+        col = self.column(name)
+        if isinstance(col, StringColumn):
+            return list(col)
+        nulls = self.nulls(name)
+        values = col.tolist()
+        if nulls is not None:
+            values = [None if n else v for v, n in zip(values, nulls)]
+        return values
+
+    def accessor(self, name: str) -> Callable[[int], Any]:
+        """행 번호 → 값 함수 (NULL은 None). 목록을 만들지 않고 필요한 행만 mmap에서 읽는다"""
+        col = self.column(name)
+        if isinstance(col, StringColumn):
+            return col.__getitem__
+
+        nulls = self.nulls(name)
+
+        def get(i: int):
+            if nulls is not None and nulls[i]:
+                return None
+            return col[i].item()
+
+        return get
+
+    def rows_iter(self, *names: str) -> Iterator[tuple]:
+        """지정한 컬럼들의 행 튜플"""
+        return zip(*(self.values(name) for name in names))
+
+
+class ColumnarFile:
+    """write_columnar로 만든 파일을 mmap으로 연다"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"컬럼형 파일이 아닙니다: {path}")
+        (header_len,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(self._mmap[header_start:header_start + header_len]))
+
+        self._data_start = header_start + header_len
+        self._view = memoryview(self._mmap)
+        self.meta: dict = header["meta"]
+        self.tables = {name: ColumnarTable(self, name, h) for name, h in header["tables"].items()}
+
+    def _block(self, ref: dict) -> memoryview:
+        start = self._data_start + ref["offset"]
+        return self._view[start:start + ref["nbytes"]]
+
+    def _array(self, ref: dict, dtype) -> np.ndarray:
+        return np.frombuffer(self._block(ref), dtype=dtype)
+
+    def table(self, name: str) -> ColumnarTable:
+        return self.tables[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.tables
@@ -0,0 +1,374 @@
+import heapq
+import itertools
+import math
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+import numpy as np
+
+from BUDONG.util.geoutil import bounding_box, nearest_k, radius_mask
+
+
+def _cells_in_range(cells: dict, low: tuple[int, int], high: tuple[int, int]) -> list[tuple[int, int]]:
+    """
+    격자 범위 low~high 안에서 점이 있는 셀 목록.
+    범위의 셀 수가 점이 있는 셀 수보다 많으면 (큰 반경) 범위 대신 점이 있는 셀을 순회해
+    조회 비용이 반경의 제곱이 아니라 데이터 크기를 넘지 않도록 한다.
+    """
+    (min_row, min_col), (max_row, max_col) = low, high
+    if (max_row - min_row + 1) * (max_col - min_col + 1) > len(cells):
+        return [
+            cell for cell in cells
+            if min_row <= cell[0] <= max_row and min_col <= cell[1] <= max_col
+        ]
+    return [
+        (row, col)
+        for row in range(min_row, max_row + 1)
+        for col in range(min_col, max_col + 1)
+        if (row, col) in cells
+    ]
+
+
+class GridIndex:
+    """
+    위경도 격자(버킷) 기반의 메모리 공간 인덱스.
+    반경 검색 시 반경을 덮는 격자 셀의 후보만 Haversine으로 정밀 비교한다.
+    후보 거리는 셀별 좌표 배열을 이어 붙여 한 번의 NumPy 연산으로 계산한다.
+    """
+
+    def __init__(self, cell_deg: float = 0.01):
+        self.cell_deg = cell_deg
+        self._cells: dict[tuple[int, int], list[tuple[float, float, Any]]] = {}
+        # 셀별 (lats, lons) 배열 캐시, 삽입 시 해당 셀만 무효화
+        self._arrays: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def insert(self, lat: float, lon: float, item: Any) -> None:
+        cell = self._cell(lat, lon)
+        self._cells.setdefault(cell, []).append((lat, lon, item))
+        self._arrays.pop(cell, None)
+        self._size += 1
+
+    def _cell_arrays(self, cell: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+        arrays = self._arrays.get(cell)
+        if arrays is None:
+            bucket = self._cells[cell]
+            arrays = (
+                np.fromiter((p[0] for p in bucket), dtype=np.float64, count=len(bucket)),
+                np.fromiter((p[1] for p in bucket), dtype=np.float64, count=len(bucket)),
+            )
+            self._arrays[cell] = arrays
+        return arrays
+
+    @classmethod
+    def build(
+        cls, points: Iterable[tuple[float, float, Any]], cell_deg: float = 0.01
+    ) -> "GridIndex":
+        """(lat, lon, item) 목록으로 인덱스 생성 (좌표가 없는 항목은 제외)"""
+        index = cls(cell_deg)
+        for lat, lon, item in points:
+            if lat is None or lon is None:
+                continue
+            index.insert(lat, lon, item)
+        return index
+
+    def query_radius(
+        self, lat: float, lon: float, radius_m: float
+    ) -> list[tuple[float, Any]]:
+        """
+        중심 좌표로부터 radius_m 이내 항목을 (거리, item) 목록으로 반환한다.
+        결과는 거리 오름차순으로 정렬된다.
+        """
+        min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, radius_m)
+        cells = _cells_in_range(self._cells, self._cell(min_lat, min_lon), self._cell(max_lat, max_lon))
+        if not cells:
+            return []
+
+        arrays = [self._cell_arrays(cell) for cell in cells]
+        mask, dist = radius_mask(
+            lat, lon,
+            np.concatenate([a[0] for a in arrays]),
+            np.concatenate([a[1] for a in arrays]),
+            radius_m,
+        )
+        idx = np.flatnonzero(mask)
+        if idx.size == 0:
+            return []
+
+        items = [p[2] for cell in cells for p in self._cells[cell]]
+        idx = idx[np.argsort(dist[idx], kind="stable")]
+        return [(float(dist[i]), items[i]) for i in idx]
+
+
+class ArrayGridIndex:
+    """
+    좌표 배열을 복사하지 않고 사용하는 읽기 전용 격자 인덱스 (GridIndex와 같은 조회 API).
+    lats/lons는 mmap 위의 NumPy 배열이어도 되며, 프로세스마다 만드는 것은
+    셀 순서로 정렬한 행 번호 배열과 셀 → 구간 딕셔너리뿐이다.
+    항목은 결과에 포함된 행에 대해서만 item(row)로 만든다.
+    """
+
+    def __init__(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        item: Callable[[int], Any],
+        cell_deg: float = 0.01,
+    ):
+        self.cell_deg = cell_deg
+        self._lats = lats
+        self._lons = lons
+        self._item = item
+
+        # 좌표가 없는(NaN) 행 제외
+        valid = np.flatnonzero(~(np.isnan(lats) | np.isnan(lons)))
+        rows = np.floor(lats[valid] / cell_deg).astype(np.int64)
+        cols = np.floor(lons[valid] / cell_deg).astype(np.int64)
+        order = np.lexsort((cols, rows))
+        rows, cols = rows[order], cols[order]
+        self._rows = valid[order]
+
+        # 셀이 바뀌는 위치로 구간 분할
+        bounds = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 0)) + 1
+        starts = np.concatenate(([0], bounds)) if self._rows.size else np.empty(0, dtype=np.int64)
+        ends = np.append(starts[1:], self._rows.size)
+        self._cells: dict[tuple[int, int], tuple[int, int]] = {
+            (int(rows[s]), int(cols[s])): (int(s), int(e)) for s, e in zip(starts, ends)
+        }
+
+    def __len__(self) -> int:
+        return int(self._rows.size)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg)
+
+    def _within(self, lat: float, lon: float, radius_m: float) -> tuple[np.ndarray, np.ndarray]:
+        """반경 안의 (행 번호, 거리)를 거리 오름차순으로"""
+        min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, radius_m)
+        spans = [
+            self._cells[cell]
+            for cell in _cells_in_range(self._cells, self._cell(min_lat, min_lon), self._cell(max_lat, max_lon))
+        ]
+        if not spans:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        candidates = np.concatenate([self._rows[s:e] for s, e in spans])
+        mask, dist = radius_mask(lat, lon, self._lats[candidates], self._lons[candidates], radius_m)
+        idx = np.flatnonzero(mask)
+        idx = idx[np.argsort(dist[idx], kind="stable")]
+        return candidates[idx], dist[idx]
+
+    def query_radius(
+        self, lat: float, lon: float, radius_m: float
+    ) -> list[tuple[float, Any]]:
+        """중심 좌표로부터 radius_m 이내 항목을 거리 오름차순 (거리, item) 목록으로 반환"""
+        rows, dist = self._within(lat, lon, radius_m)
+        return [(float(d), self._item(int(r))) for r, d in zip(rows, dist)]
+
+    def query_nearest(
+        self, lat: float, lon: float, k: int = 1, max_distance_m: Optional[float] = None
+    ) -> list[tuple[float, Any]]:
+        """
+        KDTree.query_nearest와 같은 결과 (격자 후보만 비교).
+        반경이 없으면 한 셀 크기부터 반경을 두 배씩 넓혀 k개 이상 찾을 때까지 검색한다
+        (반경 안에 k개가 있으면 최근접 k개는 모두 그 안에 있음).
+        """
+        if k <= 0 or self._rows.size == 0:
+            return []
+        if max_distance_m is not None:
+            rows, dist = self._within(lat, lon, max_distance_m)
+        else:
+            radius = math.radians(self.cell_deg) * EARTH_RADIUS_M
+            while radius < math.pi * EARTH_RADIUS_M:
+                rows, dist = self._within(lat, lon, radius)
+                if rows.size >= k:
+                    break
+                radius *= 2
+            else:
+                idx, dist = nearest_k(lat, lon, self._lats[self._rows], self._lons[self._rows], k)
+                rows = self._rows[idx]
+        return [(float(d), self._item(int(r))) for r, d in zip(rows[:k], dist[:k])]
+
+
+EARTH_RADIUS_M = 6371000.0
+
+
+def _to_unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    return (math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi))
+
+
+def _chord_to_meters(chord: float) -> float:
+    return 2 * EARTH_RADIUS_M * math.asin(min(chord / 2, 1.0))
+
+
+def _meters_to_chord(meters: float) -> float:
+    return 2 * math.sin(min(meters / EARTH_RADIUS_M, math.pi) / 2)
+
+
+class _KDNode:
+    __slots__ = ("point", "key", "item", "axis", "left", "right", "deleted")
+
+    def __init__(self, point, key, item, axis):
+        self.point = point
+        self.key = key
+        self.item = item
+        self.axis = axis
+        self.left = None
+        self.right = None
+        self.deleted = False
+
+
+class KDTree:
+    """
+    최근접 이웃(kNN) 검색용 KD-트리.
+    좌표를 단위 구 위의 3차원 벡터로 변환해 저장하므로 유클리드(현) 거리 순서가
+    대권 거리 순서와 같다. 균형 트리에서 검색은 평균 O(log n).
+
+    upsert/remove로 개별 항목을 갱신할 수 있으며, 삭제 표시나 불균형 삽입이
+    누적되면 자동으로 전체 재구성한다.
+    """
+
+    REBUILD_RATIO = 0.25
+
+    def __init__(self):
+        self._root: Optional[_KDNode] = None
+        self._nodes: dict[Hashable, _KDNode] = {}
+        self._dirty = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._nodes
+
+    @classmethod
+    def build(cls, points: Iterable[tuple[Hashable, float, float, Any]]) -> "KDTree":
+        """(key, lat, lon, item) 목록으로 트리 생성 (좌표가 없는 항목은 제외)"""
+        tree = cls()
+        entries = [
+            (_to_unit_vector(lat, lon), key, item)
+            for key, lat, lon, item in points
+            if lat is not None and lon is not None
+        ]
+        tree._rebuild(entries)
+        return tree
+
+    def _rebuild(self, entries: list) -> None:
+        self._nodes = {}
+        self._dirty = 0
+        self._root = self._build_subtree(entries, 0)
+
+    def _build_subtree(self, entries: list, depth: int) -> Optional[_KDNode]:
+        if not entries:
+            return None
+        axis = depth % 3
+        entries.sort(key=lambda e: e[0][axis])
+        mid = len(entries) // 2
+        point, key, item = entries[mid]
+        node = _KDNode(point, key, item, axis)
+        self._nodes[key] = node
+        node.left = self._build_subtree(entries[:mid], depth + 1)
+        node.right = self._build_subtree(entries[mid + 1:], depth + 1)
+        return node
+
+    def _maybe_rebuild(self) -> None:
+        if self._dirty > max(len(self._nodes), 16) * self.REBUILD_RATIO:
+            entries = [(n.point, n.key, n.item) for n in self._nodes.values()]
+            self._rebuild(entries)
+
+    def upsert(self, key: Hashable, lat: float, lon: float, item: Any) -> None:
+        """항목 추가 또는 교체"""
+        self.remove(key)
+        if lat is None or lon is None:
+            return
+
+        point = _to_unit_vector(lat, lon)
+        if self._root is None:
+            self._root = _KDNode(point, key, item, 0)
+            self._nodes[key] = self._root
+            return
+
+        node = self._root
+        while True:
+            branch = "left" if point[node.axis] < node.point[node.axis] else "right"
+            child = getattr(node, branch)
+            if child is None:
+                child = _KDNode(point, key, item, (node.axis + 1) % 3)
+                setattr(node, branch, child)
+                break
+            node = child
+
+        self._nodes[key] = child
+        self._dirty += 1
+        self._maybe_rebuild()
+
+    def remove(self, key: Hashable) -> bool:
+        """항목 삭제 (노드에는 삭제 표시만 남김)"""
+        node = self._nodes.pop(key, None)
+        if node is None:
+            return False
+        node.deleted = True
+        self._dirty += 1
+        self._maybe_rebuild()
+        return True
+
+    def query_nearest(
+        self, lat: float, lon: float, k: int = 1, max_distance_m: Optional[float] = None
+    ) -> list[tuple[float, Any]]:
+        """
+        중심 좌표에서 가까운 순서로 최대 k개의 (거리(m), item) 목록을 반환한다.
+        max_distance_m이 주어지면 그 거리 이내 항목만 반환한다.
+        """
+        if self._root is None or k <= 0:
+            return []
+
+        target = _to_unit_vector(lat, lon)
+        limit_sq = math.inf
+        if max_distance_m is not None:
+            limit_sq = _meters_to_chord(max_distance_m) ** 2
+
+        # (-거리제곱, 순번, item) 최대 힙
+        heap: list = []
+        counter = itertools.count()
+
+        def worst_sq() -> float:
+            if len(heap) < k:
+                return limit_sq
+            return -heap[0][0]
+
+        # (노드, 노드 영역까지의 최소 거리제곱)
+        stack = [(self._root, 0.0)]
+        while stack:
+            node, bound_sq = stack.pop()
+            if node is None or bound_sq > worst_sq():
+                continue
+
+            if not node.deleted:
+                d_sq = (
+                    (target[0] - node.point[0]) ** 2
+                    + (target[1] - node.point[1]) ** 2
+                    + (target[2] - node.point[2]) ** 2
+                )
+                if d_sq <= worst_sq():
+                    entry = (-d_sq, next(counter), node.item)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    else:
+                        heapq.heapreplace(heap, entry)
+
+            # 가까운 쪽을 먼저 탐색하고, 반대편은 분할 평면까지의 거리로 가지치기
+            diff = target[node.axis] - node.point[node.axis]
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+            stack.append((far, max(bound_sq, diff * diff)))
+            stack.append((near, bound_sq))
+
+        result = [(_chord_to_meters(math.sqrt(-d)), item) for d, _, item in heap]
+        result.sort(key=lambda r: r[0])
+        return result
@@ -1,5 +1,9 @@
 import math
 
+import numpy as np
+
+EARTH_RADIUS_M = 6371000.0
+
 
 def parse_wkt_point(wkt: str) -> tuple[float, float]:
     """
@@ -42,3 +46,79 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
     return R * c
+
+
+def bounding_box(lat: float, lon: float, radius_m: float) -> tuple[float, float, float, float]:
+    """
+    중심 좌표와 반경(미터)을 덮는 위경도 사각형을 (min_lat, min_lon, max_lat, max_lon)으로 반환
+    haversine과 같은 지구 반지름을 쓰고, 경도 폭은 해당 위도에서 반경 원이 닿는 최대 경도 차이
+    """
+    angle = radius_m / EARTH_RADIUS_M
+    dlat = math.degrees(angle)
+    ratio = math.sin(angle) / max(math.cos(math.radians(lat)), 1e-6)
+    # 원이 극점을 포함하면 모든 경도를 덮는다
+    covers_pole = lat + dlat >= 90.0 or lat - dlat <= -90.0
+    dlon = 180.0 if covers_pole or ratio >= 1 else math.degrees(math.asin(ratio))
+
+    return lat - dlat, lon - dlon, lat + dlat, lon + dlon
+
+
+# -----------------------------------------------------------
+# 벡터화 거리 계산 (NumPy)
+# -----------------------------------------------------------
+
+
+def haversine_many(lat: float, lon: float, lats, lons) -> np.ndarray:
+    """
+    한 좌표에서 여러 좌표까지의 Haversine 거리(미터) 배열.
+    lats/lons는 같은 길이의 배열(또는 시퀀스)이며 결과도 같은 길이다.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lons - lon)
+
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def haversine_matrix(lats1, lons1, lats2, lons2) -> np.ndarray:
+    """n개 좌표와 m개 좌표 사이의 거리 행렬 (n x m, 미터)"""
+    phi1 = np.radians(np.asarray(lats1, dtype=np.float64))[:, None]
+    lam1 = np.radians(np.asarray(lons1, dtype=np.float64))[:, None]
+    phi2 = np.radians(np.asarray(lats2, dtype=np.float64))[None, :]
+    lam2 = np.radians(np.asarray(lons2, dtype=np.float64))[None, :]
+
+    a = np.sin((phi2 - phi1) / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin((lam2 - lam1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def radius_mask(lat: float, lon: float, lats, lons, radius_m: float) -> tuple[np.ndarray, np.ndarray]:
+    """반경 radius_m 이내 여부 마스크와 거리 배열을 (mask, distances)로 반환"""
+    dist = haversine_many(lat, lon, lats, lons)
+    return dist <= radius_m, dist
+
+
+def nearest_k(
+    lat: float, lon: float, lats, lons, k: int, max_distance_m: float | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    가장 가까운 최대 k개 좌표의 (인덱스 배열, 거리 배열)을 거리 오름차순으로 반환한다.
+    max_distance_m이 주어지면 그 거리 이내 좌표만 포함한다.
+    """
+    dist = haversine_many(lat, lon, lats, lons)
+    if k <= 0 or dist.size == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0)
+
+    if k < dist.size:
+        idx = np.argpartition(dist, k - 1)[:k]
+    else:
+        idx = np.arange(dist.size)
+    if max_distance_m is not None:
+        idx = idx[dist[idx] <= max_distance_m]
+
+    order = idx[np.argsort(dist[idx], kind="stable")]
+    return order, dist[order]
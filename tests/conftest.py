@@ -0,0 +1,18 @@
+"""
+테스트 공통 설정
+
+config.Settings는 DB/보안 환경 변수가 필수이므로, 실제 DB에 접속하지 않는
+단위 테스트용 값을 기본으로 채운다 (이미 설정된 값은 그대로 사용).
+"""
+
+import os
+
+for name, value in {
+    "MYSQL_HOST": "localhost",
+    "MYSQL_PORT": "3306",
+    "MYSQL_USER": "test",
+    "MYSQL_PASSWORD": "test",
+    "MYSQL_DATABASE": "test",
+    "SECRET_KEY": "test-secret",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from BUDONG.config import settings
+
+
+def test_admin_user_ids_parsing(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_USER_IDS", " 3, 7,,")
+    assert settings.get_admin_user_ids() == {3, 7}
+
+    monkeypatch.setattr(settings, "ADMIN_USER_IDS", "")
+    assert settings.get_admin_user_ids() == set()
+
+
+@pytest.fixture
+def auth(monkeypatch):
+    # core.auth → core.database가 비동기 엔진(asyncmy)을 만들므로 드라이버가 필요하다 (접속은 하지 않음)
+    pytest.importorskip("asyncmy")
+    from BUDONG.api.core import auth
+
+    monkeypatch.setattr(settings, "ADMIN_USER_IDS", "7")
+    return auth
+
+
+def test_allowlisted_admin_can_read_pool_stats(auth):
+    from BUDONG.api.routers.v1.admin.pool_stats import get_pool_stats
+
+    admin = asyncio.run(auth.get_current_admin_user(auth.Principal(user_id=7)))
+    body = get_pool_stats(current_user=admin)
+
+    assert "sync" in body["database"]
+    assert "auth" in body["workers"]
+
+
+def test_admin_role_is_still_accepted(auth):
+    principal = auth.Principal(user_id=8, role="admin")
+    assert asyncio.run(auth.get_current_admin_user(principal)) is principal
+
+
+def test_other_users_are_forbidden(auth):
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth.get_current_admin_user(auth.Principal(user_id=8)))
+    assert exc.value.status_code == 403
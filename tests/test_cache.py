@@ -0,0 +1,139 @@
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from BUDONG.api.core import cache as cache_module
+from BUDONG.api.core.cache import LRUCache, TieredCache
+
+
+class FakeRedis:
+    """dict 기반 Redis 대역 (down이면 모든 명령이 ConnectionError)"""
+
+    def __init__(self):
+        self.data = {}
+        self.down = False
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        if self.down:
+            raise RedisConnectionError("connection refused")
+
+    def mget(self, keys):
+        self._call()
+        return [self.data.get(k) for k in keys]
+
+    def set(self, key, value, ex=None):
+        self._call()
+        self.data[key] = value
+
+    def delete(self, *keys):
+        self._call()
+        for k in keys:
+            self.data.pop(k, None)
+
+    def scan_iter(self, match, count=None):
+        self._call()
+        return [k for k in list(self.data) if k.startswith(match.rstrip("*"))]
+
+    def pipeline(self, transaction=False):
+        redis, ops = self, []
+
+        class Pipeline:
+            def set(self, key, value, ex=None):
+                ops.append((key, value))
+
+            def execute(self):
+                redis._call()
+                redis.data.update(ops)
+
+        return Pipeline()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def tiered(redis, clock):
+    return TieredCache(redis, LRUCache(max_items=8), retry_seconds=30)
+
+
+def test_lru_evicts_oldest_and_expires(clock):
+    lru = LRUCache(max_items=2)
+    lru.set("a", "1", ttl=10)
+    lru.set("b", "2", ttl=10)
+    assert lru.get("a") == "1"  # a가 최근 사용
+    lru.set("c", "3", ttl=10)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == "1"
+
+    clock[0] += 11
+    assert lru.get("a") is None and lru.get("c") is None
+
+
+def test_uses_redis_while_available(tiered, redis):
+    tiered.set_many({"a": "1", "b": "2"}, ttl=60)
+    tiered.set_json("c", {"x": 1}, ttl=60)
+
+    assert redis.data == {"a": "1", "b": "2", "c": '{"x": 1}'}
+    assert tiered.get_many(["a", "missing", "b"]) == ["1", None, "2"]
+    assert tiered.get_json("c") == {"x": 1}
+    assert tiered.local.get("a") is None
+
+
+def test_falls_back_to_local_and_retries_after_window(tiered, redis, clock):
+    redis.down = True
+
+    assert tiered.get("a") is None
+    tiered.set_many({"a": "1", "b": "2"}, ttl=60)
+    tiered.set("c", "3", ttl=60)
+
+    # 첫 실패 이후 retry_seconds 동안은 Redis를 다시 호출하지 않는다
+    assert redis.calls == 1
+    assert tiered.get_many(["a", "b", "c"]) == ["1", "2", "3"]
+    assert redis.calls == 1
+
+    redis.down = False
+    redis.data["a"] = "from-redis"
+    clock[0] += 31
+    assert tiered.get("a") == "from-redis"
+    assert redis.calls == 2
+
+
+def test_delete_clears_both_tiers(tiered, redis, clock):
+    redis.down = True
+    tiered.set("a", "stale", ttl=60)
+    redis.down = False
+    redis.data["a"] = "1"
+    clock[0] += 31
+
+    tiered.delete("a")
+
+    assert "a" not in redis.data
+    assert tiered.local.get("a") is None
+
+
+def test_delete_prefix(tiered, redis):
+    tiered.set_many({"building_detail:1:static": "1", "building_detail:2:static": "2", "other": "3"}, ttl=60)
+    tiered.local.set("building_detail:1:review_page", "x", ttl=60)
+
+    tiered.delete_prefix("building_detail:")
+
+    assert redis.data == {"other": "3"}
+    assert tiered.local.get("building_detail:1:review_page") is None
+
+
+def test_without_client_only_local_is_used(clock):
+    local_only = TieredCache(None, LRUCache(max_items=8))
+    local_only.set_many({"a": "1"}, ttl=60)
+
+    assert local_only.get_many(["a", "b"]) == ["1", None]
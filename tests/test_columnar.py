@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from BUDONG.util.columnar import ColumnarFile, StringColumn, write_columnar
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = str(tmp_path / "geo.bdcol")
+    write_columnar(path, {
+        "t_school": {
+            "school_id": ("i8", [1, 2, None]),
+            "school_name": ("str", ["가 학교", None, "다 학교"]),
+            "lat": ("f8", [37.5, None, 37.51]),
+            "lon": ("f8", [127.0, 127.01, None]),
+        },
+        "t_empty": {"lat": ("f8", [])},
+    }, meta={"created_at": "2024-01-01T00:00:00"})
+    return ColumnarFile(path)
+
+
+def test_round_trip_values(snapshot):
+    table = snapshot.table("t_school")
+
+    assert snapshot.meta == {"created_at": "2024-01-01T00:00:00"}
+    assert table.rows == 3
+    assert table.column_names == ["school_id", "school_name", "lat", "lon"]
+    assert table.values("school_id") == [1, 2, None]
+    assert table.values("school_name") == ["가 학교", None, "다 학교"]
+    assert list(table.rows_iter("school_id", "lat")) == [(1, 37.5), (2, None), (None, 37.51)]
+    assert snapshot.table("t_empty").values("lat") == []
+
+
+def test_numeric_columns_are_read_only_views(snapshot):
+    lats = snapshot.table("t_school").column("lat")
+
+    assert isinstance(lats, np.ndarray)
+    assert not lats.flags.writeable
+    assert np.isnan(lats[1])
+    assert isinstance(snapshot.table("t_school").column("school_name"), StringColumn)
+
+
+def test_accessor_reads_single_rows(snapshot):
+    table = snapshot.table("t_school")
+    school_id, name = table.accessor("school_id"), table.accessor("school_name")
+
+    assert [school_id(i) for i in range(3)] == [1, 2, None]
+    assert type(school_id(0)) is int
+    assert [name(i) for i in range(3)] == ["가 학교", None, "다 학교"]
+
+
+def test_rejects_mismatched_column_lengths(tmp_path):
+    with pytest.raises(ValueError):
+        write_columnar(str(tmp_path / "bad.bdcol"), {"t": {"a": ("i8", [1]), "b": ("i8", [1, 2])}})
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a columnar file at all")
+    with pytest.raises(ValueError):
+        ColumnarFile(str(path))
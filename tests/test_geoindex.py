@@ -0,0 +1,209 @@
+import time
+
+import numpy as np
+import pytest
+
+from BUDONG.util import geoindex
+from BUDONG.util.geoindex import ArrayGridIndex, GridIndex, KDTree
+from BUDONG.util.geoutil import haversine, radius_mask
+
+CENTER = (37.5, 127.0)
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(7)
+    lats = CENTER[0] + rng.uniform(-0.05, 0.05, 2000)
+    lons = CENTER[1] + rng.uniform(-0.05, 0.05, 2000)
+    return lats, lons
+
+
+def brute_force(lats, lons, lat, lon, radius_m=None):
+    """(거리, 행 번호) 오름차순"""
+    found = [
+        (haversine(lat, lon, a, b), i)
+        for i, (a, b) in enumerate(zip(lats, lons))
+        if not (np.isnan(a) or np.isnan(b))
+    ]
+    if radius_m is not None:
+        found = [f for f in found if f[0] <= radius_m]
+    return sorted(found)
+
+
+@pytest.mark.parametrize("radius_m", [0, 150, 800, 3000])
+def test_array_grid_radius_matches_brute_force(points, radius_m):
+    lats, lons = points
+    index = ArrayGridIndex(lats, lons, item=lambda i: i)
+
+    result = index.query_radius(*CENTER, radius_m)
+    expected = brute_force(lats, lons, *CENTER, radius_m)
+
+    assert [item for _, item in result] == [i for _, i in expected]
+    assert [d for d, _ in result] == pytest.approx([d for d, _ in expected], abs=1e-3)
+
+
+@pytest.mark.parametrize("k, max_distance_m", [(1, None), (5, None), (5, 300), (50, 10)])
+def test_array_grid_nearest_matches_brute_force(points, k, max_distance_m):
+    lats, lons = points
+    index = ArrayGridIndex(lats, lons, item=lambda i: i)
+
+    result = index.query_nearest(37.51, 127.01, k=k, max_distance_m=max_distance_m)
+    expected = brute_force(lats, lons, 37.51, 127.01, max_distance_m)[:k]
+
+    assert [item for _, item in result] == [i for _, i in expected]
+
+
+def test_array_grid_skips_missing_coordinates_and_builds_items_lazily():
+    lats = np.array([37.5, np.nan, 37.5001, 37.6])
+    lons = np.array([127.0, 127.0, np.nan, 127.0])
+    built = []
+
+    def item(i):
+        built.append(i)
+        return f"row-{i}"
+
+    index = ArrayGridIndex(lats, lons, item=item)
+
+    assert len(index) == 2
+    assert built == []
+    assert index.query_radius(37.5, 127.0, 100) == [(0.0, "row-0")]
+    assert built == [0]
+
+
+def test_array_grid_empty():
+    index = ArrayGridIndex(np.empty(0), np.empty(0), item=lambda i: i)
+
+    assert len(index) == 0
+    assert index.query_radius(*CENTER, 1000) == []
+    assert index.query_nearest(*CENTER, k=3) == []
+
+
+@pytest.mark.parametrize("radius_m", [0, 150, 800, 3000])
+def test_grid_radius_matches_brute_force(points, radius_m):
+    lats, lons = points
+    index = GridIndex.build(zip(lats, lons, range(len(lats))))
+
+    result = index.query_radius(*CENTER, radius_m)
+    expected = brute_force(lats, lons, *CENTER, radius_m)
+
+    assert [item for _, item in result] == [i for _, i in expected]
+    assert [d for d, _ in result] == pytest.approx([d for d, _ in expected], abs=1e-3)
+
+
+def test_grid_insert_after_query_invalidates_cell_cache():
+    index = GridIndex.build([(37.5, 127.0, "a"), (None, 127.0, "no-lat")])
+    assert len(index) == 1
+    assert [item for _, item in index.query_radius(37.5, 127.0, 50)] == ["a"]
+
+    index.insert(37.5001, 127.0, "b")
+
+    assert len(index) == 2
+    assert [item for _, item in index.query_radius(37.5, 127.0, 50)] == ["a", "b"]
+
+
+def _kd_points(lats, lons):
+    return [(i, a, b, i) for i, (a, b) in enumerate(zip(lats, lons))]
+
+
+@pytest.mark.parametrize("k, max_distance_m", [(1, None), (5, None), (5, 300), (50, 10)])
+def test_kdtree_nearest_matches_brute_force(points, k, max_distance_m):
+    lats, lons = points
+    tree = KDTree.build(_kd_points(lats, lons))
+
+    result = tree.query_nearest(37.51, 127.01, k=k, max_distance_m=max_distance_m)
+    expected = brute_force(lats, lons, 37.51, 127.01, max_distance_m)[:k]
+
+    assert [item for _, item in result] == [i for _, i in expected]
+    assert [d for d, _ in result] == pytest.approx([d for d, _ in expected], abs=1e-3)
+
+
+def test_kdtree_upsert_and_remove_match_brute_force(points):
+    lats, lons = points
+    lats, lons = lats[:300].copy(), lons[:300].copy()
+    tree = KDTree.build(_kd_points(lats, lons))
+    rng = np.random.default_rng(11)
+
+    # 이동/삭제를 섞어 자동 재구성이 여러 번 일어나도록
+    removed = set()
+    for step in range(400):
+        key = int(rng.integers(0, len(lats)))
+        if step % 3 == 0:
+            assert tree.remove(key) == (key not in removed)
+            removed.add(key)
+            lats[key] = lons[key] = np.nan
+        else:
+            lats[key] = CENTER[0] + rng.uniform(-0.05, 0.05)
+            lons[key] = CENTER[1] + rng.uniform(-0.05, 0.05)
+            tree.upsert(key, float(lats[key]), float(lons[key]), key)
+            removed.discard(key)
+
+    assert len(tree) == len(lats) - len(removed)
+    assert all((key in tree) == (key not in removed) for key in range(len(lats)))
+    for lat, lon in [CENTER, (37.46, 126.96), (37.54, 127.04)]:
+        result = tree.query_nearest(lat, lon, k=10)
+        expected = brute_force(lats, lons, lat, lon)[:10]
+        assert [item for _, item in result] == [i for _, i in expected]
+
+
+def test_kdtree_upsert_without_coordinates_removes_key():
+    tree = KDTree.build([("a", 37.5, 127.0, "a"), ("b", 37.6, 127.0, "b")])
+
+    tree.upsert("a", None, None, "a")
+
+    assert "a" not in tree
+    assert tree.query_nearest(37.5, 127.0, k=2) == [pytest.approx((11119.5, "b"), abs=1)]
+    assert tree.remove("a") is False
+
+
+def test_kdtree_empty():
+    tree = KDTree()
+
+    assert tree.query_nearest(*CENTER, k=3) == []
+    tree.upsert(1, *CENTER, "only")
+    assert tree.query_nearest(*CENTER, k=3) == [(0.0, "only")]
+
+
+@pytest.mark.parametrize("radius_m", [1_000_000, 3_000_000])
+def test_huge_radius_visits_only_occupied_cells(points, radius_m):
+    lats, lons = points
+    grid = GridIndex.build(zip(lats, lons, range(len(lats))))
+    array_grid = ArrayGridIndex(lats, lons, item=lambda i: i)
+
+    # 범위 전체(수억 개 셀)를 돌면 수 초가 걸린다
+    started = time.perf_counter()
+    grid_result = grid.query_radius(*CENTER, radius_m)
+    array_result = array_grid.query_radius(*CENTER, radius_m)
+    assert time.perf_counter() - started < 0.5
+
+    expected = [i for _, i in brute_force(lats, lons, *CENTER, radius_m)]
+    assert sorted(item for _, item in grid_result) == sorted(expected)
+    assert sorted(item for _, item in array_result) == sorted(expected)
+
+
+def test_array_grid_nearest_without_radius_searches_nearby_cells(monkeypatch, points):
+    lats, lons = points
+    index = ArrayGridIndex(lats, lons, item=lambda i: i)
+    scanned = []
+
+    def counting_mask(lat, lon, cand_lats, cand_lons, radius_m):
+        scanned.append(len(cand_lats))
+        return radius_mask(lat, lon, cand_lats, cand_lons, radius_m)
+
+    monkeypatch.setattr(geoindex, "radius_mask", counting_mask)
+
+    result = index.query_nearest(*CENTER, k=3)
+
+    assert [item for _, item in result] == [i for _, i in brute_force(lats, lons, *CENTER)[:3]]
+    # 전체 행이 아니라 중심 주변 셀의 후보만 비교
+    assert max(scanned) < len(lats) / 10
+
+
+@pytest.mark.parametrize("lat, lon, k", [(0.0, 0.0, 3), (-60.0, -100.0, 1), (37.5, 127.0, 5000)])
+def test_array_grid_nearest_far_away_or_more_than_size(points, lat, lon, k):
+    lats, lons = points
+    index = ArrayGridIndex(lats, lons, item=lambda i: i)
+
+    result = index.query_nearest(lat, lon, k=k)
+
+    expected = brute_force(lats, lons, lat, lon)[:k]
+    assert [item for _, item in result] == [i for _, i in expected]
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from BUDONG.util.geoutil import (
+    bounding_box,
+    haversine,
+    haversine_many,
+    haversine_matrix,
+    nearest_k,
+    radius_mask,
+)
+
+CENTER = (37.5, 127.0)
+
+
+@pytest.fixture(scope="module")
+def points():
+    rng = np.random.default_rng(3)
+    lats = CENTER[0] + rng.uniform(-0.2, 0.2, 500)
+    lons = CENTER[1] + rng.uniform(-0.2, 0.2, 500)
+    return lats, lons
+
+
+def test_haversine_many_matches_scalar(points):
+    lats, lons = points
+
+    result = haversine_many(*CENTER, lats, lons)
+
+    expected = [haversine(*CENTER, a, b) for a, b in zip(lats, lons)]
+    assert result == pytest.approx(expected, abs=1e-6)
+
+
+def test_haversine_matrix_matches_rows(points):
+    lats, lons = points
+
+    matrix = haversine_matrix(lats[:7], lons[:7], lats, lons)
+
+    assert matrix.shape == (7, len(lats))
+    for row, (a, b) in enumerate(zip(lats[:7], lons[:7])):
+        assert matrix[row] == pytest.approx(haversine_many(a, b, lats, lons))
+
+
+def test_radius_mask(points):
+    lats, lons = points
+
+    mask, dist = radius_mask(*CENTER, lats, lons, 5000)
+
+    assert np.array_equal(mask, dist <= 5000)
+    assert 0 < mask.sum() < len(lats)
+
+
+@pytest.mark.parametrize("k, max_distance_m", [(1, None), (10, None), (10, 4000), (1000, None), (0, None)])
+def test_nearest_k_matches_sorted_distances(points, k, max_distance_m):
+    lats, lons = points
+
+    idx, dist = nearest_k(*CENTER, lats, lons, k=k, max_distance_m=max_distance_m)
+
+    all_dist = haversine_many(*CENTER, lats, lons)
+    expected = np.argsort(all_dist, kind="stable")[:k]
+    if max_distance_m is not None:
+        expected = expected[all_dist[expected] <= max_distance_m]
+    assert idx.tolist() == expected.tolist()
+    assert dist == pytest.approx(all_dist[expected])
+
+
+def test_nearest_k_empty():
+    idx, dist = nearest_k(*CENTER, [], [], k=3)
+
+    assert idx.size == 0 and dist.size == 0
+
+
+@pytest.mark.parametrize("lat", [0.0, 37.5, 60.0])
+def test_bounding_box_contains_every_point_within_radius(lat):
+    radius_m = 2000
+    min_lat, min_lon, max_lat, max_lon = bounding_box(lat, 127.0, radius_m)
+
+    # 반경 원 둘레의 점이 모두 사각형 안에 있어야 한다
+    rng = np.random.default_rng(5)
+    lats = lat + rng.uniform(-0.05, 0.05, 20000)
+    lons = 127.0 + rng.uniform(-0.05, 0.05, 20000)
+    near = haversine_many(lat, 127.0, lats, lons) <= radius_m
+    assert near.any()
+    assert (lats[near] >= min_lat).all() and (lats[near] <= max_lat).all()
+    assert (lons[near] >= min_lon).all() and (lons[near] <= max_lon).all()
+
+    # 사각형은 필요 이상으로 크지 않다 (위도 변은 반경에 딱 맞음)
+    assert haversine(lat, 127.0, max_lat, 127.0) == pytest.approx(radius_m, abs=1e-3)
+    assert haversine(lat, 127.0, min_lat, 127.0) == pytest.approx(radius_m, abs=1e-3)
+
+
+@pytest.mark.parametrize("lat, radius_m", [(85.0, 1_000_000), (-30.0, 10_000_000)])
+def test_bounding_box_covering_a_pole_spans_all_longitudes(lat, radius_m):
+    min_lat, min_lon, max_lat, max_lon = bounding_box(lat, 127.0, radius_m)
+
+    assert (min_lon, max_lon) == (127.0 - 180.0, 127.0 + 180.0)
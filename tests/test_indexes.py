@@ -0,0 +1,21 @@
+from sqlalchemy.dialects import mysql
+
+from BUDONG.api.core import indexes
+
+
+def _compile(clauses) -> str:
+    return ", ".join(str(c.compile(dialect=mysql.dialect())) for c in clauses)
+
+
+def test_transaction_order_falls_back_to_text_column(monkeypatch):
+    monkeypatch.setattr(indexes, "_ready_columns", set())
+    sql = _compile(indexes.transaction_order())
+    assert "transaction_date DESC" in sql
+    assert "transaction_day" not in sql
+
+
+def test_transaction_order_uses_generated_column(monkeypatch):
+    monkeypatch.setattr(indexes, "_ready_columns", {"t_real_transaction_price.transaction_day"})
+    sql = _compile(indexes.transaction_order())
+    assert sql.startswith("t_real_transaction_price.transaction_day DESC")
+    assert sql.endswith("t_real_transaction_price.tx_id DESC")
@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+pytest.importorskip("asyncmy")
+
+from BUDONG.api.core import neighbourhood  # noqa: E402
+from BUDONG.util.geoindex import GridIndex  # noqa: E402
+
+
+class _Session:
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """섹션 인덱스 로딩 대역: 호출마다 학교 좌표가 바뀐다"""
+    calls = []
+
+    def load(db, section):
+        calls.append(section)
+        if section != "school":
+            return None
+        lat = 37.5 + 0.001 * len(calls)
+        return GridIndex.build([(lat, 127.0, {"name": f"school-{len(calls)}"})])
+
+    monkeypatch.setattr(neighbourhood, "ReadSessionLocal", _Session)
+    monkeypatch.setattr(neighbourhood, "_load_index", load)
+    monkeypatch.setattr(neighbourhood, "_indexes", {})
+    return calls
+
+
+def test_section_index_is_reused_within_ttl(loads):
+    first = neighbourhood._get_index("school")
+
+    assert neighbourhood._get_index("school") is first
+    assert loads == ["school"]
+
+
+def test_section_index_is_reloaded_after_ttl(monkeypatch, loads):
+    first = neighbourhood._get_index("school")
+    stamp, index = neighbourhood._indexes["school"]
+    expired = stamp - neighbourhood.settings.NEIGHBOURHOOD_INDEX_TTL - 1
+    neighbourhood._indexes["school"] = (expired, index)
+
+    second = neighbourhood._get_index("school")
+
+    assert second is not first
+    assert loads == ["school", "school"]
+    assert neighbourhood._indexes["school"][0] > expired
+    assert time.monotonic() - neighbourhood._indexes["school"][0] < 1
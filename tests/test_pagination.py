@@ -0,0 +1,60 @@
+import base64
+from datetime import datetime
+
+import pytest
+
+from BUDONG.api.core.pagination import decode_cursor, decode_scoped_cursor, encode_cursor
+from BUDONG.api.exception.global_exception_handler import APIError
+
+
+def assert_invalid(func, *args):
+    with pytest.raises(APIError) as exc:
+        func(*args)
+    assert exc.value.status_code == 400
+    assert exc.value.code == "INVALID_CURSOR"
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(123.5, 42, "2024-01-01T00:00:00")
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 3) == [123.5, 42, "2024-01-01T00:00:00"]
+
+
+@pytest.mark.parametrize("cursor", ["", "not base64!", encode_cursor("a"), encode_cursor(1, 2, 3)])
+def test_decode_cursor_rejects_malformed(cursor):
+    assert_invalid(decode_cursor, cursor, 2)
+
+
+def test_decode_cursor_rejects_non_list():
+    cursor = base64.urlsafe_b64encode(b'{"a":1,"b":2}').decode()
+    assert_invalid(decode_cursor, cursor, 2)
+
+
+def test_scoped_cursor_round_trip():
+    cursor = encode_cursor("rating", 3.5, 4.25, 10)
+    assert decode_scoped_cursor(cursor, ("rating", 3.5), float, int) == [4.25, 10]
+
+
+def test_scoped_cursor_rejects_other_sort():
+    cursor = encode_cursor("distance", None, 120.0, 10)
+    assert_invalid(decode_scoped_cursor, cursor, ("rating", None), float, int)
+
+
+def test_scoped_cursor_rejects_other_filter():
+    cursor = encode_cursor("rating", 3.0, 4.5, 10)
+    assert_invalid(decode_scoped_cursor, cursor, ("rating", 4.0), float, int)
+
+
+@pytest.mark.parametrize("keys", [(None, 10), ("far", 10), (1.0, "x"), (1.0, [1])])
+def test_scoped_cursor_rejects_wrong_key_types(keys):
+    cursor = encode_cursor("distance", None, *keys)
+    assert_invalid(decode_scoped_cursor, cursor, ("distance", None), float, int)
+
+
+def test_unscoped_cursor_with_datetime_key():
+    created_at = datetime(2024, 5, 1, 12, 30)
+    cursor = encode_cursor(created_at, 42)
+
+    assert decode_scoped_cursor(cursor, (), datetime.fromisoformat, int) == [created_at, 42]
+    assert_invalid(decode_scoped_cursor, encode_cursor("yesterday", 42), (), datetime.fromisoformat, int)
+    assert_invalid(decode_scoped_cursor, encode_cursor(None, 42), (), datetime.fromisoformat, int)
@@ -0,0 +1,83 @@
+import orjson
+import pytest
+from fastapi import Request
+
+pytest.importorskip("asyncmy")
+
+from BUDONG.api.core.region_stats import RegionSnapshot, RegionStats  # noqa: E402
+from BUDONG.api.exception.global_exception_handler import APIError  # noqa: E402
+from BUDONG.api.routers.v1.region import bulk_region_stats  # noqa: E402
+
+
+def request_with(if_none_match=None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def region(bjd_code, lat, lon, ja_chi_gu_code=1, crime_num=3) -> RegionStats:
+    return RegionStats(
+        bjd_code, f"동{bjd_code}", None, ja_chi_gu_code, lat, lon,
+        crime_num, None, None, None, None, None, None, None, None,
+    )
+
+
+@pytest.fixture
+def snapshot(monkeypatch):
+    current = RegionSnapshot({
+        1: region(1, 37.50, 127.00),
+        2: region(2, 37.60, 127.10, ja_chi_gu_code=2),
+        3: region(3, None, None),
+    })
+    monkeypatch.setattr(bulk_region_stats, "get_region_snapshot", lambda: current)
+    return current
+
+
+def call(if_none_match=None, **params):
+    params = {"bjd_codes": None, "bbox": None, "ja_chi_gu_code": None, "format": "rows", **params}
+    return bulk_region_stats.get_region_stats_bulk(request_with(if_none_match), current_user=None, **params)
+
+
+def test_bbox_and_district_select_regions(snapshot):
+    body = orjson.loads(call(bbox="126.9,37.4,127.05,37.55").body)
+    assert [r["bjd_code"] for r in body["regions"]] == [1]
+
+    body = orjson.loads(call(ja_chi_gu_code=2, format="columnar").body)
+    assert body["regions"] == [] and body["columns"]["bjd_code"] == [2]
+
+
+def test_matching_etag_returns_304(snapshot):
+    first = call(bjd_codes=[2, 1, 9])
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert orjson.loads(first.body)["count"] == 2
+
+    repeat = call(if_none_match=etag, bjd_codes=[1, 2, 9, 1])
+    assert repeat.status_code == 304
+    assert repeat.headers["etag"] == etag
+
+    # 조건이 다르면 같은 ETag를 보내도 본문을 돌려준다
+    other = call(if_none_match=etag, bjd_codes=[1])
+    assert other.status_code == 200 and other.headers["etag"] != etag
+
+
+def test_new_snapshot_version_invalidates_etag(monkeypatch, snapshot):
+    etag = call(bjd_codes=[1]).headers["etag"]
+
+    changed = RegionSnapshot({**snapshot.stats, 1: region(1, 37.50, 127.00, crime_num=4)})
+    monkeypatch.setattr(bulk_region_stats, "get_region_snapshot", lambda: changed)
+
+    response = call(if_none_match=etag, bjd_codes=[1])
+    assert response.status_code == 200
+    assert orjson.loads(response.body)["regions"][0]["crime_num"] == 4
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"bjd_codes": [1], "ja_chi_gu_code": 1},
+    {"bbox": "127.1,37.4,127.0,37.5"},
+    {"bbox": "not,a,box"},
+])
+def test_invalid_selectors_are_rejected(snapshot, params):
+    with pytest.raises(APIError) as exc:
+        call(**params)
+    assert exc.value.status_code == 400
@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("asyncmy")
+
+from BUDONG.api.core import region_stats  # noqa: E402
+
+
+class _Session:
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def slow_build(monkeypatch):
+    """build_region_stats를 release가 set될 때까지 막아 두고 호출 횟수를 센다"""
+    release = threading.Event()
+    calls = []
+
+    def build(db):
+        calls.append(db)
+        release.wait(5)
+        return {}
+
+    monkeypatch.setattr(region_stats, "ReadSessionLocal", _Session)
+    monkeypatch.setattr(region_stats, "build_region_stats", build)
+    monkeypatch.setattr(region_stats, "_retry_at", 0.0)
+    return release, calls
+
+
+def _wait_for_refresh():
+    region_stats._refresh_lock.acquire(timeout=5)
+    region_stats._refresh_lock.release()
+
+
+def test_stale_snapshot_is_served_while_one_refresh_runs(monkeypatch, slow_build):
+    release, calls = slow_build
+    stale = region_stats.RegionSnapshot({})
+    monkeypatch.setattr(region_stats, "_snapshot", stale)
+    monkeypatch.setattr(region_stats, "_built_at", time.monotonic() - region_stats.settings.REGION_STATS_TTL - 1)
+
+    results = [region_stats.get_region_snapshot() for _ in range(5)]
+
+    assert all(result is stale for result in results)
+    assert len(calls) == 1
+
+    release.set()
+    _wait_for_refresh()
+    assert region_stats._snapshot is not stale
+    assert region_stats.get_region_snapshot() is region_stats._snapshot
+
+
+def test_failed_refresh_keeps_previous_snapshot(monkeypatch):
+    def fail(db):
+        raise RuntimeError("db down")
+
+    stale = region_stats.RegionSnapshot({})
+    monkeypatch.setattr(region_stats, "ReadSessionLocal", _Session)
+    monkeypatch.setattr(region_stats, "build_region_stats", fail)
+    monkeypatch.setattr(region_stats, "_retry_at", 0.0)
+    monkeypatch.setattr(region_stats, "_snapshot", stale)
+    monkeypatch.setattr(region_stats, "_built_at", time.monotonic() - region_stats.settings.REGION_STATS_TTL - 1)
+
+    assert region_stats.get_region_snapshot() is stale
+    _wait_for_refresh()
+    assert region_stats._snapshot is stale
+    assert region_stats._retry_at > time.monotonic()
+
+
+def test_first_call_builds_synchronously(monkeypatch, slow_build):
+    release, calls = slow_build
+    release.set()
+    monkeypatch.setattr(region_stats, "_snapshot", None)
+
+    snapshot = region_stats.get_region_snapshot()
+
+    assert snapshot is region_stats._snapshot
+    assert len(calls) == 1
@@ -0,0 +1,43 @@
+import pytest
+from fastapi import Request
+
+from BUDONG.api.core.responses import etag_matches, make_etag, not_modified
+
+
+def request_with(if_none_match=None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_make_etag_is_stable_and_quoted():
+    etag = make_etag("v1", [1, 2], None)
+
+    assert etag == make_etag("v1", [1, 2], None)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag != make_etag("v1", [1, 2], 0)
+    assert etag != make_etag("v2", [1, 2], None)
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ("", False),
+    ('"other"', False),
+    ("{etag}", True),
+    ("W/{etag}", True),
+    ('"other", {etag}', True),
+    ("*", True),
+])
+def test_etag_matches(header, expected):
+    etag = make_etag("v1")
+    if header is not None:
+        header = header.format(etag=etag)
+
+    assert etag_matches(request_with(header), etag) is expected
+
+
+def test_not_modified_has_no_body_and_echoes_etag():
+    response = not_modified('"abc"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
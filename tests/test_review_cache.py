@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip("asyncmy")
+
+from BUDONG.api.core.cache import LRUCache, TieredCache, building_detail_key  # noqa: E402
+from BUDONG.api.routers.v1.buildings import detail, get_reviews  # noqa: E402
+
+REPLICA, PRIMARY = "replica-session", "primary-session"
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """어느 세션으로 첫 페이지를 조회했는지 기록"""
+    calls = []
+
+    def fetch_review_page(db, building_id, after=None):
+        calls.append(db)
+        return {"items": [{"from": db}], "next_cursor": None, "review_count": 1}
+
+    monkeypatch.setattr(detail, "fetch_review_page", fetch_review_page)
+    monkeypatch.setattr(detail, "run_on_primary", lambda task: task(PRIMARY))
+    monkeypatch.setattr(get_reviews, "cache", TieredCache(None, LRUCache()))
+    return calls
+
+
+def test_first_page_cache_is_filled_from_primary(monkeypatch, fetches):
+    monkeypatch.setattr(get_reviews.settings, "CACHE_ENABLED", True)
+
+    page = get_reviews._first_page(REPLICA, 7)
+
+    assert fetches == [PRIMARY]
+    assert page["items"] == [{"from": PRIMARY}]
+    assert get_reviews.cache.get_json(building_detail_key(7, "review_page")) == page
+
+    # 캐시가 채워진 뒤에는 조회하지 않는다
+    assert get_reviews._first_page(REPLICA, 7) == page
+    assert fetches == [PRIMARY]
+
+
+def test_without_cache_the_read_session_is_used(monkeypatch, fetches):
+    monkeypatch.setattr(get_reviews.settings, "CACHE_ENABLED", False)
+
+    get_reviews._first_page(REPLICA, 7)
+
+    assert fetches == [REPLICA]
@@ -0,0 +1,28 @@
+import pytest
+from pydantic import ValidationError
+
+from BUDONG.api.schemas.schema_buildings import BuildingBatchRequest
+from BUDONG.api.schemas.schema_infrastructure import InfrastructureCategoryRequest
+from BUDONG.config import settings
+
+
+def test_batch_request_accepts_up_to_the_cap():
+    ids = list(range(settings.DETAIL_BATCH_MAX_IDS))
+    assert BuildingBatchRequest(building_ids=ids).building_ids == ids
+
+
+@pytest.mark.parametrize("size", [0, settings.DETAIL_BATCH_MAX_IDS + 1])
+def test_batch_request_rejects_empty_and_oversized_lists(size):
+    with pytest.raises(ValidationError):
+        BuildingBatchRequest(building_ids=list(range(size)))
+
+
+@pytest.mark.parametrize("radius", [0, -5, settings.INFRA_RADIUS_MAX_M + 1])
+def test_infrastructure_radius_is_bounded(radius):
+    with pytest.raises(ValidationError):
+        InfrastructureCategoryRequest(category="school", latitude=37.5, longitude=127.0, radius_meters=radius)
+
+    request = InfrastructureCategoryRequest(
+        category="school", latitude=37.5, longitude=127.0, radius_meters=settings.INFRA_RADIUS_MAX_M
+    )
+    assert request.radius_meters == settings.INFRA_RADIUS_MAX_M
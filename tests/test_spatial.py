@@ -0,0 +1,103 @@
+from sqlalchemy.dialects import mysql
+
+from BUDONG.api.core import spatial
+from BUDONG.api.models.models import TBuilding, TSchool
+
+
+def compile_sql(clause) -> str:
+    return str(clause.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_within_radius_uses_lat_lon_before_detection(monkeypatch):
+    monkeypatch.setattr(spatial, "_spatial_tables", None)
+    sql = compile_sql(spatial.within_radius(TBuilding, 37.5, 127.0, 500))
+
+    assert "geom" not in sql
+    assert "t_building.lat BETWEEN" in sql
+    assert "ST_Distance_Sphere" in sql
+
+
+def test_within_radius_uses_spatial_index_only_for_ready_tables(monkeypatch):
+    monkeypatch.setattr(spatial, "_spatial_tables", {"t_building"})
+
+    assert "MBRContains" in compile_sql(spatial.within_radius(TBuilding, 37.5, 127.0, 500))
+    assert "MBRContains" not in compile_sql(spatial.within_radius(TSchool, 37.5, 127.0, 500))
+
+
+class RecordingEngine:
+    """실행한 SQL만 기록하는 엔진 대역 (UPDATE 백필은 0건으로 응답)"""
+
+    def __init__(self):
+        self.statements = []
+
+    def begin(self):
+        engine = self
+
+        class Conn:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def execute(self, clause, params=None):
+                engine.statements.append(str(clause))
+
+                class Result:
+                    rowcount = 0
+
+                return Result()
+
+        return Conn()
+
+
+class Inspector:
+    def __init__(self, indexes):
+        self.indexes = indexes
+
+    def get_table_names(self):
+        return [m.__tablename__ for m in spatial.SPATIAL_MODELS]
+
+    def get_indexes(self, table):
+        return [{"name": name} for name in self.indexes]
+
+
+def ddl(statements):
+    return [s for s in statements if s.startswith(("ALTER", "CREATE", "DROP"))]
+
+
+def test_migration_is_a_no_op_when_already_applied(monkeypatch):
+    indexes = [spatial._spatial_index_name(m) for m in spatial.SPATIAL_MODELS]
+    monkeypatch.setattr(spatial, "inspect", lambda engine: Inspector(indexes))
+    monkeypatch.setattr(spatial, "_geom_column", lambda conn, table: (False, spatial.SRID))
+    monkeypatch.setattr(
+        spatial, "_existing_triggers",
+        lambda conn, table: {f"trg_{table}_geom_bi", f"trg_{table}_geom_bu"},
+    )
+    engine = RecordingEngine()
+
+    spatial.ensure_spatial_columns(engine)
+
+    assert engine.statements == []
+
+
+def test_migration_creates_missing_pieces_without_dropping_triggers(monkeypatch):
+    monkeypatch.setattr(spatial, "inspect", lambda engine: Inspector([]))
+    monkeypatch.setattr(spatial, "_geom_column", lambda conn, table: None)
+    monkeypatch.setattr(
+        spatial, "_existing_triggers",
+        lambda conn, table: {f"trg_{table}_geom_bi"},
+    )
+    engine = RecordingEngine()
+
+    spatial.ensure_spatial_columns(engine)
+
+    statements = ddl(engine.statements)
+    assert not any(s.startswith("DROP") for s in statements)
+    building = [s for s in statements if " t_building " in s or s.endswith(" t_building")]
+    assert [s.split(" ON ")[0].split(" BEFORE ")[0] for s in building] == [
+        "ALTER TABLE t_building ADD COLUMN geom POINT SRID 4326 NULL",
+        "CREATE TRIGGER trg_t_building_geom_bu",
+        "ALTER TABLE t_building MODIFY geom POINT NOT NULL SRID 4326",
+        f"CREATE SPATIAL INDEX {spatial._spatial_index_name(TBuilding)}",
+    ]
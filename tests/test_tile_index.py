@@ -0,0 +1,146 @@
+import math
+import threading
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("asyncmy")
+
+from BUDONG.api.core import tile_index  # noqa: E402
+from BUDONG.api.core.tile_index import (  # noqa: E402
+    RAW_POINT_MIN_ZOOM,
+    TileLayer,
+    TilePoint,
+    project,
+)
+
+
+def tile_of(lat, lon, z):
+    mx, my = project(lat, lon)
+    return int(mx * (1 << z)), int(my * (1 << z))
+
+
+@pytest.fixture(scope="module")
+def layer():
+    rng = np.random.default_rng(9)
+    lats = 37.5 + rng.uniform(-0.05, 0.05, 3000)
+    lons = 127.0 + rng.uniform(-0.05, 0.05, 3000)
+    weights = rng.integers(0, 4, 3000)
+    points = [
+        TilePoint(str(i), None, float(a), float(b), int(w), *project(a, b))
+        for i, (a, b, w) in enumerate(zip(lats, lons, weights))
+    ]
+    return TileLayer(points)
+
+
+def test_project_matches_slippy_map_tiles():
+    # 서울시청 (37.5665, 126.9780)은 z=10에서 타일 (873, 396)
+    assert tile_of(37.5665, 126.9780, 10) == (873, 396)
+    assert project(0.0, 0.0) == pytest.approx((0.5, 0.5))
+    # 극지방/날짜변경선은 0~1 범위로 잘린다
+    mx, my = project(90.0, 180.0)
+    assert 0.0 <= mx < 1.0 and 0.0 <= my < 1.0
+
+
+@pytest.mark.parametrize("z", [10, 13, 15])
+def test_clusters_sum_points_in_tile(layer, z):
+    tiles = {}
+    for p in layer.points:
+        tiles.setdefault(tile_of(p.latitude, p.longitude, z), []).append(p)
+
+    for (x, y), members in tiles.items():
+        clusters = layer.clusters(z, x, y)
+        assert 0 < len(clusters) <= 64
+        assert sum(c.count for c in clusters) == sum(p.count for p in members)
+        for c in clusters:
+            assert tile_of(c.latitude, c.longitude, z) == (x, y)
+
+    assert layer.clusters(z, 0, 0) == []
+
+
+@pytest.mark.parametrize("z", [RAW_POINT_MIN_ZOOM, RAW_POINT_MIN_ZOOM + 2])
+def test_raw_points_are_exactly_the_tile_members(layer, z):
+    tiles = {}
+    for p in layer.points:
+        tiles.setdefault(tile_of(p.latitude, p.longitude, z), []).append(p.id)
+
+    for (x, y), ids in list(tiles.items())[:200]:
+        assert sorted(p.id for p in layer.raw_points(z, x, y)) == sorted(ids)
+
+
+def test_zero_weight_cell_uses_plain_centroid():
+    lat, lon = 37.5, 127.0
+    points = [
+        TilePoint("a", None, lat, lon, 0, *project(lat, lon)),
+        TilePoint("b", None, lat + 1e-6, lon + 1e-6, 0, *project(lat + 1e-6, lon + 1e-6)),
+    ]
+    x, y = tile_of(lat, lon, 12)
+
+    (cluster,) = TileLayer(points).clusters(12, x, y)
+
+    assert cluster.count == 0
+    assert cluster.latitude == pytest.approx(lat + 5e-7)
+    assert not math.isnan(cluster.longitude)
+
+
+@pytest.fixture
+def slow_load(monkeypatch):
+    """_load_layer 대역: release가 set될 때까지 막고 호출을 기록"""
+    release = threading.Event()
+    calls = []
+
+    def load(layer):
+        calls.append(layer)
+        release.wait(5)
+        if layer == "park":
+            raise RuntimeError("db down")
+        return TileLayer([])
+
+    monkeypatch.setattr(tile_index, "_load_layer", load)
+    monkeypatch.setattr(tile_index, "_layers", {})
+    return release, calls
+
+
+def _expire(layer):
+    built_at, tile_layer = tile_index._layers[layer]
+    tile_index._layers[layer] = (built_at - tile_index.settings.TILE_CACHE_TTL - 1, tile_layer)
+    return tile_layer
+
+
+def _wait_for_reload(layer):
+    tile_index._load_locks[layer].acquire(timeout=5)
+    tile_index._load_locks[layer].release()
+
+
+def test_expired_layer_is_served_while_one_reload_runs(slow_load):
+    release, calls = slow_load
+    release.set()
+    tile_index.get_tile_layer("school")
+    release.clear()
+    stale = _expire("school")
+
+    # 재로딩이 끝나지 않았어도 이전 레이어를 바로 반환하고, 다른 레이어 로딩도 막히지 않는다
+    assert [tile_index.get_tile_layer("school") for _ in range(5)] == [stale] * 5
+    deadline = time.monotonic() + 5
+    while len(calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert calls == ["school", "school"]
+
+    release.set()
+    assert tile_index.get_tile_layer("cctv") is not stale
+    _wait_for_reload("school")
+    assert tile_index.get_tile_layer("school") is not stale
+
+
+def test_failed_reload_keeps_previous_layer(monkeypatch, slow_load):
+    release, calls = slow_load
+    release.set()
+    stale = TileLayer([])
+    tile_index._layers["park"] = (time.monotonic() - tile_index.settings.TILE_CACHE_TTL - 1, stale)
+
+    assert tile_index.get_tile_layer("park") is stale
+    _wait_for_reload("park")
+
+    assert tile_index.get_tile_layer("park") is stale
+    assert calls == ["park"]